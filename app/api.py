@@ -0,0 +1,93 @@
+import re
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse, Response, StreamingResponse
+from starlette.routing import Route
+
+from app.services.auth import SESSION_COOKIE, get_auth_service
+from app.services.form_repository import get_form_repository
+from app.services.metrics import registry
+from app.services.submission_export import gzip_chunks, iter_csv, iter_ndjson
+
+EXPORT_FORMATS = {
+    "csv": (iter_csv, "text/csv; charset=utf-8"),
+    "ndjson": (iter_ndjson, "application/x-ndjson"),
+}
+
+
+async def export_submissions(request: Request):
+    """Stream every submission of a form as CSV or NDJSON, optionally gzipped.
+
+    Only the signed-in owner of the form may export it; the session comes from
+    the same cookie the app uses, never from the URL.
+    """
+    export_format = request.path_params["format"]
+    if export_format not in EXPORT_FORMATS:
+        return PlainTextResponse("Unsupported export format.", status_code=404)
+    user = get_auth_service().validate_session(
+        request.cookies.get(SESSION_COOKIE, "")
+    )
+    if user is None:
+        return PlainTextResponse("Sign in to export submissions.", status_code=401)
+    form = get_form_repository().get(request.path_params["form_id"], user.id)
+    if form is None:
+        return PlainTextResponse("Form not found.", status_code=404)
+
+    iter_rows, media_type = EXPORT_FORMATS[export_format]
+    filename = re.sub(r"[^A-Za-z0-9_-]+", "-", form.title).strip("-") or form.id
+    headers = {
+        "Content-Disposition": f'attachment; filename="{filename}.{export_format}"'
+    }
+    body = iter_rows(form)
+    if request.query_params.get("gzip") in ("1", "true"):
+        body = gzip_chunks(body)
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(body, media_type=media_type, headers=headers)
+
+
+def _etag_matches(etag: str, if_none_match: str) -> bool:
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag in tags or "*" in tags
+
+
+async def published_form(request: Request):
+    """Serve a published form's snapshot, revalidated with its ETag."""
+    version = request.query_params.get("version")
+    if version is not None and not version.isdigit():
+        return PlainTextResponse("Invalid version.", status_code=400)
+    snapshot = get_form_repository().get_snapshot(
+        request.path_params["form_id"], int(version) if version else None
+    )
+    if snapshot is None:
+        return PlainTextResponse("Form not found.", status_code=404)
+    headers = {
+        "ETag": snapshot.etag,
+        # A pinned version never changes; the current one can be republished.
+        "Cache-Control": (
+            "public, max-age=31536000, immutable" if version else "public, no-cache"
+        ),
+    }
+    if _etag_matches(snapshot.etag, request.headers.get("if-none-match", "")):
+        return Response(status_code=304, headers=headers)
+    return Response(snapshot.body, media_type="application/json", headers=headers)
+
+
+async def metrics(request: Request):
+    """Expose handler timings, payload sizes and service gauges to Prometheus."""
+    return PlainTextResponse(
+        registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
+api = Starlette(
+    routes=[
+        Route(
+            "/api/forms/{form_id}/submissions.{format}",
+            export_submissions,
+            methods=["GET"],
+        ),
+        Route("/api/forms/{form_id}/published", published_form, methods=["GET"]),
+        Route("/metrics", metrics, methods=["GET"]),
+    ]
+)
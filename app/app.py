@@ -1,9 +1,18 @@
 import reflex as rx
-from app.states.state import AppState, FormEditorState, FormViewState
+from app.states.state import (
+    SUBMISSION_TOKEN_FIELD,
+    AppState,
+    FormEditorState,
+    FormViewState,
+)
 from app.states.auth_state import AuthState
+from app.states.results_state import ResultsState
 from app.components.sidebar import editor_sidebar
-from app.models import Form as FormModel
+from app.models import FormSummary
 from app.components.auth import login_form, registration_form
+from app.components.results import completion_table, distribution_card
+from app.api import api
+from app.instrumentation import EventMetricsMiddleware
 
 
 def landing_page() -> rx.Component:
@@ -53,21 +62,27 @@ def registration_page() -> rx.Component:
     )
 
 
-def form_card(form: FormModel) -> rx.Component:
+def form_card(form: FormSummary) -> rx.Component:
     """A card to display a summary of a form on the dashboard."""
     return rx.el.div(
+        rx.el.input(
+            type="checkbox",
+            checked=AppState.selected_form_ids.contains(form.id),
+            on_change=lambda _: AppState.toggle_form_selection(form.id),
+            class_name="h-4 w-4 mr-4 text-purple-600 border-gray-300 rounded focus:ring-purple-500",
+        ),
         rx.el.div(
             rx.el.h3(form.title, class_name="font-bold text-lg text-gray-800"),
             rx.el.p(
-                f"{form.fields.length()} fields",
+                f"{form.field_count} fields · {form.submission_count} responses",
                 class_name="text-sm text-gray-500 mt-1",
             ),
             class_name="flex-grow",
         ),
         rx.el.div(
-            rx.el.a(
+            rx.el.button(
                 rx.icon("copy", size=18, class_name="text-gray-500"),
-                href=f"/editor/{form.id}",
+                on_click=lambda: AppState.duplicate_forms([form.id]),
                 class_name="p-2 rounded-md hover:bg-gray-200",
             ),
             rx.el.a(
@@ -76,6 +91,22 @@ def form_card(form: FormModel) -> rx.Component:
                 target="_blank",
                 class_name="p-2 rounded-md hover:bg-gray-200",
             ),
+            rx.el.a(
+                rx.icon("bar-chart-3", size=18, class_name="text-gray-500"),
+                href=f"/results/{form.id}",
+                class_name="p-2 rounded-md hover:bg-gray-200",
+            ),
+            rx.el.button(
+                rx.icon("cloud-upload", size=18, class_name="text-gray-500"),
+                on_click=lambda: AppState.export_to_airtable(form.id),
+                title="Export to Airtable",
+                class_name="p-2 rounded-md hover:bg-gray-200",
+            ),
+            rx.el.a(
+                rx.icon("download", size=18, class_name="text-gray-500"),
+                href=f"{rx.config.get_config().api_url}/api/forms/{form.id}/submissions.csv?gzip=1",
+                class_name="p-2 rounded-md hover:bg-gray-200",
+            ),
             rx.el.button(
                 rx.icon("trash-2", size=18, class_name="text-red-500"),
                 on_click=lambda: AppState.delete_form(form.id),
@@ -87,6 +118,80 @@ def form_card(form: FormModel) -> rx.Component:
     )
 
 
+def bulk_actions_bar() -> rx.Component:
+    """Actions for the forms ticked on the dashboard."""
+    return rx.el.div(
+        rx.el.span(
+            f"{AppState.selected_form_ids.length()} selected",
+            class_name="text-sm font-medium text-purple-800",
+        ),
+        rx.el.div(
+            rx.el.button(
+                "Duplicate",
+                on_click=AppState.duplicate_forms(AppState.selected_form_ids),
+                class_name="px-3 py-1 bg-white border border-gray-300 rounded-md text-sm hover:bg-gray-100",
+            ),
+            rx.el.button(
+                "Delete",
+                on_click=AppState.delete_forms(AppState.selected_form_ids),
+                class_name="px-3 py-1 bg-red-500 text-white rounded-md text-sm hover:bg-red-600",
+            ),
+            rx.el.button(
+                "Clear",
+                on_click=AppState.clear_selection,
+                class_name="px-3 py-1 text-sm text-gray-600 hover:underline",
+            ),
+            class_name="flex items-center gap-2",
+        ),
+        class_name="flex justify-between items-center p-3 mb-4 bg-purple-50 border border-purple-200 rounded-lg",
+    )
+
+
+def import_forms_button() -> rx.Component:
+    """Uploads a JSON bundle of forms, showing progress while it is validated."""
+    return rx.cond(
+        AppState.import_total > 0,
+        rx.el.span(
+            f"Importing {AppState.import_progress} / {AppState.import_total}...",
+            class_name="text-sm text-gray-600",
+        ),
+        rx.upload.root(
+            rx.el.button(
+                "Import",
+                class_name="px-4 py-2 bg-white border border-gray-300 font-semibold rounded-lg shadow-md hover:bg-gray-100",
+            ),
+            id="import_forms",
+            accept={"application/json": [".json"]},
+            max_files=1,
+            multiple=False,
+            no_drag=True,
+            on_drop=AppState.import_forms(rx.upload_files(upload_id="import_forms")),
+        ),
+    )
+
+
+def dashboard_pagination() -> rx.Component:
+    """Previous/next controls for the dashboard's pages of forms."""
+    return rx.el.div(
+        rx.el.button(
+            "Previous",
+            on_click=AppState.previous_page,
+            disabled=AppState.page_number <= 1,
+            class_name="px-4 py-2 bg-white border border-gray-300 rounded-lg text-sm disabled:opacity-50",
+        ),
+        rx.el.span(
+            f"Page {AppState.page_number}", class_name="text-sm text-gray-600"
+        ),
+        rx.el.button(
+            "Next",
+            on_click=AppState.next_page,
+            disabled=~AppState.has_next_page,
+            class_name="px-4 py-2 bg-white border border-gray-300 rounded-lg text-sm disabled:opacity-50",
+        ),
+        class_name="flex items-center justify-center gap-4 mt-8",
+    )
+
+
 def dashboard_page() -> rx.Component:
     """The main dashboard page listing all created forms."""
     return rx.el.div(
@@ -99,6 +204,7 @@ def dashboard_page() -> rx.Component:
                         on_click=AppState.create_new_form,
                         class_name="px-4 py-2 bg-purple-600 text-white font-semibold rounded-lg shadow-md hover:bg-purple-700 focus:outline-none focus:ring-2 focus:ring-purple-500 focus:ring-opacity-75",
                     ),
+                    import_forms_button(),
                     rx.el.button(
                         "Sign Out",
                         on_click=AuthState.logout,
@@ -112,15 +218,49 @@ def dashboard_page() -> rx.Component:
         ),
         rx.el.main(
             rx.el.div(
+                rx.el.div(
+                    rx.debounce_input(
+                        rx.el.input(
+                            placeholder="Search forms...",
+                            value=AppState.search_query,
+                            on_change=AppState.search,
+                            class_name="w-full max-w-md p-2 border border-gray-300 rounded-md bg-white text-sm",
+                        ),
+                        debounce_timeout=150,
+                    ),
+                    rx.el.select(
+                        rx.el.option("Last updated", value="updated"),
+                        rx.el.option("Newest", value="created"),
+                        rx.el.option("Title", value="title"),
+                        value=AppState.sort_by,
+                        on_change=AppState.set_sort,
+                        class_name="p-2 border border-gray-300 rounded-md bg-white text-sm",
+                    ),
+                    class_name="flex justify-between items-center gap-4 mb-4",
+                ),
                 rx.cond(
-                    AppState.forms.length() > 0,
+                    AppState.selected_form_ids.length() > 0, bulk_actions_bar()
+                ),
+                rx.cond(
+                    AppState.summaries.length() > 0,
                     rx.el.div(
-                        rx.foreach(AppState.forms, form_card),
-                        class_name="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6",
+                        rx.el.div(
+                            rx.foreach(AppState.summaries, form_card),
+                            class_name="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6",
+                        ),
+                        rx.cond(
+                            AppState.search_query,
+                            rx.fragment(),
+                            dashboard_pagination(),
+                        ),
                     ),
                     rx.el.div(
                         rx.el.h2(
-                            "No forms yet!",
+                            rx.cond(
+                                AppState.search_query,
+                                "No forms match your search.",
+                                "No forms yet!",
+                            ),
                             class_name="text-xl font-semibold text-gray-700",
                         ),
                         rx.el.p(
@@ -139,13 +279,14 @@ def dashboard_page() -> rx.Component:
 
 
 from app.components.editor import form_canvas, properties_editor
+from app.components.form_view import published_field
 
 
 def editor_page() -> rx.Component:
     """The page for editing a specific form."""
     return rx.el.div(
         rx.cond(
-            FormEditorState.form,
+            FormEditorState.loaded_form_id,
             rx.el.div(
                 editor_sidebar(),
                 form_canvas(),
@@ -174,7 +315,15 @@ def view_form_page() -> rx.Component:
                     FormViewState.form.description, class_name="text-gray-600 mb-8"
                 ),
                 rx.el.form(
-                    rx.el.div("Form fields here", class_name="space-y-4"),
+                    rx.el.input(
+                        type="hidden",
+                        name=SUBMISSION_TOKEN_FIELD,
+                        value=FormViewState.submission_token,
+                    ),
+                    rx.el.div(
+                        rx.foreach(FormViewState.form.fields, published_field),
+                        class_name="space-y-4",
+                    ),
                     rx.el.button(
                         "Submit",
                         type="submit",
@@ -192,7 +341,53 @@ def view_form_page() -> rx.Component:
     )
 
 
+def results_page() -> rx.Component:
+    """The page summarising the responses to a form."""
+    return rx.el.div(
+        rx.el.header(
+            rx.el.div(
+                rx.el.div(
+                    rx.el.h1(
+                        ResultsState.form_title,
+                        class_name="text-3xl font-bold text-gray-900",
+                    ),
+                    rx.el.p(
+                        f"{ResultsState.total_responses} responses",
+                        class_name="text-sm text-gray-500 mt-1",
+                    ),
+                ),
+                rx.el.a(
+                    "Back to Dashboard",
+                    href="/dashboard",
+                    class_name="px-4 py-2 bg-gray-200 text-gray-800 font-semibold rounded-lg shadow-md hover:bg-gray-300",
+                ),
+                class_name="container mx-auto flex justify-between items-center",
+            ),
+            class_name="bg-white border-b border-gray-200 p-4",
+        ),
+        rx.el.main(
+            rx.el.div(
+                rx.el.div(
+                    rx.foreach(ResultsState.distributions, distribution_card),
+                    class_name="grid grid-cols-1 md:grid-cols-2 gap-6",
+                ),
+                rx.cond(
+                    ResultsState.completion.length() > 0,
+                    rx.el.div(
+                        completion_table(ResultsState.completion), class_name="mt-6"
+                    ),
+                    rx.el.div(),
+                ),
+                class_name="container mx-auto py-8 px-4",
+            ),
+            class_name="flex-grow bg-gray-50",
+        ),
+        class_name="flex flex-col min-h-screen w-screen bg-gray-50 font-['Inter']",
+    )
+
+
 app = rx.App(
+    api_transformer=api,
     theme=rx.theme(appearance="light", accent_color="purple", radius="medium"),
     head_components=[
         rx.el.link(rel="preconnect", href="https://fonts.googleapis.com"),
@@ -203,13 +398,23 @@ app = rx.App(
         ),
     ],
 )
+app.add_middleware(EventMetricsMiddleware())
 app.add_page(landing_page, route="/")
 app.add_page(login_page, route="/login")
 app.add_page(registration_page, route="/register")
-app.add_page(dashboard_page, route="/dashboard", on_load=AuthState.check_auth)
+app.add_page(
+    dashboard_page,
+    route="/dashboard",
+    on_load=[AuthState.check_auth, AppState.on_load],
+)
 app.add_page(
     editor_page,
     route="/editor/[form_id]",
-    on_load=[FormEditorState.on_load, AuthState.check_auth],
+    on_load=[AuthState.check_auth, FormEditorState.on_load],
+)
+app.add_page(
+    results_page,
+    route="/results/[form_id]",
+    on_load=[AuthState.check_auth, ResultsState.on_load],
 )
 app.add_page(view_form_page, route="/view/[form_id]", on_load=FormViewState.on_load)
\ No newline at end of file
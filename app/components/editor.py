@@ -81,15 +81,54 @@ def render_field(field: FormField) -> rx.Component:
 
 
 def canvas_field_wrapper(field: FormField) -> rx.Component:
-    """A wrapper for a field on the canvas, making it selectable."""
+    """A wrapper for a field on the canvas, making it selectable and draggable."""
     is_selected = FormEditorState.selected_field_id == field.id
-    return rx.el.div(
+    # The selected field is drawn from `selected_field`, which is kept
+    # current while it is edited; the `fields` entry may lag behind.
+    content = rx.cond(
+        is_selected,
+        render_field(FormEditorState.selected_field),
         render_field(field),
-        on_click=lambda: FormEditorState.select_field(field.id),
-        class_name=rx.cond(
-            is_selected,
-            "relative p-4 rounded-lg cursor-pointer border-2 border-purple-500 bg-purple-50",
-            "relative p-4 rounded-lg cursor-pointer border-2 border-transparent hover:border-gray-300",
+    )
+    # Fields are laid out by their order key, so a move only sends the moved key.
+    order_style = {
+        "order": rx.cond(
+            FormEditorState.moved_field_order.contains(field.id),
+            FormEditorState.moved_field_order[field.id],
+            FormEditorState.field_order[field.id],
+        )
+    }
+    return rx.cond(
+        FormEditorState.dragging_field_id,
+        rx.el.div(
+            content,
+            on_mouse_up=lambda: FormEditorState.drop_field(field.id),
+            style=order_style,
+            class_name=rx.cond(
+                FormEditorState.dragging_field_id == field.id,
+                "relative p-4 rounded-lg cursor-grabbing border-2 border-dashed border-purple-400 opacity-50",
+                "relative p-4 rounded-lg cursor-grabbing border-2 border-transparent hover:border-purple-400",
+            ),
+        ),
+        rx.el.div(
+            content,
+            rx.el.div(
+                rx.icon("grip-vertical", size=16),
+                on_mouse_down=[
+                    rx.prevent_default,
+                    FormEditorState.start_drag(field.id),
+                ],
+                on_click=rx.stop_propagation,
+                title="Drag to reorder",
+                class_name="absolute top-2 right-2 p-1 rounded text-gray-400 cursor-grab hover:text-gray-600 hover:bg-gray-100",
+            ),
+            on_click=lambda: FormEditorState.select_field(field.id),
+            style=order_style,
+            class_name=rx.cond(
+                is_selected,
+                "relative p-4 rounded-lg cursor-pointer border-2 border-purple-500 bg-purple-50",
+                "relative p-4 rounded-lg cursor-pointer border-2 border-transparent hover:border-gray-300",
+            ),
         ),
     )
 
@@ -105,7 +144,8 @@ def form_canvas() -> rx.Component:
                     ),
                     placeholder="Form Title",
                     class_name="text-3xl font-bold w-full p-2 rounded-lg hover:bg-gray-100 focus:bg-gray-100 outline-none",
-                    default_value=FormEditorState.form.title,
+                    default_value=FormEditorState.title,
+                    key=f"title-{FormEditorState.history_revision}",
                 ),
                 rx.el.input(
                     on_change=lambda val: FormEditorState.update_form_property(
@@ -113,16 +153,58 @@ def form_canvas() -> rx.Component:
                     ),
                     placeholder="Form Description...",
                     class_name="text-gray-600 w-full mt-2 p-2 rounded-lg hover:bg-gray-100 focus:bg-gray-100 outline-none",
-                    default_value=FormEditorState.form.description,
+                    default_value=FormEditorState.description,
+                    key=f"description-{FormEditorState.history_revision}",
+                ),
+                rx.el.div(
+                    rx.el.p(
+                        rx.cond(
+                            FormEditorState.pending_saves > 0,
+                            "Saving changes...",
+                            "All changes saved",
+                        ),
+                        class_name="text-xs text-gray-400",
+                    ),
+                    rx.el.div(
+                        rx.el.button(
+                            rx.icon("undo-2", size=16),
+                            on_click=FormEditorState.undo,
+                            disabled=~FormEditorState.can_undo,
+                            title="Undo",
+                            class_name="p-2 rounded-md text-gray-600 hover:bg-gray-100 disabled:opacity-40",
+                        ),
+                        rx.el.button(
+                            rx.icon("redo-2", size=16),
+                            on_click=FormEditorState.redo,
+                            disabled=~FormEditorState.can_redo,
+                            title="Redo",
+                            class_name="p-2 rounded-md text-gray-600 hover:bg-gray-100 disabled:opacity-40",
+                        ),
+                        rx.el.button(
+                            "Publish",
+                            on_click=FormEditorState.publish,
+                            class_name="ml-2 px-3 py-1.5 bg-purple-600 text-white text-sm font-semibold rounded-md hover:bg-purple-700",
+                        ),
+                        class_name="flex items-center gap-1",
+                    ),
+                    class_name="mt-2 px-2 flex items-center justify-between",
                 ),
                 class_name="p-6 border-b border-gray-200 bg-white",
             ),
             rx.el.div(
                 rx.cond(
-                    FormEditorState.form.fields.length() > 0,
+                    FormEditorState.fields.length() > 0,
                     rx.el.div(
-                        rx.foreach(FormEditorState.form.fields, canvas_field_wrapper),
-                        class_name="space-y-4",
+                        # Releasing a drag anywhere but on a field cancels it.
+                        rx.cond(
+                            FormEditorState.dragging_field_id,
+                            rx.el.div(
+                                on_mouse_up=FormEditorState.cancel_drag,
+                                class_name="fixed inset-0 cursor-grabbing",
+                            ),
+                        ),
+                        rx.foreach(FormEditorState.fields, canvas_field_wrapper),
+                        class_name="flex flex-col gap-4",
                     ),
                     rx.el.div(
                         rx.icon(
@@ -248,20 +330,67 @@ def selected_field_properties() -> rx.Component:
     )
 
 
+def limit_input(label: str, key: str) -> rx.Component:
+    """A number input for one per-minute submission limit."""
+    return rx.el.div(
+        rx.el.label(
+            label, class_name="block text-xs font-medium text-gray-500 uppercase"
+        ),
+        rx.el.input(
+            type="number",
+            min=1,
+            placeholder="Default",
+            on_change=lambda val: FormEditorState.update_submission_limit(key, val),
+            class_name="mt-1 w-full p-2 border border-gray-300 rounded-md shadow-sm text-sm focus:ring-purple-500 focus:border-purple-500",
+            default_value=rx.cond(
+                getattr(FormEditorState.limits, key),
+                getattr(FormEditorState.limits, key).to_string(),
+                "",
+            ),
+            key=f"{key}-{FormEditorState.history_revision}",
+        ),
+        class_name="w-full",
+    )
+
+
+def submission_limits_editor() -> rx.Component:
+    """Per-form limits on how fast responses are accepted."""
+    return rx.el.div(
+        rx.el.h3("Submission limits", class_name="text-lg font-bold text-gray-800"),
+        rx.el.p(
+            "Responses accepted per minute. Leave empty to use the defaults.",
+            class_name="mt-1 text-sm text-gray-500",
+        ),
+        rx.el.div(
+            limit_input("Per form", "form_per_minute"),
+            limit_input("Per visitor", "client_per_minute"),
+            class_name="mt-4 space-y-4",
+        ),
+        class_name="p-6 border-t border-gray-200",
+    )
+
+
 def properties_editor() -> rx.Component:
     """The right sidebar for editing component properties."""
     return rx.el.aside(
         rx.el.div(
             rx.cond(
                 FormEditorState.selected_field,
-                selected_field_properties(),
+                rx.fragment(
+                    selected_field_properties(),
+                    key=f"{FormEditorState.selected_field_id}-{FormEditorState.history_revision}",
+                ),
                 rx.el.div(
-                    rx.icon("disc_3", size=32, class_name="text-gray-400"),
-                    rx.el.p(
-                        "Select a field to edit its properties.",
-                        class_name="mt-4 text-sm text-gray-500 text-center",
+                    rx.el.div(
+                        rx.icon("disc_3", size=32, class_name="text-gray-400"),
+                        rx.el.p(
+                            "Select a field to edit its properties.",
+                            class_name="mt-4 text-sm text-gray-500 text-center",
+                        ),
+                        class_name="flex flex-col items-center justify-center flex-grow text-center p-4",
                     ),
-                    class_name="flex flex-col items-center justify-center h-full text-center p-4",
+                    submission_limits_editor(),
+                    class_name="flex flex-col h-full",
                 ),
             ),
             class_name="flex-grow overflow-y-auto",
@@ -0,0 +1,110 @@
+import reflex as rx
+from app.models import RenderedField
+from app.states.state import FormViewState
+
+
+def published_field(field: RenderedField) -> rx.Component:
+    """Renders a field of a published form as a fillable input."""
+    base_class = "w-full p-3 border rounded-lg focus:ring-2 focus:ring-purple-500 focus:border-purple-500"
+    common_props = {
+        "name": field.id,
+        "id": field.id,
+        "required": field.required,
+    }
+    field_component = rx.match(
+        field.type,
+        (
+            "text",
+            rx.el.input(
+                type="text",
+                placeholder=field.placeholder,
+                class_name=base_class,
+                **common_props,
+            ),
+        ),
+        (
+            "email",
+            rx.el.input(
+                type="email",
+                placeholder=field.placeholder,
+                class_name=base_class,
+                **common_props,
+            ),
+        ),
+        (
+            "tel",
+            rx.el.input(
+                type="tel",
+                placeholder=field.placeholder,
+                class_name=base_class,
+                **common_props,
+            ),
+        ),
+        (
+            "textarea",
+            rx.el.textarea(
+                placeholder=field.placeholder, class_name=base_class, **common_props
+            ),
+        ),
+        (
+            "select",
+            rx.el.select(
+                rx.el.option("Select an option", value="", disabled=True),
+                rx.foreach(
+                    field.options, lambda opt: rx.el.option(opt.label, value=opt.value)
+                ),
+                default_value="",
+                class_name=base_class,
+                **common_props,
+            ),
+        ),
+        (
+            "checkbox",
+            rx.el.div(
+                rx.el.input(
+                    type="checkbox",
+                    value="true",
+                    class_name="h-4 w-4 text-purple-600 border-gray-300 rounded focus:ring-purple-500",
+                    **common_props,
+                ),
+                class_name="flex items-center h-12",
+            ),
+        ),
+        (
+            "radio",
+            rx.el.div(
+                rx.foreach(
+                    field.options,
+                    lambda opt: rx.el.label(
+                        rx.el.input(
+                            type="radio",
+                            name=field.id,
+                            value=opt.value,
+                            required=field.required,
+                            class_name="h-4 w-4 text-purple-600 border-gray-300 focus:ring-purple-500",
+                        ),
+                        rx.el.span(opt.label, class_name="ml-2 text-gray-700"),
+                        class_name="flex items-center mr-4",
+                    ),
+                ),
+                class_name="flex flex-wrap items-center min-h-12",
+            ),
+        ),
+        rx.el.p(f"Unknown field type: {field.type}"),
+    )
+    return rx.el.div(
+        rx.el.label(
+            field.label,
+            rx.cond(field.required, rx.el.span(" *", class_name="text-red-500"), ""),
+            html_for=field.id,
+            class_name="block text-sm font-medium text-gray-700 mb-1",
+        ),
+        field_component,
+        rx.cond(
+            FormViewState.errors.contains(field.id),
+            rx.el.p(
+                FormViewState.errors[field.id], class_name="mt-1 text-sm text-red-600"
+            ),
+        ),
+        class_name="w-full",
+    )
@@ -0,0 +1,63 @@
+import reflex as rx
+from app.services.analytics import ChoiceCount, ChoiceDistribution, FieldCompletion
+
+
+def choice_row(row: ChoiceCount) -> rx.Component:
+    """A single option with its share of answers."""
+    return rx.el.div(
+        rx.el.div(
+            rx.el.span(row.label, class_name="text-sm text-gray-700"),
+            rx.el.span(
+                f"{row.count} ({row.percent}%)", class_name="text-sm text-gray-500"
+            ),
+            class_name="flex justify-between",
+        ),
+        rx.el.div(
+            rx.el.div(
+                class_name="h-2 bg-purple-500 rounded-full",
+                style={"width": f"{row.percent}%"},
+            ),
+            class_name="mt-1 h-2 w-full bg-gray-100 rounded-full",
+        ),
+    )
+
+
+def distribution_card(distribution: ChoiceDistribution) -> rx.Component:
+    """A card showing how answers to one choice field are distributed."""
+    return rx.el.div(
+        rx.el.h3(distribution.label, class_name="font-bold text-gray-800"),
+        rx.el.p(
+            f"{distribution.answered} answers", class_name="text-xs text-gray-500 mt-1"
+        ),
+        rx.el.div(
+            rx.foreach(distribution.rows, choice_row),
+            class_name="mt-4 space-y-3",
+        ),
+        class_name="p-6 bg-white border border-gray-200 rounded-xl shadow-sm",
+    )
+
+
+def completion_row(completion: FieldCompletion) -> rx.Component:
+    """Completion rate for one optional field."""
+    return rx.el.tr(
+        rx.el.td(completion.label, class_name="py-2 text-sm text-gray-700"),
+        rx.el.td(
+            completion.answered, class_name="py-2 text-sm text-gray-500 text-right"
+        ),
+        rx.el.td(
+            f"{completion.rate}%",
+            class_name="py-2 text-sm font-semibold text-gray-800 text-right",
+        ),
+    )
+
+
+def completion_table(completion: list[FieldCompletion]) -> rx.Component:
+    """Completion rates for the form's optional fields."""
+    return rx.el.div(
+        rx.el.h3("Optional field completion", class_name="font-bold text-gray-800"),
+        rx.el.table(
+            rx.el.tbody(rx.foreach(completion, completion_row)),
+            class_name="mt-4 w-full",
+        ),
+        class_name="p-6 bg-white border border-gray-200 rounded-xl shadow-sm",
+    )
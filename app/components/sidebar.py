@@ -19,11 +19,11 @@ def editor_sidebar() -> rx.Component:
     """The left sidebar component for the form editor."""
     return rx.el.aside(
         rx.el.div(
-            rx.el.a(
+            rx.el.button(
                 rx.icon("arrow-left", size=16, class_name="mr-2"),
                 "Back to Dashboard",
-                href="/",
-                class_name="flex items-center p-4 border-b border-gray-200 text-sm font-medium text-gray-600 hover:bg-gray-100",
+                on_click=FormEditorState.leave_editor("/"),
+                class_name="w-full flex items-center p-4 border-b border-gray-200 text-sm font-medium text-gray-600 hover:bg-gray-100",
             ),
             rx.el.div(
                 rx.el.h2(
@@ -0,0 +1,221 @@
+import contextvars
+import os
+import sys
+import time
+from typing import Callable
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+import reflex as rx
+from reflex.event import Event
+from reflex.middleware import Middleware
+from reflex.state import BaseState, StateUpdate
+from reflex.utils.format import json_dumps
+
+from app.services.dedup import submission_dedup
+from app.services.delivery_queue import get_delivery_queue
+from app.services.export_sinks import all_sink_metrics
+from app.services.form_repository import get_form_repository
+from app.services.metrics import MetricsRegistry, registry
+from app.services.rate_limit import submission_limiter
+from app.services.validation import validator_cache
+from app.states.state import AppState, FormEditorState
+
+# Per state class: var label -> function returning that var's serialized size.
+STATE_SIZE_PROBES: dict[type[rx.State], dict[str, Callable[[rx.State], int]]] = {
+    AppState: {"forms_json": lambda state: len(state.forms_json.encode())},
+    FormEditorState: {
+        "form": lambda state: len(state._form.model_dump_json()) if state._form else 0,
+        "history": lambda state: state._history.memory_bytes if state._history else 0,
+    },
+}
+
+_event_started_at: contextvars.ContextVar[float | None] = contextvars.ContextVar(
+    "event_started_at", default=None
+)
+
+
+class EventMetricsMiddleware(Middleware):
+    """Records handler latency, delta sizes and large state vars for sampled events.
+
+    Unsampled events cost one random draw in `preprocess` and one context var
+    lookup per update in `postprocess`.
+    """
+
+    def __init__(self, metrics: MetricsRegistry = registry):
+        self.metrics = metrics
+        self._handler_names: dict[str, tuple[str, type[BaseState] | None]] = {}
+
+    def _resolve(self, state: BaseState, event_name: str):
+        resolved = self._handler_names.get(event_name)
+        if resolved is None:
+            state_path, _, handler = event_name.rpartition(".")
+            try:
+                state_cls = type(state).get_class_substate(state_path)
+            except ValueError:
+                state_cls = None
+            if state_cls is None or handler not in state_cls.event_handlers:
+                # Event names come from the client; keep label cardinality bounded.
+                return "unknown", None
+            label = f"{state_cls.__name__}.{handler}"
+            resolved = self._handler_names[event_name] = (label, state_cls)
+        return resolved
+
+    async def preprocess(
+        self, app: rx.App, state: BaseState, event: Event
+    ) -> StateUpdate | None:
+        _event_started_at.set(time.perf_counter() if self.metrics.sampled() else None)
+        return None
+
+    async def postprocess(
+        self, app: rx.App, state: BaseState, event: Event, update: StateUpdate
+    ) -> StateUpdate:
+        started_at = _event_started_at.get()
+        if started_at is None:
+            return update
+        handler, state_cls = self._resolve(state, event.name)
+        if update.delta:
+            self.metrics.observe(
+                "forms_event_delta_bytes",
+                len(json_dumps(update.delta).encode()),
+                handler=handler,
+            )
+        if not update.final:
+            return update
+        _event_started_at.set(None)
+        self.metrics.observe(
+            "forms_event_handler_seconds",
+            time.perf_counter() - started_at,
+            handler=handler,
+        )
+        probes = STATE_SIZE_PROBES.get(state_cls)
+        if probes:
+            substate = state.get_substate(state_cls.get_full_name().split(".")[1:])
+            for var, probe in probes.items():
+                self.metrics.observe(
+                    "forms_state_var_bytes",
+                    probe(substate),
+                    var=f"{state_cls.__name__}.{var}",
+                )
+        return update
+
+
+def _resident_bytes() -> int | None:
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        return None
+
+
+# Service statistics that only ever go up, exported as `_total` counters;
+# every other statistic is a gauge (depths, sizes, keys, work in flight).
+COUNTER_STATS = frozenset(
+    {
+        "processed",
+        "retried",
+        "dead_lettered",
+        "rejected",
+        "parses",
+        "hits",
+        "builds",
+        "duplicates",
+        "evicted",
+        "allowed",
+        "shed",
+        "records_exported",
+        "batches_sent",
+        "retries",
+        "records_dropped",
+    }
+)
+
+
+def _stat_samples(
+    prefix: str,
+    help_text: str,
+    stats: dict[str, float],
+    labels: dict[str, str] | None = None,
+):
+    for key, value in stats.items():
+        # The limiter reports its form and client buckets under these prefixes.
+        stat = key.removeprefix("form_").removeprefix("client_")
+        if stat in COUNTER_STATS:
+            yield f"{prefix}_{key}_total", help_text, "counter", labels or {}, value
+        else:
+            yield f"{prefix}_{key}", help_text, "gauge", labels or {}, value
+
+
+def _process_gauges():
+    resident = _resident_bytes()
+    if resident is not None:
+        yield (
+            "process_resident_memory_bytes",
+            "Resident memory size in bytes.",
+            "gauge",
+            {},
+            resident,
+        )
+    if resource is None:
+        return
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    yield (
+        "process_max_resident_memory_bytes",
+        "Peak resident memory size in bytes.",
+        "gauge",
+        {},
+        peak if sys.platform == "darwin" else peak * 1024,
+    )
+
+
+def _service_metrics():
+    yield from _stat_samples(
+        "forms_delivery_queue",
+        "Submission delivery queue statistic.",
+        get_delivery_queue().stats(),
+    )
+    repository = get_form_repository()
+    parse_cache = getattr(repository, "parse_cache", None)
+    if parse_cache is not None:
+        yield from _stat_samples(
+            "forms_parse_cache", "Form parse cache statistic.", parse_cache.stats()
+        )
+    snapshots = getattr(repository, "snapshots", None)
+    if snapshots is not None:
+        yield from _stat_samples(
+            "forms_published_snapshots",
+            "Published form snapshot cache statistic.",
+            snapshots.stats(),
+        )
+    yield from _stat_samples(
+        "forms_submission_dedup",
+        "Submission idempotency cache statistic.",
+        submission_dedup.stats(),
+    )
+    yield from _stat_samples(
+        "forms_submission_limiter",
+        "Submission rate limiter and concurrency cap statistic.",
+        submission_limiter.stats(),
+    )
+    for sink, metrics in all_sink_metrics().items():
+        yield from _stat_samples(
+            "forms_export",
+            "Submission export sink statistic.",
+            metrics.snapshot(),
+            {"sink": sink},
+        )
+    yield (
+        "forms_validator_cache_compiles_total",
+        "Submission validators compiled.",
+        "counter",
+        {},
+        validator_cache.compiles,
+    )
+
+
+registry.add_collector(_process_gauges)
+registry.add_collector(_service_metrics)
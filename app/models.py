@@ -1,7 +1,7 @@
 import reflex as rx
-from typing import Literal, Union, Optional
+from typing import Annotated, Any, Literal, Union, Optional
 import uuid
-from pydantic import BaseModel, Field as PydanticField
+from pydantic import BaseModel, Field as PydanticField, PrivateAttr
 
 
 def generate_uuid_str() -> str:
@@ -11,12 +11,24 @@ def generate_uuid_str() -> str:
 
 FieldType = Literal["text", "email", "tel", "textarea", "select", "checkbox", "radio"]
 
+# Spacing of freshly assigned field order keys. A move takes the midpoint of
+# its new neighbours' keys, so about 16 moves can land in the same gap before
+# the keys need respacing.
+ORDER_KEY_GAP = 2**16
+# Respace once any gap is narrower than this, or a key drifts past the
+# limit (keys are used as CSS `order` values, which are 32-bit integers).
+ORDER_KEY_MIN_GAP = 2**6
+ORDER_KEY_LIMIT = 2**30
+
 
 class BaseField(BaseModel):
     id: str = PydanticField(default_factory=generate_uuid_str)
     type: FieldType
     label: str = "New Field"
     required: bool = False
+    # Sort key among the form's fields, kept increasing along `Form.fields`.
+    # It is derived from the list order, so `Form` may rewrite it in place.
+    order: int = 0
 
 
 class TextField(BaseField):
@@ -74,10 +86,202 @@ FormField = Union[
     CheckboxField,
     RadioField,
 ]
+# Tagged by `type`, so validation dispatches straight to one model instead of
+# trying each in turn. Reflex cannot type state vars with `Annotated`, so
+# states and components keep using `FormField`.
+TaggedFormField = Annotated[FormField, PydanticField(discriminator="type")]
+
+
+class SubmissionLimits(BaseModel):
+    """Per-form submission rate limits; None keeps the app-wide default."""
+
+    form_per_minute: int | None = None
+    client_per_minute: int | None = None
 
 
 class Form(BaseModel):
     id: str = PydanticField(default_factory=generate_uuid_str)
     title: str = "My Custom Form"
     description: str = "This is a form that can be customized."
-    fields: list[FormField] = []
\ No newline at end of file
+    fields: list[TaggedFormField] = []
+    limits: SubmissionLimits = SubmissionLimits()
+    # Storage revision the form was loaded at; assigned by the form repository.
+    version: int = 0
+    _field_positions: dict[str, int] = PrivateAttr(default_factory=dict)
+
+    def with_fresh_ids(self, **updates: Any) -> "Form":
+        """Return a deep copy under a new form id, with new ids for every field."""
+        form = self.model_copy(
+            deep=True, update={"id": generate_uuid_str(), "version": 0, **updates}
+        )
+        for field in form.fields:
+            field.id = generate_uuid_str()
+        form._reindex_fields()
+        return form
+
+    def _reindex_fields(self, start: int = 0):
+        if start == 0:
+            self._field_positions = {}
+        for position in range(start, len(self.fields)):
+            self._field_positions[self.fields[position].id] = position
+
+    def field_position(self, field_id: str) -> int | None:
+        """Return the index of a field in `fields`, or None if it is absent."""
+        position = self._field_positions.get(field_id)
+        if (
+            position is None
+            or position >= len(self.fields)
+            or self.fields[position].id != field_id
+        ):
+            # The index is stale, e.g. `fields` was replaced wholesale.
+            self._reindex_fields()
+            position = self._field_positions.get(field_id)
+        return position
+
+    def get_field(self, field_id: str) -> FormField | None:
+        position = self.field_position(field_id)
+        return None if position is None else self.fields[position]
+
+    def add_field(self, field: FormField):
+        field.order = (self.fields[-1].order if self.fields else 0) + ORDER_KEY_GAP
+        self.fields.append(field)
+        self._field_positions[field.id] = len(self.fields) - 1
+
+    def remove_field(self, field_id: str) -> FormField | None:
+        position = self.field_position(field_id)
+        if position is None:
+            return None
+        field = self.fields.pop(position)
+        del self._field_positions[field_id]
+        self._reindex_fields(position)
+        return field
+
+    def move_field(self, field_id: str, new_position: int) -> bool:
+        """Move a field, re-keying only it unless its new neighbours leave no room."""
+        position = self.field_position(field_id)
+        if position is None:
+            return False
+        new_position = max(0, min(new_position, len(self.fields) - 1))
+        if new_position == position:
+            return False
+        field = self.fields.pop(position)
+        self.fields.insert(new_position, field)
+        self._reindex_fields(min(position, new_position))
+        before = self.fields[new_position - 1].order if new_position > 0 else None
+        after = (
+            self.fields[new_position + 1].order
+            if new_position + 1 < len(self.fields)
+            else None
+        )
+        if before is None:
+            field.order = after - ORDER_KEY_GAP
+        elif after is None:
+            field.order = before + ORDER_KEY_GAP
+        else:
+            field.order = (before + after) // 2
+        # Keys were increasing before the move, so only the new neighbours can
+        # be out of order; with no room between them, respace them all.
+        if (before is not None and before >= field.order) or (
+            after is not None and field.order >= after
+        ):
+            self.rebalance_order_keys()
+        return True
+
+    def order_keys_valid(self) -> bool:
+        """Whether field order keys increase strictly along `fields`."""
+        return all(
+            earlier.order < later.order
+            for earlier, later in zip(self.fields, self.fields[1:])
+        )
+
+    def order_keys_crowded(self) -> bool:
+        """Whether some order keys are close enough together to need respacing."""
+        if not self.fields:
+            return False
+        first, last = self.fields[0].order, self.fields[-1].order
+        return max(abs(first), abs(last)) > ORDER_KEY_LIMIT or any(
+            later.order - earlier.order < ORDER_KEY_MIN_GAP
+            for earlier, later in zip(self.fields, self.fields[1:])
+        )
+
+    def rebalance_order_keys(self):
+        """Respace every field's order key evenly, keeping the list order."""
+        for position, field in enumerate(self.fields, 1):
+            field.order = position * ORDER_KEY_GAP
+
+
+class RenderedField(BaseModel):
+    """A field as the public form page draws it, with one shape for every type."""
+
+    id: str
+    type: FieldType
+    label: str = ""
+    required: bool = False
+    placeholder: str = ""
+    options: list[Option] = []
+
+
+class PublishedForm(BaseModel):
+    """What the public page renders for one published version of a form."""
+
+    id: str
+    version: int = 0
+    title: str = ""
+    description: str = ""
+    fields: list[RenderedField] = []
+
+    @classmethod
+    def from_form(cls, form: Form) -> "PublishedForm":
+        return cls(
+            id=form.id,
+            version=form.version,
+            title=form.title,
+            description=form.description,
+            fields=[
+                RenderedField(
+                    id=field.id,
+                    type=field.type,
+                    label=field.label,
+                    required=field.required,
+                    placeholder=getattr(field, "placeholder", ""),
+                    options=getattr(field, "options", []),
+                )
+                for field in form.fields
+            ],
+        )
+
+
+class Submission(BaseModel):
+    id: str = PydanticField(default_factory=generate_uuid_str)
+    form_id: str
+    data: dict[str, Any] = {}
+    created_at: float = 0.0
+    seq: int = 0
+
+
+class SubmissionPage(BaseModel):
+    items: list[Submission] = []
+    next_cursor: str | None = None
+
+
+
+class FormSummary(BaseModel):
+    """What the dashboard shows for a form, without its field definitions."""
+
+    id: str
+    title: str = ""
+    field_count: int = 0
+    created_at: float = 0.0
+    updated_at: float = 0.0
+    submission_count: int = 0
+
+
+class FormSummaryPage(BaseModel):
+    items: list[FormSummary] = []
+    next_cursor: str | None = None
+
+
+class User(BaseModel):
+    id: str = PydanticField(default_factory=generate_uuid_str)
+    email: str
+    created_at: float = 0.0
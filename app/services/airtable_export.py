@@ -0,0 +1,171 @@
+import asyncio
+import os
+import random
+import time
+from collections import deque
+from typing import Any
+
+import requests
+from pyairtable import Api
+
+from app.models import Form, Submission
+from app.services.export_checkpoints import ExportCheckpointStore
+from app.services.export_sinks import (
+    SUBMISSION_ID_COLUMN,
+    ExportMetrics,
+    column_headers,
+    sink_metrics,
+    submission_values,
+)
+from app.services.submission_store import SubmissionStore, get_submission_store
+
+AIRTABLE_ENDPOINT_URL = os.environ.get(
+    "AIRTABLE_ENDPOINT_URL", "https://api.airtable.com"
+)
+# Airtable rejects create/update requests carrying more than 10 records.
+AIRTABLE_MAX_RECORDS_PER_REQUEST = 10
+
+
+class AirtableExportSink:
+    """Streams a form's stored submissions into an Airtable table.
+
+    Records are upserted on the submission id and the read position is
+    checkpointed after every batch, so a restarted export resumes where it
+    stopped and never creates duplicate rows.
+    """
+
+    def __init__(
+        self,
+        form: Form,
+        base_id: str,
+        table_name: str,
+        api_key: str,
+        *,
+        endpoint_url: str = AIRTABLE_ENDPOINT_URL,
+        store: SubmissionStore | None = None,
+        checkpoints: ExportCheckpointStore | None = None,
+        max_in_flight: int = 4,
+        max_retries: int = 8,
+        backoff_base: float = 1.0,
+        backoff_max: float = 30.0,
+        page_size: int = 500,
+        metrics: ExportMetrics | None = None,
+    ):
+        self.form = form
+        self.columns = column_headers(form)
+        # Retries are handled here so that they show up in the metrics.
+        self.table = Api(
+            api_key, endpoint_url=endpoint_url, retry_strategy=False
+        ).table(base_id, table_name)
+        self.store = store or get_submission_store()
+        self.checkpoints = checkpoints or ExportCheckpointStore()
+        self.checkpoint_key = f"airtable:{base_id}:{table_name}"
+        self.max_in_flight = max_in_flight
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.page_size = page_size
+        # Shared by every Airtable export unless given, and served on /metrics.
+        self.metrics = metrics or sink_metrics("airtable")
+        self.records_exported = 0
+
+    @classmethod
+    def from_env(cls, form: Form, **kwargs: Any) -> "AirtableExportSink | None":
+        """Build a sink from AIRTABLE_* environment variables, if they are set."""
+        api_key = os.environ.get("AIRTABLE_API_KEY")
+        base_id = os.environ.get("AIRTABLE_BASE_ID")
+        if not api_key or not base_id:
+            return None
+        table_name = os.environ.get("AIRTABLE_TABLE_NAME", "Submissions")
+        return cls(form, base_id, table_name, api_key, **kwargs)
+
+    def _backoff(self, attempt: int, response: requests.Response | None) -> float:
+        retry_after = (
+            response.headers.get("Retry-After") if response is not None else None
+        )
+        if retry_after:
+            try:
+                return min(float(retry_after), self.backoff_max)
+            except ValueError:
+                pass
+        delay = min(self.backoff_base * 2**attempt, self.backoff_max)
+        return delay * random.uniform(0.5, 1.0)
+
+    def _send(self, batch: list[Submission]):
+        records = [
+            {"fields": submission_values(self.columns, submission)}
+            for submission in batch
+        ]
+        for attempt in range(self.max_retries + 1):
+            try:
+                self.table.batch_upsert(
+                    records, key_fields=[SUBMISSION_ID_COLUMN], typecast=True
+                )
+                return
+            except requests.HTTPError as exc:
+                response = exc.response
+                if (
+                    response is None
+                    or response.status_code != 429
+                    or attempt == self.max_retries
+                ):
+                    raise
+                self.metrics.retries += 1
+                time.sleep(self._backoff(attempt, response))
+
+    async def _send_async(self, batch: list[Submission]):
+        self.metrics.batches_in_flight += 1
+        try:
+            await asyncio.to_thread(self._send, batch)
+        finally:
+            self.metrics.batches_in_flight -= 1
+        self.metrics.batches_sent += 1
+        self.metrics.records_exported += len(batch)
+        self.records_exported += len(batch)
+
+    async def _complete_oldest(self, in_flight: deque):
+        # Batches are acknowledged in order, so the checkpoint only ever moves
+        # past submissions that Airtable has accepted.
+        task, cursor = in_flight.popleft()
+        await task
+        await asyncio.to_thread(
+            self.checkpoints.save, self.checkpoint_key, self.form.id, cursor
+        )
+
+    async def run(self) -> int:
+        """Export every submission stored since the last checkpoint.
+
+        Returns how many submissions this run exported.
+        """
+        cursor = self.checkpoints.load(self.checkpoint_key, self.form.id)
+        in_flight: deque[tuple[asyncio.Task, str]] = deque()
+        try:
+            while True:
+                page = await asyncio.to_thread(
+                    self.store.page, self.form.id, cursor, self.page_size
+                )
+                for start in range(
+                    0, len(page.items), AIRTABLE_MAX_RECORDS_PER_REQUEST
+                ):
+                    batch = page.items[start : start + AIRTABLE_MAX_RECORDS_PER_REQUEST]
+                    if len(in_flight) >= self.max_in_flight:
+                        await self._complete_oldest(in_flight)
+                    in_flight.append(
+                        (
+                            asyncio.create_task(self._send_async(batch)),
+                            self.store.cursor_after(batch[-1]),
+                        )
+                    )
+                if page.next_cursor is None:
+                    break
+                cursor = page.next_cursor
+            while in_flight:
+                await self._complete_oldest(in_flight)
+        except BaseException:
+            for task, _ in in_flight:
+                task.cancel()
+            await asyncio.gather(
+                *(task for task, _ in in_flight), return_exceptions=True
+            )
+            raise
+        return self.records_exported
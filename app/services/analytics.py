@@ -0,0 +1,261 @@
+import threading
+from collections import OrderedDict
+from typing import Any
+
+import numpy as np
+from pydantic import BaseModel
+
+from app.models import Form
+from app.services.submission_store import (
+    MAX_PAGE_SIZE,
+    SubmissionStore,
+    get_submission_store,
+)
+
+DEFAULT_CACHE_SIZE = 256
+CHECKBOX_LABELS = ("Checked", "Not checked")
+OTHER_LABEL = "Other"
+_UNANSWERED = -1
+
+
+class ChoiceCount(BaseModel):
+    label: str
+    count: int
+    percent: float
+
+
+class ChoiceDistribution(BaseModel):
+    field_id: str
+    label: str
+    answered: int
+    rows: list[ChoiceCount]
+
+
+class FieldCompletion(BaseModel):
+    field_id: str
+    label: str
+    answered: int
+    rate: float
+
+
+def _choice_fields(form: Form) -> list:
+    return [
+        field
+        for field in form.fields
+        if field.type in ("select", "radio", "checkbox")
+    ]
+
+
+class _GrowableArray:
+    """Append-only NumPy array with amortised O(1) appends."""
+
+    def __init__(self, dtype: Any, capacity: int = 1024):
+        self._data = np.empty(capacity, dtype=dtype)
+        self.size = 0
+
+    def extend(self, values: np.ndarray):
+        needed = self.size + len(values)
+        if needed > len(self._data):
+            grown = np.empty(max(needed, 2 * len(self._data)), dtype=self._data.dtype)
+            grown[: self.size] = self._data[: self.size]
+            self._data = grown
+        self._data[self.size : needed] = values
+        self.size = needed
+
+    @property
+    def values(self) -> np.ndarray:
+        return self._data[: self.size]
+
+
+class _ChoiceColumn:
+    """Integer-coded answers for one select, radio or checkbox field."""
+
+    def __init__(self, field_id: str, label: str, values: list[str], labels: list[str]):
+        self.field_id = field_id
+        self.label = label
+        self.is_checkbox = not values
+        if self.is_checkbox:
+            self.labels = list(CHECKBOX_LABELS)
+            self._lookup: dict[Any, int] = {}
+        else:
+            # Answers outside the option list are counted under "Other".
+            self.labels = labels + [OTHER_LABEL]
+            self._lookup = {value: code for code, value in enumerate(values)}
+        self.codes = _GrowableArray(np.int16)
+        self.counts = np.zeros(len(self.labels), dtype=np.int64)
+
+    def _encode(self, answer: Any) -> int:
+        if self.is_checkbox:
+            return 0 if answer not in (None, "", False, "false", "off") else 1
+        if answer is None or answer == "":
+            return _UNANSWERED
+        return self._lookup.get(answer, len(self.labels) - 1)
+
+    def append(self, answers: list[Any]):
+        codes = np.fromiter(
+            (self._encode(answer) for answer in answers),
+            dtype=np.int16,
+            count=len(answers),
+        )
+        self.codes.extend(codes)
+        self.counts += np.bincount(codes[codes >= 0], minlength=len(self.counts))
+
+    def distribution(self) -> ChoiceDistribution:
+        answered = int(self.counts.sum())
+        percents = self.counts * (100.0 / answered) if answered else self.counts * 0.0
+        return ChoiceDistribution(
+            field_id=self.field_id,
+            label=self.label,
+            answered=answered,
+            rows=[
+                ChoiceCount(label=label, count=int(count), percent=round(float(pct), 1))
+                for label, count, pct in zip(self.labels, self.counts, percents)
+                if count or label != OTHER_LABEL
+            ],
+        )
+
+
+class FormProjection:
+    """Columnar, incrementally updated view of one form layout's submissions.
+
+    Choice answers are stored as small integer codes and counted with
+    `np.bincount`; each refresh only reads submissions stored since the
+    previous one.
+    """
+
+    def __init__(self, form: Form, store: SubmissionStore | None = None):
+        self.form_id = form.id
+        self.layout = self.layout_of(form)
+        self.store = store or get_submission_store()
+        self.total = 0
+        self.cursor: str | None = None
+        self.columns = [
+            _ChoiceColumn(
+                field.id,
+                field.label,
+                [option.value for option in field.options]
+                if field.type != "checkbox"
+                else [],
+                [option.label for option in field.options]
+                if field.type != "checkbox"
+                else [],
+            )
+            for field in _choice_fields(form)
+        ]
+        optional = [field for field in form.fields if not field.required]
+        self.optional_ids = [field.id for field in optional]
+        self.optional_labels = [field.label for field in optional]
+        self.answered = np.zeros(len(optional), dtype=np.int64)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def layout_of(form: Form) -> tuple:
+        """What the stored counts depend on: choice fields, options, optional fields.
+
+        Titles and labels are not part of it, so editing them keeps the counts.
+        """
+        return (
+            tuple(
+                (
+                    field.id,
+                    field.type,
+                    tuple(option.value for option in getattr(field, "options", [])),
+                )
+                for field in _choice_fields(form)
+            ),
+            tuple(field.id for field in form.fields if not field.required),
+        )
+
+    def relabel(self, form: Form):
+        """Take labels from `form`, which must have this projection's layout."""
+        for column, field in zip(self.columns, _choice_fields(form)):
+            column.label = field.label
+            if not column.is_checkbox:
+                column.labels = [option.label for option in field.options] + [
+                    OTHER_LABEL
+                ]
+        self.optional_labels = [
+            field.label for field in form.fields if not field.required
+        ]
+
+    def ingest(self, rows: list[dict[str, Any]]):
+        """Fold a batch of submission payloads into the projection."""
+        if not rows:
+            return
+        for column in self.columns:
+            column.append([row.get(column.field_id) for row in rows])
+        if self.optional_ids:
+            answered = np.array(
+                [
+                    [
+                        row.get(field_id) not in (None, "")
+                        for field_id in self.optional_ids
+                    ]
+                    for row in rows
+                ],
+                dtype=bool,
+            )
+            self.answered += answered.sum(axis=0)
+        self.total += len(rows)
+
+    def refresh(self) -> "FormProjection":
+        """Read submissions stored since the last refresh."""
+        with self._lock:
+            while True:
+                page = self.store.page(self.form_id, self.cursor, MAX_PAGE_SIZE)
+                if page.items:
+                    self.ingest([submission.data for submission in page.items])
+                    self.cursor = self.store.cursor_after(page.items[-1])
+                if page.next_cursor is None:
+                    return self
+
+    def distributions(self) -> list[ChoiceDistribution]:
+        return [column.distribution() for column in self.columns]
+
+    def completion_rates(self) -> list[FieldCompletion]:
+        return [
+            FieldCompletion(
+                field_id=field_id,
+                label=label,
+                answered=int(answered),
+                rate=round(100.0 * answered / self.total, 1) if self.total else 0.0,
+            )
+            for field_id, label, answered in zip(
+                self.optional_ids, self.optional_labels, self.answered
+            )
+        ]
+
+
+class ProjectionCache:
+    """LRU of form projections, one per form.
+
+    A projection is rebuilt only when the form's layout changes, so autosaves
+    that leave the choice fields alone keep their counts; the replaced
+    projection is dropped rather than left to age out of the LRU.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, FormProjection] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, form: Form) -> FormProjection:
+        layout = FormProjection.layout_of(form)
+        with self._lock:
+            projection = self._entries.get(form.id)
+            if projection is None or projection.layout != layout:
+                projection = self._entries[form.id] = FormProjection(form)
+            else:
+                projection.relabel(form)
+            self._entries.move_to_end(form.id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return projection
+
+
+projection_cache = ProjectionCache()
+
+
+def get_projection(form: Form) -> FormProjection:
+    """Return the cached projection for the current layout of `form`."""
+    return projection_cache.get(form)
@@ -0,0 +1,256 @@
+import asyncio
+import base64
+import hashlib
+import hmac
+import os
+import secrets
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from app.models import User
+from app.services.form_repository import DEFAULT_DB_PATH
+from app.services.sqlite_pool import SQLiteConnectionPool
+
+SESSION_TTL_SECONDS = int(os.environ.get("AUTH_SESSION_TTL", str(30 * 24 * 3600)))
+SESSION_CACHE_TTL_SECONDS = float(os.environ.get("AUTH_SESSION_CACHE_TTL", "300"))
+SESSION_CACHE_SIZE = 10_000
+HASH_WORKERS = int(os.environ.get("AUTH_HASH_WORKERS", "4"))
+MIN_PASSWORD_LENGTH = 8
+# Cookie holding the session token, read by both the app state and the API.
+SESSION_COOKIE = "session"
+
+# scrypt cost parameters: ~16 MiB of memory and tens of milliseconds per hash.
+SCRYPT_N = 2**14
+SCRYPT_R = 8
+SCRYPT_P = 1
+
+
+class AuthError(ValueError):
+    """Raised for a rejected registration or login, with a user-facing message."""
+
+
+def hash_password(password: str) -> str:
+    salt = secrets.token_bytes(16)
+    digest = hashlib.scrypt(
+        password.encode(), salt=salt, n=SCRYPT_N, r=SCRYPT_R, p=SCRYPT_P, dklen=32
+    )
+    return "$".join(
+        [
+            "scrypt",
+            str(SCRYPT_N),
+            str(SCRYPT_R),
+            str(SCRYPT_P),
+            base64.b64encode(salt).decode(),
+            base64.b64encode(digest).decode(),
+        ]
+    )
+
+
+def verify_password(password: str, encoded: str) -> bool:
+    _, n, r, p, salt, expected = encoded.split("$")
+    digest = hashlib.scrypt(
+        password.encode(),
+        salt=base64.b64decode(salt),
+        n=int(n),
+        r=int(r),
+        p=int(p),
+        dklen=32,
+    )
+    return hmac.compare_digest(digest, base64.b64decode(expected))
+
+
+def _token_key(token: str) -> str:
+    # Only a digest of each token is stored, so a leaked database cannot be
+    # replayed as live sessions.
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+class SessionCache:
+    """TTL LRU of validated sessions, keyed by token digest."""
+
+    def __init__(
+        self,
+        ttl: float = SESSION_CACHE_TTL_SECONDS,
+        max_entries: int = SESSION_CACHE_SIZE,
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, User]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> User | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                self._entries.pop(key, None)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: str, user: User, expires_at: float):
+        """Cache a session until the cache TTL or the session's own expiry."""
+        ttl = min(self.ttl, expires_at - time.time())
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, user)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: str):
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+class AuthService:
+    """Accounts and opaque session tokens stored in SQLite.
+
+    Password hashing runs on a dedicated thread pool so a burst of logins
+    cannot stall the event loop or starve other `to_thread` work.
+    """
+
+    def __init__(
+        self,
+        path: str = DEFAULT_DB_PATH,
+        session_ttl: int = SESSION_TTL_SECONDS,
+        hash_workers: int = HASH_WORKERS,
+    ):
+        self.pool = SQLiteConnectionPool(path, size=2)
+        self.session_ttl = session_ttl
+        self.sessions = SessionCache()
+        self._hasher = ThreadPoolExecutor(hash_workers, thread_name_prefix="auth-hash")
+        # Verified against when the email is unknown, so the response time
+        # does not reveal which emails have accounts.
+        self._dummy_hash = hash_password(secrets.token_hex(8))
+        with self.pool.connection() as conn:
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS users (
+                    id TEXT PRIMARY KEY,
+                    email TEXT NOT NULL UNIQUE COLLATE NOCASE,
+                    password_hash TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS sessions (
+                    token_key TEXT PRIMARY KEY,
+                    user_id TEXT NOT NULL REFERENCES users (id),
+                    created_at REAL NOT NULL,
+                    expires_at REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS sessions_user_idx ON sessions (user_id);
+                """
+            )
+
+    async def _run_hasher(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(
+            self._hasher, func, *args
+        )
+
+    async def register(self, email: str, password: str) -> User:
+        """Create an account under a new, server-generated user id."""
+        email = email.strip().lower()
+        if "@" not in email:
+            raise AuthError("Enter a valid email address.")
+        if len(password) < MIN_PASSWORD_LENGTH:
+            raise AuthError(
+                f"Passwords must be at least {MIN_PASSWORD_LENGTH} characters."
+            )
+        password_hash = await self._run_hasher(hash_password, password)
+        user = User(email=email, created_at=time.time())
+        with self.pool.connection() as conn:
+            try:
+                conn.execute(
+                    "INSERT INTO users VALUES (?, ?, ?, ?)",
+                    (user.id, user.email, password_hash, user.created_at),
+                )
+            except sqlite3.IntegrityError:
+                raise AuthError(
+                    "An account with this email already exists."
+                ) from None
+        return user
+
+    async def authenticate(self, email: str, password: str) -> User:
+        with self.pool.connection() as conn:
+            row = conn.execute(
+                """
+                SELECT id, email, password_hash, created_at FROM users
+                WHERE email = ?
+                """,
+                (email.strip().lower(),),
+            ).fetchone()
+        encoded = row[2] if row else self._dummy_hash
+        verified = await self._run_hasher(verify_password, password, encoded)
+        if row is None or not verified:
+            raise AuthError("Invalid email or password.")
+        return User(id=row[0], email=row[1], created_at=row[3])
+
+    def create_session(self, user: User) -> str:
+        """Start a session for `user` and return its opaque token."""
+        token = secrets.token_urlsafe(32)
+        now = time.time()
+        expires_at = now + self.session_ttl
+        with self.pool.connection() as conn:
+            conn.execute(
+                "INSERT INTO sessions VALUES (?, ?, ?, ?)",
+                (_token_key(token), user.id, now, expires_at),
+            )
+        self.sessions.put(_token_key(token), user, expires_at)
+        return token
+
+    def validate_session(self, token: str) -> User | None:
+        """Return the session's user, from the cache when it was seen recently."""
+        if not token:
+            return None
+        key = _token_key(token)
+        user = self.sessions.get(key)
+        if user is not None:
+            return user
+        with self.pool.connection() as conn:
+            row = conn.execute(
+                """
+                SELECT users.id, users.email, users.created_at, sessions.expires_at
+                FROM sessions JOIN users ON users.id = sessions.user_id
+                WHERE sessions.token_key = ? AND sessions.expires_at > ?
+                """,
+                (key, time.time()),
+            ).fetchone()
+        if row is None:
+            return None
+        user = User(id=row[0], email=row[1], created_at=row[2])
+        self.sessions.put(key, user, row[3])
+        return user
+
+    def revoke_session(self, token: str) -> None:
+        key = _token_key(token)
+        self.sessions.invalidate(key)
+        with self.pool.connection() as conn:
+            conn.execute("DELETE FROM sessions WHERE token_key = ?", (key,))
+
+
+_service: AuthService | None = None
+_service_lock = threading.Lock()
+
+
+def get_auth_service() -> AuthService:
+    """Return the process-wide auth service, creating it on first use."""
+    global _service
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                _service = AuthService()
+    return _service
+
+
+def set_auth_service(service: AuthService) -> None:
+    """Swap in a differently configured auth service."""
+    global _service
+    with _service_lock:
+        _service = service
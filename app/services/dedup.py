@@ -0,0 +1,82 @@
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+DEDUP_WINDOW_SECONDS = float(os.environ.get("FORMS_SUBMIT_DEDUP_WINDOW", "600"))
+DEDUP_MAX_ENTRIES = int(os.environ.get("FORMS_SUBMIT_DEDUP_ENTRIES", "100000"))
+
+
+class DedupCache:
+    """Remembers recently seen keys for a time window, in bounded memory.
+
+    Keys are stored as their 64-bit `hash`, so an entry costs the same
+    whatever the key, and two different keys are confused with probability
+    about `len(self) / 2**64` per lookup. String hashes are salted per
+    process, so collisions cannot be crafted. Entries leave after `window`
+    seconds, or oldest first once `max_entries` are held; a key evicted
+    early is simply no longer recognised as a duplicate.
+    """
+
+    def __init__(
+        self,
+        window: float = DEDUP_WINDOW_SECONDS,
+        max_entries: int = DEDUP_MAX_ENTRIES,
+    ):
+        self.window = window
+        self.max_entries = max_entries
+        # hash -> expiry, oldest first; every entry lives for the same window.
+        self._expires: OrderedDict[int, float] = OrderedDict()
+        self._lock = threading.Lock()
+        self.duplicates = 0
+        self.evicted = 0
+
+    def _expire(self, now: float):
+        expires = self._expires
+        while expires:
+            key, expires_at = next(iter(expires.items()))
+            if expires_at > now:
+                return
+            del expires[key]
+
+    def seen(self, key: tuple, now: float | None = None) -> bool:
+        """Whether `key` was added within the window."""
+        if now is None:
+            now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+            expires_at = self._expires.get(hash(key))
+            if expires_at is not None and expires_at > now:
+                self.duplicates += 1
+                return True
+            return False
+
+    def add(self, key: tuple, now: float | None = None):
+        if now is None:
+            now = time.monotonic()
+        digest = hash(key)
+        with self._lock:
+            self._expires.pop(digest, None)
+            self._expires[digest] = now + self.window
+            while len(self._expires) > self.max_entries:
+                self._expires.popitem(last=False)
+                self.evicted += 1
+
+    def __len__(self) -> int:
+        return len(self._expires)
+
+    @property
+    def false_positive_rate(self) -> float:
+        """Chance that a new key is mistaken for one already held."""
+        return len(self._expires) / 2**sys.hash_info.width
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self._expires),
+            "duplicates": self.duplicates,
+            "evicted": self.evicted,
+        }
+
+
+submission_dedup = DedupCache()
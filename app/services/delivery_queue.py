@@ -0,0 +1,279 @@
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable
+
+from pydantic import BaseModel
+
+from app.models import generate_uuid_str
+from app.services.sqlite_pool import SQLiteConnectionPool
+from app.services.submission_store import DEFAULT_DB_PATH
+
+DEFAULT_QUEUE_SIZE = int(os.environ.get("DELIVERY_QUEUE_SIZE", "10000"))
+DEFAULT_CONCURRENCY = int(os.environ.get("DELIVERY_CONCURRENCY", "8"))
+DEFAULT_MAX_ATTEMPTS = 5
+# Number of recent jobs kept for the latency percentiles.
+LATENCY_WINDOW = 1024
+
+JobHandler = Callable[..., Awaitable[Any]]
+
+
+class Job:
+    def __init__(
+        self,
+        name: str,
+        handler: JobHandler,
+        args: tuple[Any, ...],
+        on_done: Callable[[], None] | None = None,
+    ):
+        self.id = generate_uuid_str()
+        self.name = name
+        self.handler = handler
+        self.args = args
+        # Called once the job has succeeded or been dead-lettered.
+        self.on_done = on_done
+        self.attempts = 0
+        self.enqueued_at = time.monotonic()
+
+
+def _encode_arg(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    return value
+
+
+class DeadLetterStore:
+    """Keeps jobs that ran out of retries so they can be inspected or replayed."""
+
+    def __init__(self, path: str = DEFAULT_DB_PATH):
+        self.pool = SQLiteConnectionPool(path, size=2)
+        with self.pool.connection() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS dead_letters (
+                    id TEXT PRIMARY KEY,
+                    job TEXT NOT NULL,
+                    args TEXT NOT NULL,
+                    error TEXT NOT NULL,
+                    attempts INTEGER NOT NULL,
+                    failed_at REAL NOT NULL
+                )
+                """
+            )
+
+    def add(self, job: Job, error: BaseException) -> None:
+        with self.pool.connection() as conn:
+            conn.execute(
+                "INSERT INTO dead_letters VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    job.id,
+                    job.name,
+                    json.dumps([_encode_arg(arg) for arg in job.args], default=str),
+                    repr(error),
+                    job.attempts,
+                    time.time(),
+                ),
+            )
+
+    def list(self, limit: int = 100) -> list[dict[str, Any]]:
+        with self.pool.connection() as conn:
+            rows = conn.execute(
+                """
+                SELECT id, job, args, error, attempts, failed_at FROM dead_letters
+                ORDER BY failed_at DESC LIMIT ?
+                """,
+                (limit,),
+            ).fetchall()
+        return [
+            {
+                "id": job_id,
+                "job": name,
+                "args": json.loads(args),
+                "error": error,
+                "attempts": attempts,
+                "failed_at": failed_at,
+            }
+            for job_id, name, args, error, attempts, failed_at in rows
+        ]
+
+
+class DeliveryQueue:
+    """Bounded in-process queue that runs submission side effects off the request path.
+
+    Jobs are retried with exponential backoff and moved to the dead-letter
+    store once they fail `max_attempts` times. Workers are started lazily on
+    the event loop of the first `enqueue` call.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_QUEUE_SIZE,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        retry_backoff: float = 0.5,
+        dead_letters: DeadLetterStore | None = None,
+    ):
+        self.maxsize = maxsize
+        self.concurrency = concurrency
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+        self._dead_letters = dead_letters
+        self._queue: asyncio.Queue[Job] | None = None
+        self._workers: list[asyncio.Task] = []
+        self._retry_tasks: set[asyncio.Task] = set()
+        self.in_flight = 0
+        self.processed = 0
+        self.retried = 0
+        self.dead_lettered = 0
+        self.rejected = 0
+        self._wait_times: deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self._run_times: deque[float] = deque(maxlen=LATENCY_WINDOW)
+
+    @property
+    def dead_letters(self) -> DeadLetterStore:
+        if self._dead_letters is None:
+            self._dead_letters = DeadLetterStore()
+        return self._dead_letters
+
+    def _ensure_workers(self):
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.maxsize)
+        self._workers = [task for task in self._workers if not task.done()]
+        loop = asyncio.get_running_loop()
+        while len(self._workers) < self.concurrency:
+            self._workers.append(loop.create_task(self._work()))
+
+    def enqueue(
+        self,
+        name: str,
+        handler: JobHandler,
+        *args: Any,
+        on_done: Callable[[], None] | None = None,
+    ) -> bool:
+        """Queue a job without waiting, returning False if the queue is full.
+
+        `on_done` runs when the job finally succeeds or is dead-lettered; it
+        is not called for a job that could not be queued.
+        """
+        self._ensure_workers()
+        try:
+            self._queue.put_nowait(Job(name, handler, args, on_done))
+        except asyncio.QueueFull:
+            self.rejected += 1
+            return False
+        return True
+
+    def _requeue_later(self, job: Job, delay: float):
+        async def requeue():
+            await asyncio.sleep(delay)
+            job.enqueued_at = time.monotonic()
+            await self._queue.put(job)
+
+        task = asyncio.get_running_loop().create_task(requeue())
+        self._retry_tasks.add(task)
+        task.add_done_callback(self._retry_tasks.discard)
+
+    async def _work(self):
+        while True:
+            job = await self._queue.get()
+            started_at = time.monotonic()
+            self._wait_times.append(started_at - job.enqueued_at)
+            self.in_flight += 1
+            job.attempts += 1
+            done = True
+            try:
+                await job.handler(*job.args)
+                self.processed += 1
+            except Exception as exc:
+                if job.attempts < self.max_attempts:
+                    done = False
+                    self.retried += 1
+                    self._requeue_later(
+                        job, self.retry_backoff * 2 ** (job.attempts - 1)
+                    )
+                else:
+                    logging.exception("Job %s failed %d times", job.name, job.attempts)
+                    await self._dead_letter(job, exc)
+            finally:
+                if done and job.on_done is not None:
+                    job.on_done()
+                self.in_flight -= 1
+                self._run_times.append(time.monotonic() - started_at)
+                self._queue.task_done()
+
+    async def _dead_letter(self, job: Job, error: BaseException):
+        self.dead_lettered += 1
+        try:
+            await asyncio.to_thread(self.dead_letters.add, job, error)
+        except Exception:
+            logging.exception("Error recording dead letter %s", job.id)
+
+    async def enqueue_or_dead_letter(
+        self, name: str, handler: JobHandler, *args: Any
+    ) -> bool:
+        """Queue a job, or keep it as a dead letter for replay if the queue is full."""
+        if self.enqueue(name, handler, *args):
+            return True
+        logging.warning("Delivery queue full; dead-lettering %s job", name)
+        await self._dead_letter(
+            Job(name, handler, args), asyncio.QueueFull("delivery queue is full")
+        )
+        return False
+
+    async def drain(self):
+        """Wait until every queued job, including pending retries, has finished."""
+        while self._queue is not None and (
+            self._queue.qsize() or self.in_flight or self._retry_tasks
+        ):
+            await self._queue.join()
+            if self._retry_tasks:
+                await asyncio.gather(*self._retry_tasks, return_exceptions=True)
+
+    @staticmethod
+    def _percentile(samples: deque[float], fraction: float) -> float:
+        if not samples:
+            return 0.0
+        ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    def stats(self) -> dict[str, float]:
+        """Queue depth, throughput counters and recent wait/run latencies in seconds."""
+        return {
+            "depth": self._queue.qsize() if self._queue is not None else 0,
+            "capacity": self.maxsize,
+            "in_flight": self.in_flight,
+            "pending_retries": len(self._retry_tasks),
+            "processed": self.processed,
+            "retried": self.retried,
+            "dead_lettered": self.dead_lettered,
+            "rejected": self.rejected,
+            "wait_p50": self._percentile(self._wait_times, 0.5),
+            "wait_p95": self._percentile(self._wait_times, 0.95),
+            "run_p50": self._percentile(self._run_times, 0.5),
+            "run_p95": self._percentile(self._run_times, 0.95),
+        }
+
+
+_queue: DeliveryQueue | None = None
+_queue_lock = threading.Lock()
+
+
+def get_delivery_queue() -> DeliveryQueue:
+    """Return the process-wide delivery queue, creating it on first use."""
+    global _queue
+    if _queue is None:
+        with _queue_lock:
+            if _queue is None:
+                _queue = DeliveryQueue()
+    return _queue
+
+
+def set_delivery_queue(queue: DeliveryQueue) -> None:
+    """Swap in a differently configured delivery queue."""
+    global _queue
+    with _queue_lock:
+        _queue = queue
@@ -0,0 +1,44 @@
+import time
+
+from app.services.sqlite_pool import SQLiteConnectionPool
+from app.services.submission_store import DEFAULT_DB_PATH
+
+
+class ExportCheckpointStore:
+    """Remembers how far each export sink has read through a form's submissions."""
+
+    def __init__(self, path: str = DEFAULT_DB_PATH):
+        self.pool = SQLiteConnectionPool(path, size=2)
+        with self.pool.connection() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS export_checkpoints (
+                    sink TEXT NOT NULL,
+                    form_id TEXT NOT NULL,
+                    cursor TEXT NOT NULL,
+                    updated_at REAL NOT NULL,
+                    PRIMARY KEY (sink, form_id)
+                )
+                """
+            )
+
+    def load(self, sink: str, form_id: str) -> str | None:
+        with self.pool.connection() as conn:
+            row = conn.execute(
+                "SELECT cursor FROM export_checkpoints WHERE sink = ? AND form_id = ?",
+                (sink, form_id),
+            ).fetchone()
+        return row[0] if row else None
+
+    def save(self, sink: str, form_id: str, cursor: str) -> None:
+        with self.pool.connection() as conn:
+            conn.execute(
+                """
+                INSERT INTO export_checkpoints (sink, form_id, cursor, updated_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT (sink, form_id) DO UPDATE SET
+                    cursor = excluded.cursor,
+                    updated_at = excluded.updated_at
+                """,
+                (sink, form_id, cursor, time.time()),
+            )
@@ -0,0 +1,82 @@
+import threading
+import time
+
+from app.models import Form, Submission
+
+SUBMISSION_ID_COLUMN = "Submission ID"
+SUBMITTED_AT_COLUMN = "Submitted At"
+
+
+class ExportMetrics:
+    """Throughput counters for a running export."""
+
+    def __init__(self):
+        self.started_at = time.monotonic()
+        self.records_exported = 0
+        self.batches_sent = 0
+        self.batches_in_flight = 0
+        self.retries = 0
+        self.records_dropped = 0
+
+    @property
+    def records_per_second(self) -> float:
+        elapsed = time.monotonic() - self.started_at
+        return self.records_exported / elapsed if elapsed > 0 else 0.0
+
+    def snapshot(self) -> dict[str, float]:
+        return {
+            "records_exported": self.records_exported,
+            "records_per_second": self.records_per_second,
+            "batches_sent": self.batches_sent,
+            "batches_in_flight": self.batches_in_flight,
+            "retries": self.retries,
+            "records_dropped": self.records_dropped,
+        }
+
+
+_sink_metrics: dict[str, ExportMetrics] = {}
+_sink_metrics_lock = threading.Lock()
+
+
+def sink_metrics(name: str) -> ExportMetrics:
+    """Return the process-wide metrics shared by every export sink called `name`."""
+    with _sink_metrics_lock:
+        metrics = _sink_metrics.get(name)
+        if metrics is None:
+            metrics = _sink_metrics[name] = ExportMetrics()
+        return metrics
+
+
+def all_sink_metrics() -> dict[str, ExportMetrics]:
+    with _sink_metrics_lock:
+        return dict(_sink_metrics)
+
+
+def column_headers(form: Form) -> list[tuple[str, str]]:
+    """Pair each field id with a unique column header derived from its label."""
+    seen: dict[str, int] = {}
+    columns = []
+    for field in form.fields:
+        label = field.label or field.id
+        seen[label] = seen.get(label, 0) + 1
+        columns.append(
+            (field.id, label if seen[label] == 1 else f"{label} ({seen[label]})")
+        )
+    return columns
+
+
+def submission_values(
+    columns: list[tuple[str, str]], submission: Submission
+) -> dict[str, str]:
+    """Map a submission's answers onto column headers."""
+    values = {
+        SUBMISSION_ID_COLUMN: submission.id,
+        SUBMITTED_AT_COLUMN: time.strftime(
+            "%Y-%m-%dT%H:%M:%SZ", time.gmtime(submission.created_at)
+        ),
+    }
+    for field_id, header in columns:
+        answer = submission.data.get(field_id)
+        if answer is not None:
+            values[header] = str(answer)
+    return values
@@ -0,0 +1,57 @@
+import json
+import os
+from typing import Iterator
+
+from pydantic import ValidationError
+
+from app.models import Form
+
+MAX_BUNDLE_FORMS = int(os.environ.get("FORMS_IMPORT_MAX_FORMS", "5000"))
+MAX_BUNDLE_BYTES = int(os.environ.get("FORMS_IMPORT_MAX_BYTES", str(32 * 2**20)))
+# Forms validated between progress updates.
+VALIDATION_CHUNK_SIZE = 250
+
+
+class BundleError(ValueError):
+    """Raised for a bundle that cannot be imported, with a user-facing message."""
+
+
+def load_bundle(data: bytes) -> list:
+    """Decode a bundle: a JSON list of forms, or an object with a `forms` list."""
+    if len(data) > MAX_BUNDLE_BYTES:
+        raise BundleError(
+            f"The file is larger than {MAX_BUNDLE_BYTES // 2**20} MiB."
+        )
+    try:
+        bundle = json.loads(data)
+    except (UnicodeDecodeError, json.JSONDecodeError):
+        raise BundleError("The file is not valid JSON.") from None
+    if isinstance(bundle, dict):
+        bundle = bundle.get("forms")
+    if not isinstance(bundle, list):
+        raise BundleError("The file does not contain a list of forms.")
+    if len(bundle) > MAX_BUNDLE_FORMS:
+        raise BundleError(f"A bundle can hold at most {MAX_BUNDLE_FORMS} forms.")
+    return bundle
+
+
+def validate_bundle(
+    items: list, chunk_size: int = VALIDATION_CHUNK_SIZE
+) -> Iterator[list[Form]]:
+    """Validate bundle entries in one pass, yielding them a chunk at a time.
+
+    Imported forms get fresh form and field ids, so a bundle can never
+    overwrite an existing form, nor be imported twice onto the same ids.
+    """
+    for start in range(0, len(items), chunk_size):
+        forms = []
+        for position, item in enumerate(items[start : start + chunk_size], start):
+            try:
+                forms.append(Form.model_validate(item).with_fresh_ids())
+            except ValidationError as error:
+                location = ".".join(map(str, error.errors()[0]["loc"]))
+                raise BundleError(
+                    f"Form {position + 1} is invalid"
+                    + (f" at {location}." if location else ".")
+                ) from None
+        yield forms
@@ -0,0 +1,214 @@
+import os
+import time
+from typing import Hashable
+
+from app.models import Form, FormField
+
+DEFAULT_MAX_VERSIONS = int(os.environ.get("FORMS_HISTORY_MAX_VERSIONS", "100"))
+DEFAULT_MAX_BYTES = int(os.environ.get("FORMS_HISTORY_MAX_BYTES", str(4 * 2**20)))
+# Edits with the same coalesce key this close together become one undo step.
+COALESCE_SECONDS = 1.0
+
+
+class FormVersion:
+    """One point in a form's history.
+
+    `fields` holds the field objects themselves, so a field left untouched
+    by an edit is shared by every version that contains it.
+    """
+
+    __slots__ = (
+        "title",
+        "description",
+        "limits",
+        "fields",
+        "coalesce_key",
+        "recorded_at",
+        "pinned",
+    )
+
+    def __init__(self, form: Form, coalesce_key: Hashable | None = None):
+        self.title = form.title
+        self.description = form.description
+        # Replaced rather than edited in place, like the fields.
+        self.limits = form.limits
+        self.fields: tuple[FormField, ...] = tuple(form.fields)
+        self.coalesce_key = coalesce_key
+        self.recorded_at = time.monotonic()
+        self.pinned = False
+
+    def __getstate__(self):
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    def __setstate__(self, state):
+        for slot, value in state.items():
+            setattr(self, slot, value)
+
+
+class FormHistory:
+    """Bounded undo/redo history for one form, with structural sharing.
+
+    Versions share field objects, so they must never be mutated in place:
+    an editor changing a field that `is_shared` replaces it with a copy
+    first. Memory is accounted once per distinct field object, by the size
+    of its JSON, and the oldest unpinned versions are dropped when either
+    the version count or the byte budget is exceeded.
+    """
+
+    def __init__(
+        self,
+        form: Form,
+        max_versions: int = DEFAULT_MAX_VERSIONS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        self.max_versions = max_versions
+        self.max_bytes = max_bytes
+        self._versions: list[FormVersion] = []
+        self._position = -1
+        # id(field) -> [field, size in bytes, number of versions holding it]
+        self._refs: dict[int, list] = {}
+        self.memory_bytes = 0
+        # Set when an edit was allowed in place because it will coalesce.
+        self._open_key: Hashable | None = None
+        self.record(form)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # Object ids do not survive pickling; the counts are rebuilt on load.
+        del state["_refs"]
+        del state["memory_bytes"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._refs = {}
+        self.memory_bytes = 0
+        for version in self._versions:
+            self._retain(version)
+
+    def _retain(self, version: FormVersion):
+        self.memory_bytes += len(version.title) + len(version.description)
+        for field in version.fields:
+            ref = self._refs.get(id(field))
+            if ref is None:
+                size = len(field.model_dump_json())
+                self._refs[id(field)] = [field, size, 1]
+                self.memory_bytes += size
+            else:
+                ref[2] += 1
+
+    def _release(self, version: FormVersion):
+        self.memory_bytes -= len(version.title) + len(version.description)
+        for field in version.fields:
+            ref = self._refs[id(field)]
+            ref[2] -= 1
+            if not ref[2]:
+                del self._refs[id(field)]
+                self.memory_bytes -= ref[1]
+
+    def _coalesces(self, coalesce_key: Hashable | None) -> bool:
+        top = self._versions[-1]
+        return (
+            coalesce_key is not None
+            and not self.can_redo
+            and len(self._versions) > 1
+            and top.coalesce_key == coalesce_key
+            and time.monotonic() - top.recorded_at < COALESCE_SECONDS
+        )
+
+    def is_shared(self, field: FormField, coalesce_key: Hashable | None = None) -> bool:
+        """Whether the live `field` must be copied before an edit.
+
+        A field held only by the newest version can be edited in place when
+        the edit, recorded under `coalesce_key`, will replace that version.
+        """
+        ref = self._refs.get(id(field))
+        if ref is None:
+            return False
+        if ref[2] == 1 and self._coalesces(coalesce_key):
+            self._open_key = coalesce_key
+            return False
+        return True
+
+    @property
+    def can_undo(self) -> bool:
+        return self._position > 0
+
+    @property
+    def can_redo(self) -> bool:
+        return self._position < len(self._versions) - 1
+
+    def __len__(self) -> int:
+        return len(self._versions)
+
+    def record(self, form: Form, coalesce_key: Hashable | None = None):
+        """Record the form's current contents as the newest version.
+
+        Any redo branch is discarded. A change with the same non-empty
+        coalesce key as the newest version, made within `COALESCE_SECONDS`,
+        replaces it instead, so typing a label is undone in one step.
+        """
+        coalesce = coalesce_key is not None and (
+            coalesce_key == self._open_key or self._coalesces(coalesce_key)
+        )
+        self._open_key = None
+        for version in self._versions[self._position + 1 :]:
+            self._release(version)
+        del self._versions[self._position + 1 :]
+        version = FormVersion(form, coalesce_key)
+        if coalesce:
+            self._release(self._versions.pop())
+        self._retain(version)
+        self._versions.append(version)
+        self._position = len(self._versions) - 1
+        self._trim()
+
+    def _trim(self):
+        index = 0
+        while index < self._position and (
+            len(self._versions) > self.max_versions
+            or self.memory_bytes > self.max_bytes
+        ):
+            if self._versions[index].pinned:
+                index += 1
+                continue
+            self._release(self._versions.pop(index))
+            self._position -= 1
+
+    def _restore(self, form: Form):
+        version = self._versions[self._position]
+        form.title = version.title
+        form.description = version.description
+        form.limits = version.limits
+        form.fields = list(version.fields)
+
+    def undo(self, form: Form) -> bool:
+        """Step `form` back one version, returning whether there was one."""
+        if not self.can_undo:
+            return False
+        self._open_key = None
+        self._position -= 1
+        self._restore(form)
+        return True
+
+    def redo(self, form: Form) -> bool:
+        """Step `form` forward one undone version, returning whether there was one."""
+        if not self.can_redo:
+            return False
+        self._open_key = None
+        self._position += 1
+        self._restore(form)
+        return True
+
+    def pin(self):
+        """Keep the current version, e.g. the one just published, from eviction.
+
+        Only the latest pin is held; pinning again releases the previous one.
+        """
+        for version in self._versions:
+            version.pinned = False
+        current = self._versions[self._position]
+        current.pinned = True
+        # A pinned version is never rewritten by a coalesced edit.
+        current.coalesce_key = None
+        self._open_key = None
@@ -0,0 +1,550 @@
+import base64
+import binascii
+import json
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+from app.models import Form, FormSummary, FormSummaryPage
+from app.services.published_snapshots import FormSnapshot, SnapshotCache
+from app.services.search_index import DEFAULT_RESULT_LIMIT, FormSearchIndex
+from app.services.sqlite_pool import SQLiteConnectionPool
+
+DEFAULT_DB_PATH = os.environ.get("FORMS_DB_PATH", "forms.db")
+DEFAULT_PARSE_CACHE_SIZE = 10_000
+DEFAULT_SUMMARY_PAGE_SIZE = 24
+MAX_SUMMARY_PAGE_SIZE = 200
+# Ids per `IN (...)` list, well under SQLite's bound parameter limit.
+ID_CHUNK_SIZE = 500
+
+# Dashboard sort orders: column and direction; ties are broken by form id.
+SUMMARY_SORTS = {
+    "updated": ("updated_at", "DESC"),
+    "created": ("created_at", "DESC"),
+    "title": ("title", "ASC"),
+}
+
+
+def encode_cursor(sort_value, form_id: str) -> str:
+    return base64.urlsafe_b64encode(json.dumps([sort_value, form_id]).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple:
+    """Return the (sort value, form id) a cursor points after."""
+    try:
+        sort_value, form_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, ValueError, TypeError) as exc:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from exc
+    return sort_value, form_id
+
+
+class FormParseCache:
+    """Parsed forms keyed by form id and storage revision.
+
+    Entries are shared between readers and must be treated as read-only; a
+    form is only parsed again when its stored revision changes.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_PARSE_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[int, Form]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.parses = 0
+        self.hits = 0
+
+    def get(self, form_id: str, revision: int) -> Form | None:
+        with self._lock:
+            entry = self._entries.get(form_id)
+            if entry is None or entry[0] != revision:
+                return None
+            self._entries.move_to_end(form_id)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, form_id: str, revision: int, form: Form) -> None:
+        form.version = revision
+        with self._lock:
+            self._entries[form_id] = (revision, form)
+            self._entries.move_to_end(form_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def parse(self, form_id: str, revision: int, data: str) -> Form:
+        """Return the cached form for this revision, parsing ``data`` on a miss."""
+        form = self.get(form_id, revision)
+        if form is None:
+            form = Form.model_validate_json(data)
+            self.parses += 1
+            self.put(form_id, revision, form)
+        return form
+
+    def invalidate(self, form_id: str | None = None) -> None:
+        """Drop one form, or every form when no id is given."""
+        with self._lock:
+            if form_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(form_id, None)
+
+    def stats(self) -> dict[str, int]:
+        return {"parses": self.parses, "hits": self.hits, "size": len(self._entries)}
+
+
+class FormRepository(ABC):
+    """Storage backend for forms, holding one record per form."""
+
+    @abstractmethod
+    def get(self, form_id: str, owner_id: str | None = None) -> Form | None:
+        """Load a single form, optionally restricted to one owner."""
+
+    @abstractmethod
+    def get_many(self, form_ids: list[str], owner_id: str) -> list[Form]:
+        """Load an owner's forms by id, in the order given, skipping missing ones."""
+
+    @abstractmethod
+    def list_forms(self, owner_id: str) -> list[Form]:
+        """Load every form belonging to an owner, oldest first."""
+
+    @abstractmethod
+    def list_summaries(
+        self,
+        owner_id: str,
+        sort: str = "updated",
+        cursor: str | None = None,
+        limit: int = DEFAULT_SUMMARY_PAGE_SIZE,
+    ) -> FormSummaryPage:
+        """Return one page of an owner's form summaries in `sort` order."""
+
+    @abstractmethod
+    def search_summaries(
+        self, owner_id: str, query: str, limit: int = DEFAULT_RESULT_LIMIT
+    ) -> list[FormSummary]:
+        """Return summaries of an owner's forms matching `query`, best match first."""
+
+    @abstractmethod
+    def save(self, form: Form, owner_id: str) -> None:
+        """Insert a form, or replace it if the owner already has it."""
+
+    @abstractmethod
+    def save_many(self, forms: list[Form], owner_id: str) -> int:
+        """Save several forms in one transaction, returning how many were written."""
+
+    @abstractmethod
+    def update(self, form: Form, owner_id: str) -> bool:
+        """Replace an existing form, returning whether it was found."""
+
+    @abstractmethod
+    def delete(self, form_id: str, owner_id: str | None = None) -> bool:
+        """Delete a form, returning whether it was found."""
+
+    @abstractmethod
+    def delete_many(
+        self, form_ids: list[str], owner_id: str | None = None
+    ) -> list[str]:
+        """Delete several forms in one transaction, returning the ids deleted."""
+
+    @abstractmethod
+    def publish(self, form_id: str, owner_id: str) -> int | None:
+        """Pin the form's saved revision as its published version and return it."""
+
+    @abstractmethod
+    def get_published(self, form_id: str, version: int | None = None) -> Form | None:
+        """Load a published version of a form, by default the current one."""
+
+    @abstractmethod
+    def get_snapshot(
+        self, form_id: str, version: int | None = None
+    ) -> FormSnapshot | None:
+        """Return the shared, pre-rendered snapshot of a published version."""
+
+
+class SQLiteFormRepository(FormRepository):
+    """Stores each form as a JSON document in its own SQLite row."""
+
+    def __init__(self, path: str = DEFAULT_DB_PATH, pool_size: int = 4):
+        self.pool = SQLiteConnectionPool(path, size=pool_size)
+        self.parse_cache = FormParseCache()
+        self.search_index = FormSearchIndex()
+        self.snapshots = SnapshotCache()
+        with self.pool.connection() as conn:
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS forms (
+                    id TEXT PRIMARY KEY,
+                    owner_id TEXT NOT NULL,
+                    data TEXT NOT NULL,
+                    revision INTEGER NOT NULL DEFAULT 1,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS forms_owner_idx
+                    ON forms (owner_id, created_at);
+                """
+            )
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(forms)")}
+            if "title" not in columns:
+                # Summary columns, denormalised from `data` so the dashboard
+                # never has to parse a form document.
+                conn.executescript(
+                    """
+                    ALTER TABLE forms
+                        ADD COLUMN title TEXT NOT NULL DEFAULT '' COLLATE NOCASE;
+                    ALTER TABLE forms
+                        ADD COLUMN field_count INTEGER NOT NULL DEFAULT 0;
+                    UPDATE forms SET
+                        title = coalesce(json_extract(data, '$.title'), ''),
+                        field_count = coalesce(json_array_length(data, '$.fields'), 0);
+                    """
+                )
+            backfill_published = "published_version" not in columns
+            if backfill_published:
+                conn.execute("ALTER TABLE forms ADD COLUMN published_version INTEGER")
+            if "schema_version" in columns:
+                # No longer used: every stored form is validated the same way.
+                conn.execute("ALTER TABLE forms DROP COLUMN schema_version")
+            conn.executescript(
+                """
+                CREATE INDEX IF NOT EXISTS forms_owner_updated_idx
+                    ON forms (owner_id, updated_at, id);
+                CREATE INDEX IF NOT EXISTS forms_owner_created_idx
+                    ON forms (owner_id, created_at, id);
+                CREATE INDEX IF NOT EXISTS forms_owner_title_idx
+                    ON forms (owner_id, title, id);
+                -- Published versions are immutable copies of a saved revision,
+                -- so the public page is unaffected by later edits.
+                CREATE TABLE IF NOT EXISTS published_forms (
+                    form_id TEXT NOT NULL,
+                    version INTEGER NOT NULL,
+                    data TEXT NOT NULL,
+                    published_at REAL NOT NULL,
+                    PRIMARY KEY (form_id, version)
+                );
+                """
+            )
+            published_columns = {
+                row[1] for row in conn.execute("PRAGMA table_info(published_forms)")
+            }
+            if "schema_version" in published_columns:
+                conn.execute("ALTER TABLE published_forms DROP COLUMN schema_version")
+            if backfill_published:
+                # Forms saved before publishing existed were public as soon as
+                # they were saved; publish them so their links keep working.
+                conn.execute(
+                    """
+                    INSERT OR IGNORE INTO published_forms
+                    SELECT id, revision, data, ? FROM forms
+                    """,
+                    (time.time(),),
+                )
+                conn.execute("UPDATE forms SET published_version = revision")
+
+    def get(self, form_id: str, owner_id: str | None = None) -> Form | None:
+        with self.pool.connection() as conn:
+            if owner_id is None:
+                row = conn.execute(
+                    "SELECT revision, data FROM forms WHERE id = ?",
+                    (form_id,),
+                ).fetchone()
+            else:
+                row = conn.execute(
+                    """
+                    SELECT revision, data FROM forms
+                    WHERE id = ? AND owner_id = ?
+                    """,
+                    (form_id, owner_id),
+                ).fetchone()
+        if row is None:
+            return None
+        # Callers may edit the form they get back, so never hand out the cached copy.
+        return self.parse_cache.parse(form_id, *row).model_copy(deep=True)
+
+    def get_many(self, form_ids: list[str], owner_id: str) -> list[Form]:
+        found: dict[str, Form] = {}
+        with self.pool.connection() as conn:
+            for start in range(0, len(form_ids), ID_CHUNK_SIZE):
+                chunk = form_ids[start : start + ID_CHUNK_SIZE]
+                placeholders = ", ".join("?" * len(chunk))
+                for form_id, revision, data in conn.execute(
+                    f"""
+                    SELECT id, revision, data FROM forms
+                    WHERE owner_id = ? AND id IN ({placeholders})
+                    """,
+                    [owner_id, *chunk],
+                ):
+                    found[form_id] = self.parse_cache.parse(form_id, revision, data)
+        return [
+            found[form_id].model_copy(deep=True)
+            for form_id in dict.fromkeys(form_ids)
+            if form_id in found
+        ]
+
+    def list_forms(self, owner_id: str) -> list[Form]:
+        with self.pool.connection() as conn:
+            rows = conn.execute(
+                """
+                SELECT id, revision FROM forms
+                WHERE owner_id = ? ORDER BY created_at, id
+                """,
+                (owner_id,),
+            ).fetchall()
+            cached = {
+                form_id: self.parse_cache.get(form_id, revision)
+                for form_id, revision in rows
+            }
+            missing = [form_id for form_id, form in cached.items() if form is None]
+            for start in range(0, len(missing), ID_CHUNK_SIZE):
+                chunk = missing[start : start + ID_CHUNK_SIZE]
+                placeholders = ", ".join("?" * len(chunk))
+                for form_id, revision, data in conn.execute(
+                    f"""
+                    SELECT id, revision, data FROM forms
+                    WHERE id IN ({placeholders})
+                    """,
+                    chunk,
+                ):
+                    cached[form_id] = self.parse_cache.parse(form_id, revision, data)
+        return [form for form in cached.values() if form is not None]
+
+    def list_summaries(
+        self,
+        owner_id: str,
+        sort: str = "updated",
+        cursor: str | None = None,
+        limit: int = DEFAULT_SUMMARY_PAGE_SIZE,
+    ) -> FormSummaryPage:
+        column, direction = SUMMARY_SORTS[sort]
+        limit = max(1, min(limit, MAX_SUMMARY_PAGE_SIZE))
+        query = """
+            SELECT id, title, field_count, created_at, updated_at FROM forms
+            WHERE owner_id = ?
+        """
+        params: list = [owner_id]
+        if cursor is not None:
+            comparison = "<" if direction == "DESC" else ">"
+            query += f" AND ({column}, id) {comparison} (?, ?)"
+            params.extend(decode_cursor(cursor))
+        query += f" ORDER BY {column} {direction}, id {direction} LIMIT ?"
+        # Fetch one extra row to learn whether another page follows.
+        params.append(limit + 1)
+        with self.pool.connection() as conn:
+            rows = conn.execute(query, params).fetchall()
+        items = [
+            FormSummary(
+                id=form_id,
+                title=title,
+                field_count=field_count,
+                created_at=created_at,
+                updated_at=updated_at,
+            )
+            for form_id, title, field_count, created_at, updated_at in rows[:limit]
+        ]
+        next_cursor = None
+        if len(rows) > limit:
+            last = items[-1]
+            next_cursor = encode_cursor(getattr(last, column), last.id)
+        return FormSummaryPage(items=items, next_cursor=next_cursor)
+
+    def search_summaries(
+        self, owner_id: str, query: str, limit: int = DEFAULT_RESULT_LIMIT
+    ) -> list[FormSummary]:
+        form_ids = self.search_index.search(owner_id, query, self.list_forms, limit)
+        if not form_ids:
+            return []
+        placeholders = ", ".join("?" * len(form_ids))
+        with self.pool.connection() as conn:
+            rows = conn.execute(
+                f"""
+                SELECT id, title, field_count, created_at, updated_at FROM forms
+                WHERE owner_id = ? AND id IN ({placeholders})
+                """,
+                [owner_id, *form_ids],
+            ).fetchall()
+        summaries = {
+            form_id: FormSummary(
+                id=form_id,
+                title=title,
+                field_count=field_count,
+                created_at=created_at,
+                updated_at=updated_at,
+            )
+            for form_id, title, field_count, created_at, updated_at in rows
+        }
+        return [summaries[form_id] for form_id in form_ids if form_id in summaries]
+
+    def save(self, form: Form, owner_id: str) -> None:
+        self.save_many([form], owner_id)
+
+    def save_many(self, forms: list[Form], owner_id: str) -> int:
+        now = time.time()
+        saved = []
+        with self.pool.transaction() as conn:
+            for form in forms:
+                row = conn.execute(
+                    """
+                    INSERT INTO forms (
+                        id, owner_id, data, title, field_count, created_at, updated_at
+                    )
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (id) DO UPDATE SET
+                        data = excluded.data,
+                        title = excluded.title,
+                        field_count = excluded.field_count,
+                        revision = forms.revision + 1,
+                        updated_at = excluded.updated_at
+                    WHERE forms.owner_id = excluded.owner_id
+                    RETURNING revision
+                    """,
+                    (
+                        form.id,
+                        owner_id,
+                        form.model_dump_json(),
+                        form.title,
+                        len(form.fields),
+                        now,
+                        now,
+                    ),
+                ).fetchone()
+                if row is not None:
+                    saved.append((form, row[0]))
+        for form, revision in saved:
+            self.parse_cache.put(form.id, revision, form.model_copy(deep=True))
+            self.search_index.index(form, owner_id)
+        return len(saved)
+
+    def update(self, form: Form, owner_id: str) -> bool:
+        with self.pool.connection() as conn:
+            row = conn.execute(
+                """
+                UPDATE forms
+                SET data = ?, title = ?, field_count = ?,
+                    revision = revision + 1, updated_at = ?
+                WHERE id = ? AND owner_id = ?
+                RETURNING revision
+                """,
+                (
+                    form.model_dump_json(),
+                    form.title,
+                    len(form.fields),
+                    time.time(),
+                    form.id,
+                    owner_id,
+                ),
+            ).fetchone()
+        if row is None:
+            return False
+        # Seed the cache with the saved form so the next read does not re-parse it.
+        self.parse_cache.put(form.id, row[0], form.model_copy(deep=True))
+        self.search_index.index(form, owner_id)
+        return True
+
+    def delete(self, form_id: str, owner_id: str | None = None) -> bool:
+        return bool(self.delete_many([form_id], owner_id))
+
+    def delete_many(
+        self, form_ids: list[str], owner_id: str | None = None
+    ) -> list[str]:
+        deleted = []
+        with self.pool.transaction() as conn:
+            for start in range(0, len(form_ids), ID_CHUNK_SIZE):
+                chunk = form_ids[start : start + ID_CHUNK_SIZE]
+                placeholders = ", ".join("?" * len(chunk))
+                query = f"DELETE FROM forms WHERE id IN ({placeholders})"
+                if owner_id is not None:
+                    query += " AND owner_id = ?"
+                    chunk = [*chunk, owner_id]
+                ids = [row[0] for row in conn.execute(f"{query} RETURNING id", chunk)]
+                if ids:
+                    placeholders = ", ".join("?" * len(ids))
+                    conn.execute(
+                        f"""
+                        DELETE FROM published_forms WHERE form_id IN ({placeholders})
+                        """,
+                        ids,
+                    )
+                deleted.extend(ids)
+        for form_id in deleted:
+            self.parse_cache.invalidate(form_id)
+            self.search_index.remove(form_id)
+            self.snapshots.invalidate(form_id)
+        return deleted
+
+    def publish(self, form_id: str, owner_id: str) -> int | None:
+        with self.pool.transaction() as conn:
+            row = conn.execute(
+                """
+                UPDATE forms SET published_version = revision
+                WHERE id = ? AND owner_id = ?
+                RETURNING revision, data
+                """,
+                (form_id, owner_id),
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "INSERT OR IGNORE INTO published_forms VALUES (?, ?, ?, ?)",
+                (form_id, *row, time.time()),
+            )
+        self.snapshots.set_current(form_id, row[0])
+        return row[0]
+
+    def get_published(self, form_id: str, version: int | None = None) -> Form | None:
+        with self.pool.connection() as conn:
+            row = conn.execute(
+                """
+                SELECT published_forms.version, published_forms.data
+                FROM published_forms JOIN forms ON forms.id = published_forms.form_id
+                WHERE published_forms.form_id = ?
+                    AND published_forms.version
+                        = coalesce(?, forms.published_version)
+                """,
+                (form_id, version),
+            ).fetchone()
+        if row is None:
+            return None
+        form = Form.model_validate_json(row[1])
+        form.version = row[0]
+        return form
+
+    def get_snapshot(
+        self, form_id: str, version: int | None = None
+    ) -> FormSnapshot | None:
+        snapshot = self.snapshots.get(form_id, version)
+        if snapshot is not None:
+            return snapshot
+        if version is None:
+            with self.pool.connection() as conn:
+                row = conn.execute(
+                    "SELECT published_version FROM forms WHERE id = ?", (form_id,)
+                ).fetchone()
+            if row is None or row[0] is None:
+                return None
+            version = row[0]
+            self.snapshots.set_current(form_id, version)
+            snapshot = self.snapshots.get(form_id, version)
+            if snapshot is not None:
+                return snapshot
+        form = self.get_published(form_id, version)
+        return None if form is None else self.snapshots.put(form)
+
+
+_repository: FormRepository | None = None
+_repository_lock = threading.Lock()
+
+
+def get_form_repository() -> FormRepository:
+    """Return the process-wide form repository, creating it on first use."""
+    global _repository
+    if _repository is None:
+        with _repository_lock:
+            if _repository is None:
+                _repository = SQLiteFormRepository()
+    return _repository
+
+
+def set_form_repository(repository: FormRepository) -> None:
+    """Swap in a different form repository backend."""
+    global _repository
+    with _repository_lock:
+        _repository = repository
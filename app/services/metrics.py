@@ -0,0 +1,144 @@
+import bisect
+import math
+import os
+import random
+import threading
+from typing import Callable, Iterable
+
+# Fraction of events whose timings and payload sizes are recorded; 0 disables.
+# Sampled events serialize their deltas and large state vars to size them, so
+# recording every event would add that work to each editor keystroke.
+SAMPLE_RATE = float(os.environ.get("METRICS_SAMPLE_RATE", "0.05"))
+
+LATENCY_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+SIZE_BUCKETS = (
+    128, 512, 2_048, 8_192, 32_768, 131_072, 524_288, 2_097_152, 8_388_608
+)
+
+Labels = tuple[tuple[str, str], ...]
+# Returns (metric name, help text, type, labels, value) samples, where the type
+# is "gauge", or "counter" for values that only ever go up.
+Collector = Callable[[], Iterable[tuple[str, str, str, dict[str, str], float]]]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value without losing precision, e.g. for large counters."""
+    if isinstance(value, int):
+        return str(int(value))
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+def _format_labels(labels: Labels, extra: tuple[str, str] | None = None) -> str:
+    pairs = list(labels) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in pairs) + "}"
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus sense."""
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def lines(self, name: str, labels: Labels) -> list[str]:
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            le = _format_labels(labels, ("le", _format_value(bound)))
+            lines.append(f"{name}_bucket{le} {cumulative}")
+        le = _format_labels(labels, ("le", "+Inf"))
+        lines.append(f"{name}_bucket{le} {self.count}")
+        lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(self.sum)}")
+        lines.append(f"{name}_count{_format_labels(labels)} {self.count}")
+        return lines
+
+
+class MetricsRegistry:
+    """In-process histograms and gauge collectors, rendered for Prometheus."""
+
+    def __init__(self, sample_rate: float = SAMPLE_RATE):
+        self.sample_rate = sample_rate
+        self._histograms: dict[str, tuple[str, tuple[float, ...], dict]] = {}
+        self._collectors: list[Collector] = []
+        self._lock = threading.Lock()
+
+    def sampled(self) -> bool:
+        """Decide whether to record the current event."""
+        return self.sample_rate >= 1.0 or random.random() < self.sample_rate
+
+    def histogram(self, name: str, help_text: str, buckets: tuple[float, ...]):
+        with self._lock:
+            self._histograms.setdefault(name, (help_text, buckets, {}))
+
+    def observe(self, name: str, value: float, **labels: str):
+        help_text, buckets, series = self._histograms[name]
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = Histogram(buckets)
+            histogram.observe(value)
+
+    def add_collector(self, collector: Collector):
+        """Register a callable that reports gauges and counters at scrape time."""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        """Return every metric in the Prometheus text exposition format."""
+        lines = []
+        with self._lock:
+            for name, (help_text, _, series) in self._histograms.items():
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} histogram")
+                for labels, histogram in series.items():
+                    lines.extend(histogram.lines(name, labels))
+        described = set()
+        for collector in self._collectors:
+            for name, help_text, kind, labels, value in collector():
+                if name not in described:
+                    described.add(name)
+                    lines.append(f"# HELP {name} {help_text}")
+                    lines.append(f"# TYPE {name} {kind}")
+                label_text = _format_labels(tuple(sorted(labels.items())))
+                lines.append(f"{name}{label_text} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+registry.histogram(
+    "forms_event_handler_seconds",
+    "Time from receiving an event to its final state update.",
+    LATENCY_BUCKETS,
+)
+registry.histogram(
+    "forms_event_delta_bytes",
+    "Serialized size of the state deltas an event sends to the client.",
+    SIZE_BUCKETS,
+)
+registry.histogram(
+    "forms_state_var_bytes",
+    "Serialized size of large state vars after an event touching their state.",
+    SIZE_BUCKETS,
+)
@@ -0,0 +1,100 @@
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from app.models import Form, PublishedForm
+
+DEFAULT_SNAPSHOT_CACHE_SIZE = 1_000
+# How long a worker trusts its idea of which version is current. Publishing
+# in the same process updates it at once; other workers catch up within this.
+CURRENT_VERSION_TTL_SECONDS = float(
+    os.environ.get("FORMS_PUBLISHED_VERSION_TTL", "5.0")
+)
+
+
+class FormSnapshot:
+    """One published version of a form, parsed and rendered once.
+
+    Snapshots are shared by every visitor and must be treated as read-only.
+    `body` is the JSON of `view`, and `etag` a strong validator for it.
+    """
+
+    __slots__ = ("form", "view", "body", "etag")
+
+    def __init__(self, form: Form):
+        self.form = form
+        self.view = PublishedForm.from_form(form)
+        self.body = self.view.model_dump_json().encode()
+        self.etag = f'"{hashlib.sha256(self.body).hexdigest()[:32]}"'
+
+    @property
+    def key(self) -> tuple[str, int]:
+        return self.form.id, self.form.version
+
+
+class SnapshotCache:
+    """LRU of form snapshots keyed by form id and published version."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_SNAPSHOT_CACHE_SIZE,
+        current_ttl: float = CURRENT_VERSION_TTL_SECONDS,
+    ):
+        self.max_entries = max_entries
+        self.current_ttl = current_ttl
+        self._entries: OrderedDict[tuple[str, int], FormSnapshot] = OrderedDict()
+        # form id -> (expires at, current published version)
+        self._current: dict[str, tuple[float, int]] = {}
+        self._lock = threading.Lock()
+        self.builds = 0
+        self.hits = 0
+
+    def get(self, form_id: str, version: int | None = None) -> FormSnapshot | None:
+        """Return a cached snapshot, by default of the form's current version."""
+        with self._lock:
+            if version is None:
+                current = self._current.get(form_id)
+                if current is None or current[0] < time.monotonic():
+                    return None
+                version = current[1]
+            snapshot = self._entries.get((form_id, version))
+            if snapshot is None:
+                return None
+            self._entries.move_to_end((form_id, version))
+            self.hits += 1
+            return snapshot
+
+    def put(self, form: Form) -> FormSnapshot:
+        """Snapshot a published form, returning the cached one if already built."""
+        snapshot = FormSnapshot(form)
+        with self._lock:
+            self.builds += 1
+            snapshot = self._entries.setdefault(snapshot.key, snapshot)
+            self._entries.move_to_end(snapshot.key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return snapshot
+
+    def set_current(self, form_id: str, version: int):
+        """Record which version of a form to serve for the next TTL."""
+        with self._lock:
+            now = time.monotonic()
+            self._current[form_id] = (now + self.current_ttl, version)
+            if len(self._current) > self.max_entries:
+                self._current = {
+                    key: entry
+                    for key, entry in self._current.items()
+                    if entry[0] >= now
+                }
+
+    def invalidate(self, form_id: str):
+        """Forget every snapshot of a form, e.g. after it is deleted."""
+        with self._lock:
+            self._current.pop(form_id, None)
+            for key in [key for key in self._entries if key[0] == form_id]:
+                del self._entries[key]
+
+    def stats(self) -> dict[str, int]:
+        return {"builds": self.builds, "hits": self.hits, "size": len(self._entries)}
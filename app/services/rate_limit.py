@@ -0,0 +1,177 @@
+import os
+import threading
+import time
+
+# Defaults for forms that do not set their own limits, in submissions per minute.
+DEFAULT_FORM_PER_MINUTE = int(os.environ.get("FORMS_SUBMIT_FORM_PER_MINUTE", "600"))
+DEFAULT_CLIENT_PER_MINUTE = int(os.environ.get("FORMS_SUBMIT_CLIENT_PER_MINUTE", "10"))
+# A full bucket allows this many seconds' worth of submissions at once, and
+# never fewer than MIN_BURST.
+BURST_SECONDS = float(os.environ.get("FORMS_SUBMIT_BURST_SECONDS", "10"))
+MIN_BURST = 3
+MAX_IN_FLIGHT = int(os.environ.get("FORMS_SUBMIT_MAX_IN_FLIGHT", "64"))
+MAX_TRACKED_KEYS = 50_000
+# Socket peer addresses of reverse proxies whose X-Forwarded-For is trusted,
+# comma separated. With none, clients are told apart by their own address.
+TRUSTED_PROXIES = frozenset(
+    address.strip()
+    for address in os.environ.get("FORMS_TRUSTED_PROXIES", "").split(",")
+    if address.strip()
+)
+
+
+def client_address(
+    peer: str, forwarded_for: str = "", trusted_proxies: frozenset = TRUSTED_PROXIES
+) -> str:
+    """Return the address to rate limit a client by.
+
+    Clients can send any X-Forwarded-For they like, so it is only read when
+    the socket peer is a trusted proxy, and then from the right: the first
+    address not added by a trusted proxy is the client's.
+    """
+    if peer not in trusted_proxies:
+        return peer
+    for address in reversed(forwarded_for.split(",")):
+        address = address.strip()
+        if address and address not in trusted_proxies:
+            return address
+    return peer
+
+
+class TokenBucketLimiter:
+    """Token buckets for many keys, each stored as a single float.
+
+    A bucket is kept as the time at which it will be full again (the
+    generic cell rate algorithm), which is equivalent to a token count and
+    a last-refill time. A bucket whose time has passed is full, so it can be
+    forgotten; once more than `max_keys` buckets are tracked, full buckets
+    are swept and then the least recently used are dropped. Dropping a
+    bucket can only ever let its key through sooner, never later.
+    """
+
+    def __init__(self, max_keys: int = MAX_TRACKED_KEYS):
+        self.max_keys = max_keys
+        # key -> time the bucket is full again, in least recently used order
+        self._full_at: dict[str, float] = {}
+        self._lock = threading.Lock()
+        self.allowed = 0
+        self.rejected = 0
+        self.evicted = 0
+
+    def allow(
+        self, key: str, per_second: float, burst: float, now: float | None = None
+    ) -> bool:
+        """Take one token from `key`'s bucket, returning False if it is empty."""
+        if now is None:
+            now = time.monotonic()
+        interval = 1 / per_second
+        with self._lock:
+            full_at = max(self._full_at.pop(key, now), now)
+            if full_at - now > (burst - 1) * interval:
+                # Empty: keep the bucket as it was.
+                self._full_at[key] = full_at
+                self.rejected += 1
+                return False
+            self._full_at[key] = full_at + interval
+            if len(self._full_at) > self.max_keys:
+                self._shrink(now)
+            self.allowed += 1
+            return True
+
+    def _shrink(self, now: float):
+        full = [key for key, full_at in self._full_at.items() if full_at <= now]
+        for key in full:
+            del self._full_at[key]
+        # Evict down to 90% so the sweep is not repeated on every call.
+        excess = len(self._full_at) - int(self.max_keys * 0.9)
+        if excess > 0:
+            for key in list(self._full_at)[:excess]:
+                del self._full_at[key]
+            self.evicted += excess
+
+    def __len__(self) -> int:
+        return len(self._full_at)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "allowed": self.allowed,
+            "rejected": self.rejected,
+            "evicted": self.evicted,
+            "keys": len(self._full_at),
+        }
+
+
+class ConcurrencyLimiter:
+    """Caps work in flight, turning excess away at once instead of queueing it."""
+
+    def __init__(self, max_in_flight: int = MAX_IN_FLIGHT):
+        self.max_in_flight = max_in_flight
+        self.in_flight = 0
+        self.shed = 0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> bool:
+        """Take a slot if one is free; a taken slot must be `release`d."""
+        with self._lock:
+            if self.in_flight < self.max_in_flight:
+                self.in_flight += 1
+                return True
+            self.shed += 1
+            return False
+
+    def release(self):
+        with self._lock:
+            self.in_flight -= 1
+
+    def stats(self) -> dict[str, int]:
+        return {"in_flight": self.in_flight, "shed": self.shed}
+
+
+def _bucket(per_minute: int) -> tuple[float, float]:
+    per_second = per_minute / 60
+    return per_second, max(MIN_BURST, per_second * BURST_SECONDS)
+
+
+class SubmissionLimiter:
+    """Rate limits per form and per client, plus a cap on submissions in flight."""
+
+    def __init__(
+        self,
+        max_keys: int = MAX_TRACKED_KEYS,
+        max_in_flight: int = MAX_IN_FLIGHT,
+    ):
+        self.forms = TokenBucketLimiter(max_keys)
+        self.clients = TokenBucketLimiter(max_keys)
+        self.concurrency = ConcurrencyLimiter(max_in_flight)
+
+    def allow(
+        self,
+        form_id: str,
+        client_id: str,
+        form_per_minute: int | None = None,
+        client_per_minute: int | None = None,
+        now: float | None = None,
+    ) -> bool:
+        """Whether a client may submit a form now; None limits use the defaults.
+
+        The client is checked first, so one noisy client cannot use up the
+        form's budget for everybody else.
+        """
+        client_rate = client_per_minute or DEFAULT_CLIENT_PER_MINUTE
+        form_rate = form_per_minute or DEFAULT_FORM_PER_MINUTE
+        # Client buckets are per form, so a limit set on one form is not
+        # spent by submissions to another.
+        return self.clients.allow(
+            f"{form_id}:{client_id}", *_bucket(client_rate), now=now
+        ) and self.forms.allow(form_id, *_bucket(form_rate), now=now)
+
+    def stats(self) -> dict[str, int]:
+        stats = {f"form_{key}": value for key, value in self.forms.stats().items()}
+        stats.update(
+            (f"client_{key}", value) for key, value in self.clients.stats().items()
+        )
+        stats.update(self.concurrency.stats())
+        return stats
+
+
+submission_limiter = SubmissionLimiter()
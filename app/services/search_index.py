@@ -0,0 +1,193 @@
+import bisect
+import heapq
+import re
+import threading
+from typing import Callable
+
+from app.models import Form
+
+TOKEN_PATTERN = re.compile(r"\w+")
+DEFAULT_RESULT_LIMIT = 48
+# Terms past this many are ignored, bounding the work one query can cause.
+MAX_QUERY_TERMS = 8
+
+# How much a term counts towards a form's score, by where it was found.
+TITLE_WEIGHT = 8
+FIELD_LABEL_WEIGHT = 3
+DESCRIPTION_WEIGHT = 2
+OPTION_LABEL_WEIGHT = 1
+
+
+def tokenize(text: str) -> list[str]:
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def form_terms(form: Form) -> dict[str, int]:
+    """Return every term in a form's searchable text with its best weight."""
+    terms: dict[str, int] = {}
+
+    def add(text: str, weight: int):
+        for token in tokenize(text):
+            if terms.get(token, 0) < weight:
+                terms[token] = weight
+
+    add(form.title, TITLE_WEIGHT)
+    add(form.description, DESCRIPTION_WEIGHT)
+    for field in form.fields:
+        add(field.label, FIELD_LABEL_WEIGHT)
+        for option in getattr(field, "options", ()):
+            add(option.label, OPTION_LABEL_WEIGHT)
+    return terms
+
+
+class _OwnerIndex:
+    def __init__(self):
+        # term -> weight -> ids of forms where the term's best weight is that.
+        self.postings: dict[str, dict[int, set[str]]] = {}
+        # Sorted vocabulary, so a prefix maps to one contiguous slice.
+        self.vocabulary: list[str] = []
+        self.form_terms: dict[str, dict[str, int]] = {}
+
+    def add(self, form_id: str, terms: dict[str, int]):
+        self.remove(form_id)
+        for term, weight in terms.items():
+            postings = self.postings.get(term)
+            if postings is None:
+                postings = self.postings[term] = {}
+                bisect.insort(self.vocabulary, term)
+            postings.setdefault(weight, set()).add(form_id)
+        self.form_terms[form_id] = terms
+
+    def remove(self, form_id: str):
+        for term, weight in self.form_terms.pop(form_id, {}).items():
+            postings = self.postings[term]
+            postings[weight].discard(form_id)
+            if not postings[weight]:
+                del postings[weight]
+            if not postings:
+                del self.postings[term]
+                del self.vocabulary[bisect.bisect_left(self.vocabulary, term)]
+
+    def prefix_scores(self, prefix: str) -> dict[str, int]:
+        """Map each form matching `prefix` to its best score level for it.
+
+        Levels are doubled weights, plus one where the term matched exactly.
+        """
+        scores: dict[str, int] = {}
+        start = bisect.bisect_left(self.vocabulary, prefix)
+        for term in self.vocabulary[start:]:
+            if not term.startswith(prefix):
+                break
+            bonus = 1 if term == prefix else 0
+            for weight, form_ids in self.postings[term].items():
+                level = 2 * weight + bonus
+                for form_id in form_ids:
+                    if scores.get(form_id, -1) < level:
+                        scores[form_id] = level
+        return scores
+
+
+class FormSearchIndex:
+    """In-memory inverted index over form titles, descriptions and labels.
+
+    Each owner's index is built from storage on their first search and kept
+    current by the repository's writes from then on. Every query term is
+    matched as a prefix, so results can be shown while the user types.
+    """
+
+    def __init__(self):
+        self._owners: dict[str, _OwnerIndex] = {}
+        self._form_owners: dict[str, str] = {}
+        # Per owner whose index is being built: writes made meanwhile, by form
+        # id, with None for a removal. They are applied over the loaded forms.
+        self._pending: dict[str, dict[str, dict[str, int] | None]] = {}
+        self._build_locks: dict[str, threading.Lock] = {}
+        self._lock = threading.RLock()
+
+    def index(self, form: Form, owner_id: str):
+        """Add or replace a form, if its owner's index has been built."""
+        terms = form_terms(form)
+        with self._lock:
+            owner_index = self._owners.get(owner_id)
+            if owner_index is not None:
+                owner_index.add(form.id, terms)
+                self._form_owners[form.id] = owner_id
+            elif owner_id in self._pending:
+                self._pending[owner_id][form.id] = terms
+
+    def remove(self, form_id: str):
+        with self._lock:
+            owner_id = self._form_owners.pop(form_id, None)
+            if owner_id is not None:
+                self._owners[owner_id].remove(form_id)
+            for pending in self._pending.values():
+                pending[form_id] = None
+
+    def _owner_index(
+        self, owner_id: str, load_forms: Callable[[str], list[Form]]
+    ) -> _OwnerIndex:
+        with self._lock:
+            owner_index = self._owners.get(owner_id)
+            if owner_index is not None:
+                return owner_index
+            build_lock = self._build_locks.setdefault(owner_id, threading.Lock())
+        # One build per owner at a time; other owners' searches and every
+        # write carry on while this owner's forms load from storage.
+        with build_lock:
+            with self._lock:
+                owner_index = self._owners.get(owner_id)
+                if owner_index is not None:
+                    return owner_index
+                self._pending[owner_id] = {}
+            try:
+                owner_index = _OwnerIndex()
+                for form in load_forms(owner_id):
+                    owner_index.add(form.id, form_terms(form))
+            finally:
+                with self._lock:
+                    pending = self._pending.pop(owner_id)
+                    self._build_locks.pop(owner_id, None)
+            with self._lock:
+                for form_id, terms in pending.items():
+                    if terms is None:
+                        owner_index.remove(form_id)
+                    else:
+                        owner_index.add(form_id, terms)
+                for form_id in owner_index.form_terms:
+                    self._form_owners[form_id] = owner_id
+                self._owners[owner_id] = owner_index
+            return owner_index
+
+    def search(
+        self,
+        owner_id: str,
+        query: str,
+        load_forms: Callable[[str], list[Form]],
+        limit: int = DEFAULT_RESULT_LIMIT,
+    ) -> list[str]:
+        """Return ids of the owner's forms matching every query term, best first.
+
+        A form's score is the sum of its best level for each term; ties are
+        broken by id. Only the first `MAX_QUERY_TERMS` distinct terms count.
+        """
+        terms = list(dict.fromkeys(tokenize(query)))[:MAX_QUERY_TERMS]
+        if not terms:
+            return []
+        owner_index = self._owner_index(owner_id, load_forms)
+        with self._lock:
+            scores = owner_index.prefix_scores(terms[0])
+            for term in terms[1:]:
+                if not scores:
+                    break
+                term_scores = owner_index.prefix_scores(term)
+                scores = {
+                    form_id: score + term_scores[form_id]
+                    for form_id, score in scores.items()
+                    if form_id in term_scores
+                }
+        return [
+            form_id
+            for _, form_id in heapq.nsmallest(
+                limit, ((-score, form_id) for form_id, score in scores.items())
+            )
+        ]
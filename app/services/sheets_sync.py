@@ -0,0 +1,248 @@
+import asyncio
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable
+
+from app.models import Form, Submission
+from app.services.export_sinks import (
+    SUBMISSION_ID_COLUMN,
+    SUBMITTED_AT_COLUMN,
+    ExportMetrics,
+    column_headers,
+    sink_metrics,
+    submission_values,
+)
+
+DEFAULT_FLUSH_SIZE = int(os.environ.get("SHEETS_FLUSH_SIZE", "100"))
+DEFAULT_FLUSH_INTERVAL_SECONDS = float(os.environ.get("SHEETS_FLUSH_INTERVAL", "5.0"))
+# Rows held across every form while Sheets is unreachable; the oldest are
+# dropped beyond this, and counted in `metrics.records_dropped`.
+DEFAULT_MAX_BUFFERED_ROWS = int(os.environ.get("SHEETS_MAX_BUFFERED_ROWS", "10000"))
+
+# Anything with gspread's `row_values`, `update` and `append_rows` methods.
+Worksheet = Any
+WorksheetFactory = Callable[[Form], Worksheet]
+
+
+def gspread_worksheet_factory(
+    service_account_file: str, spreadsheet_key: str
+) -> WorksheetFactory:
+    """Open one worksheet per form, named after the form id, in a spreadsheet."""
+    import gspread
+
+    spreadsheet = gspread.service_account(filename=service_account_file).open_by_key(
+        spreadsheet_key
+    )
+
+    def open_worksheet(form: Form) -> Worksheet:
+        try:
+            return spreadsheet.worksheet(form.id)
+        except gspread.WorksheetNotFound:
+            return spreadsheet.add_worksheet(
+                form.id, rows=1000, cols=len(form.fields) + 2
+            )
+
+    return open_worksheet
+
+
+class _FormBuffer:
+    def __init__(self, form: Form, layout: tuple[tuple[str, str], ...]):
+        self.form = form
+        self.layout = layout
+        self.submissions: list[Submission] = []
+        self.first_added_at = 0.0
+
+
+class SheetsSyncSink:
+    """Buffers submissions and appends them to Google Sheets in bulk.
+
+    Each form gets its own worksheet. Header columns are reconciled once per
+    form layout, and buffered rows are written with a single `append_rows`
+    call when the buffer fills up or the flush interval elapses.
+    """
+
+    def __init__(
+        self,
+        worksheet_factory: WorksheetFactory,
+        flush_size: int = DEFAULT_FLUSH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        max_buffered: int = DEFAULT_MAX_BUFFERED_ROWS,
+        metrics: ExportMetrics | None = None,
+    ):
+        self.worksheet_factory = worksheet_factory
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.max_buffered = max_buffered
+        self.metrics = metrics or sink_metrics("sheets")
+        # Keyed by (form id, layout) so rows collected under an older layout
+        # are written with the header mapping they were collected for.
+        self._buffers: dict[tuple[str, tuple], _FormBuffer] = {}
+        self._buffered = 0
+        self._overflowing = False
+        self._worksheets: dict[str, Worksheet] = {}
+        # Per form: the layout the header row was last reconciled against and
+        # the header row itself.
+        self._headers: dict[str, tuple[tuple[tuple[str, str], ...], list[str]]] = {}
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._flusher: asyncio.Task | None = None
+
+    @classmethod
+    def from_env(cls) -> "SheetsSyncSink | None":
+        """Build a sink from GOOGLE_* environment variables, if they are set."""
+        service_account_file = os.environ.get("GOOGLE_SERVICE_ACCOUNT_FILE")
+        spreadsheet_key = os.environ.get("GOOGLE_SHEETS_SPREADSHEET_KEY")
+        if not service_account_file or not spreadsheet_key:
+            return None
+        return cls(gspread_worksheet_factory(service_account_file, spreadsheet_key))
+
+    def add(self, form: Form, submission: Submission) -> bool:
+        """Buffer a submission, returning whether its form's buffer is due a flush."""
+        layout = tuple(column_headers(form))
+        with self._lock:
+            buffer = self._buffers.get((form.id, layout))
+            if buffer is None:
+                buffer = self._buffers[(form.id, layout)] = _FormBuffer(form, layout)
+            if not buffer.submissions:
+                buffer.first_added_at = time.monotonic()
+            buffer.submissions.append(submission)
+            self._buffered += 1
+            self._drop_oldest()
+            return len(buffer.submissions) >= self.flush_size
+
+    def _drop_oldest(self):
+        """Drop the oldest buffered rows beyond `max_buffered`; hold `_lock`."""
+        excess = self._buffered - self.max_buffered
+        if excess <= 0:
+            self._overflowing = False
+            return
+        if not self._overflowing:
+            self._overflowing = True
+            logging.warning(
+                "Google Sheets sync buffer is full at %d rows; dropping the oldest",
+                self.max_buffered,
+            )
+        while excess > 0:
+            key, buffer = min(
+                self._buffers.items(), key=lambda item: item[1].first_added_at
+            )
+            dropped = min(excess, len(buffer.submissions))
+            del buffer.submissions[:dropped]
+            if not buffer.submissions:
+                del self._buffers[key]
+            excess -= dropped
+            self._buffered -= dropped
+            self.metrics.records_dropped += dropped
+
+    def _take_due(self, force: bool) -> list[_FormBuffer]:
+        now = time.monotonic()
+        due = []
+        with self._lock:
+            for key, buffer in list(self._buffers.items()):
+                if buffer.submissions and (
+                    force
+                    or len(buffer.submissions) >= self.flush_size
+                    or now - buffer.first_added_at >= self.flush_interval
+                ):
+                    due.append(buffer)
+                    del self._buffers[key]
+                    self._buffered -= len(buffer.submissions)
+        return due
+
+    def _header_row(self, worksheet: Worksheet, buffer: _FormBuffer) -> list[str]:
+        cached = self._headers.get(buffer.form.id)
+        if cached is not None and cached[0] == buffer.layout:
+            return cached[1]
+        headers = list(worksheet.row_values(1))
+        wanted = [SUBMISSION_ID_COLUMN, SUBMITTED_AT_COLUMN] + [
+            header for _, header in buffer.layout
+        ]
+        missing = [header for header in wanted if header not in headers]
+        if missing:
+            headers.extend(missing)
+            worksheet.update(values=[headers], range_name="A1")
+        self._headers[buffer.form.id] = (buffer.layout, headers)
+        return headers
+
+    def _write(self, buffer: _FormBuffer):
+        worksheet = self._worksheets.get(buffer.form.id)
+        if worksheet is None:
+            worksheet = self._worksheets[buffer.form.id] = self.worksheet_factory(
+                buffer.form
+            )
+        headers = self._header_row(worksheet, buffer)
+        columns = list(buffer.layout)
+        rows = []
+        for submission in buffer.submissions:
+            values = submission_values(columns, submission)
+            rows.append([values.get(header, "") for header in headers])
+        worksheet.append_rows(rows, value_input_option="USER_ENTERED")
+        self.metrics.batches_sent += 1
+        self.metrics.records_exported += len(rows)
+
+    def flush(self, force: bool = True):
+        """Write buffered rows; with `force=False` only buffers that are due."""
+        with self._write_lock:
+            for buffer in self._take_due(force):
+                self.metrics.batches_in_flight += 1
+                try:
+                    self._write(buffer)
+                except Exception:
+                    logging.exception("Error syncing submissions to Google Sheets")
+                    self._requeue(buffer)
+                finally:
+                    self.metrics.batches_in_flight -= 1
+
+    def _requeue(self, buffer: _FormBuffer):
+        with self._lock:
+            key = (buffer.form.id, buffer.layout)
+            current = self._buffers.get(key)
+            if current is None:
+                self._buffers[key] = buffer
+            else:
+                current.submissions[:0] = buffer.submissions
+                current.first_added_at = buffer.first_added_at
+            self._buffered += len(buffer.submissions)
+            self._drop_oldest()
+        self.metrics.retries += 1
+
+    async def add_async(self, form: Form, submission: Submission):
+        """Buffer a submission and make sure a periodic flusher is running."""
+        if self.add(form, submission):
+            await asyncio.to_thread(self.flush, False)
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.get_running_loop().create_task(self._flush_loop())
+
+    async def _flush_loop(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            with self._lock:
+                if not self._buffers:
+                    return
+            await asyncio.to_thread(self.flush, False)
+
+
+_sink: SheetsSyncSink | None = None
+_sink_loaded = False
+_sink_lock = threading.Lock()
+
+
+def get_sheets_sync() -> SheetsSyncSink | None:
+    """Return the process-wide Sheets sink, or None when Sheets is not configured."""
+    global _sink, _sink_loaded
+    if not _sink_loaded:
+        with _sink_lock:
+            if not _sink_loaded:
+                _sink = SheetsSyncSink.from_env()
+                _sink_loaded = True
+    return _sink
+
+
+def set_sheets_sync(sink: SheetsSyncSink | None) -> None:
+    """Swap in a different Sheets sink, e.g. one backed by a fake worksheet."""
+    global _sink, _sink_loaded
+    with _sink_lock:
+        _sink = sink
+        _sink_loaded = True
@@ -0,0 +1,75 @@
+import csv
+import io
+import json
+import zlib
+from typing import Iterable, Iterator
+
+from app.models import Form
+from app.services.export_sinks import (
+    SUBMISSION_ID_COLUMN,
+    SUBMITTED_AT_COLUMN,
+    column_headers,
+    submission_values,
+)
+from app.services.submission_store import SubmissionStore, get_submission_store
+
+DEFAULT_CHUNK_SIZE = 1000
+
+
+def _iter_pages(form: Form, store: SubmissionStore, chunk_size: int):
+    cursor = None
+    while True:
+        page = store.page(form.id, cursor, chunk_size)
+        if page.items:
+            yield page.items
+        if page.next_cursor is None:
+            return
+        cursor = page.next_cursor
+
+
+def iter_csv(
+    form: Form,
+    store: SubmissionStore | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[bytes]:
+    """Stream a form's submissions as CSV, one chunk of rows at a time."""
+    store = store or get_submission_store()
+    columns = column_headers(form)
+    headers = [SUBMISSION_ID_COLUMN, SUBMITTED_AT_COLUMN] + [h for _, h in columns]
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(headers)
+    for submissions in _iter_pages(form, store, chunk_size):
+        for submission in submissions:
+            values = submission_values(columns, submission)
+            writer.writerow([values.get(header, "") for header in headers])
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def iter_ndjson(
+    form: Form,
+    store: SubmissionStore | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[bytes]:
+    """Stream a form's submissions as newline-delimited JSON objects."""
+    store = store or get_submission_store()
+    columns = column_headers(form)
+    for submissions in _iter_pages(form, store, chunk_size):
+        yield "".join(
+            json.dumps(submission_values(columns, submission)) + "\n"
+            for submission in submissions
+        ).encode()
+
+
+def gzip_chunks(chunks: Iterable[bytes], level: int = 6) -> Iterator[bytes]:
+    """Gzip a byte stream on the fly without buffering it whole."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
@@ -0,0 +1,38 @@
+from typing import Any, Callable
+
+from app.models import Form, Submission
+from app.services.delivery_queue import get_delivery_queue
+from app.services.sheets_sync import get_sheets_sync
+from app.services.submission_store import get_submission_store
+
+
+async def store_submission(form: Form, form_data: dict[str, Any]):
+    """Persist a submission, then queue its exports as separate jobs."""
+    submission = await get_submission_store().append_async(form.id, form_data)
+    sheets = get_sheets_sync()
+    if sheets is not None:
+        # The submission is already stored, so a full queue must not lose
+        # its export silently.
+        await get_delivery_queue().enqueue_or_dead_letter(
+            "sheets_sync", sync_to_sheets, form, submission
+        )
+
+
+async def sync_to_sheets(form: Form, submission: Submission):
+    sheets = get_sheets_sync()
+    if sheets is not None:
+        await sheets.add_async(form, submission)
+
+
+def enqueue_submission(
+    form: Form,
+    form_data: dict[str, Any],
+    on_stored: Callable[[], None] | None = None,
+) -> bool:
+    """Hand a submission to the delivery queue, returning False under backpressure.
+
+    `on_stored` runs once the submission is stored or has been dead-lettered.
+    """
+    return get_delivery_queue().enqueue(
+        "store_submission", store_submission, form, form_data, on_done=on_stored
+    )
@@ -0,0 +1,277 @@
+import asyncio
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import Counter
+from concurrent.futures import Future
+from typing import Any
+
+from app.models import Submission, SubmissionPage
+from app.services.sqlite_pool import SQLiteConnectionPool
+
+DEFAULT_DB_PATH = os.environ.get("SUBMISSIONS_DB_PATH", "submissions.db")
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 1000
+
+
+class SubmissionStore(ABC):
+    """Append-only storage for form submissions."""
+
+    @abstractmethod
+    def append(self, form_id: str, data: dict[str, Any]) -> Submission:
+        """Durably store a submission and return it once it is on disk."""
+
+    async def append_async(self, form_id: str, data: dict[str, Any]) -> Submission:
+        """Store a submission without blocking the event loop."""
+        return await asyncio.to_thread(self.append, form_id, data)
+
+    @abstractmethod
+    def page(
+        self, form_id: str, cursor: str | None = None, limit: int = DEFAULT_PAGE_SIZE
+    ) -> SubmissionPage:
+        """Return submissions for a form in arrival order, starting after `cursor`."""
+
+    @abstractmethod
+    def count(self, form_id: str) -> int:
+        """Return the number of submissions stored for a form."""
+
+    def counts(self, form_ids: list[str]) -> dict[str, int]:
+        """Return submission counts for several forms at once."""
+        return {form_id: self.count(form_id) for form_id in form_ids}
+
+    def cursor_after(self, submission: Submission) -> str:
+        """Return the cursor that resumes paging right after `submission`."""
+        return str(submission.seq)
+
+
+class SQLiteSubmissionStore(SubmissionStore):
+    """Stores submissions in a WAL-mode SQLite log with group commit.
+
+    Appends from every handler go through one writer thread, which commits
+    whatever has queued up in a single transaction, so one fsync covers a
+    whole batch of submissions.
+    """
+
+    def __init__(
+        self,
+        path: str = DEFAULT_DB_PATH,
+        pool_size: int = 4,
+        max_batch: int = 512,
+        commit_interval: float = 0.002,
+    ):
+        self.pool = SQLiteConnectionPool(path, size=pool_size + 1)
+        self.max_batch = max_batch
+        self.commit_interval = commit_interval
+        self._pending: queue.Queue[tuple[Submission, Future] | None] = queue.Queue()
+        self._writer: threading.Thread | None = None
+        self._writer_lock = threading.Lock()
+        with self.pool.connection() as conn:
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS submissions (
+                    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                    id TEXT NOT NULL UNIQUE,
+                    form_id TEXT NOT NULL,
+                    data TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS submissions_form_idx
+                    ON submissions (form_id, seq);
+                CREATE TABLE IF NOT EXISTS submission_counts (
+                    form_id TEXT PRIMARY KEY,
+                    count INTEGER NOT NULL
+                );
+                """
+            )
+            # Stores created before counts were kept get them backfilled once.
+            has_counts = conn.execute("SELECT 1 FROM submission_counts LIMIT 1")
+            if has_counts.fetchone() is None:
+                conn.execute(
+                    """
+                    INSERT INTO submission_counts (form_id, count)
+                    SELECT form_id, COUNT(*) FROM submissions GROUP BY form_id
+                    """
+                )
+
+    def _ensure_writer(self):
+        if self._writer is None or not self._writer.is_alive():
+            with self._writer_lock:
+                if self._writer is None or not self._writer.is_alive():
+                    self._writer = threading.Thread(
+                        target=self._write_loop, name="submission-writer", daemon=True
+                    )
+                    self._writer.start()
+
+    def _next_batch(self) -> tuple[list[tuple[Submission, Future]], bool]:
+        batch = []
+        item = self._pending.get()
+        deadline = time.monotonic() + self.commit_interval
+        while item is not None:
+            batch.append(item)
+            if len(batch) >= self.max_batch:
+                return batch, False
+            timeout = deadline - time.monotonic()
+            try:
+                item = (
+                    self._pending.get(timeout=timeout)
+                    if timeout > 0
+                    else self._pending.get_nowait()
+                )
+            except queue.Empty:
+                return batch, False
+        return batch, True
+
+    def _write_loop(self):
+        with self.pool.connection() as conn:
+            conn.execute("PRAGMA synchronous=FULL")
+            stopping = False
+            while not stopping:
+                batch, stopping = self._next_batch()
+                if not batch:
+                    continue
+                rows = []
+                serialized = []
+                for submission, future in batch:
+                    # A submission that cannot be stored fails on its own,
+                    # never the writer thread or the rest of the batch.
+                    try:
+                        data = json.dumps(submission.data)
+                    except (TypeError, ValueError) as exc:
+                        future.set_exception(exc)
+                        continue
+                    rows.append(
+                        (submission.id, submission.form_id, data, submission.created_at)
+                    )
+                    serialized.append((submission, future))
+                batch = serialized
+                if not batch:
+                    continue
+                try:
+                    conn.execute("BEGIN IMMEDIATE")
+                    try:
+                        conn.executemany(
+                            """
+                            INSERT INTO submissions (id, form_id, data, created_at)
+                            VALUES (?, ?, ?, ?)
+                            """,
+                            rows,
+                        )
+                        # The single writer connection gets consecutive rowids
+                        # for every row inserted in this transaction.
+                        (last_seq,) = conn.execute(
+                            "SELECT last_insert_rowid()"
+                        ).fetchone()
+                        conn.executemany(
+                            """
+                            INSERT INTO submission_counts (form_id, count)
+                            VALUES (?, ?)
+                            ON CONFLICT (form_id) DO UPDATE SET
+                                count = count + excluded.count
+                            """,
+                            Counter(row[1] for row in rows).items(),
+                        )
+                        conn.execute("COMMIT")
+                    except BaseException:
+                        conn.execute("ROLLBACK")
+                        raise
+                except Exception as exc:
+                    logging.exception("Error writing submission batch")
+                    for _, future in batch:
+                        future.set_exception(exc)
+                    continue
+                first_seq = last_seq - len(batch) + 1
+                for offset, (submission, future) in enumerate(batch):
+                    submission.seq = first_seq + offset
+                    future.set_result(submission)
+
+    def append(self, form_id: str, data: dict[str, Any]) -> Submission:
+        return self.append_nowait(form_id, data).result()
+
+    def append_nowait(self, form_id: str, data: dict[str, Any]) -> Future:
+        """Queue a submission, returning a future resolved once it is committed."""
+        self._ensure_writer()
+        submission = Submission(form_id=form_id, data=data, created_at=time.time())
+        future: Future = Future()
+        self._pending.put((submission, future))
+        return future
+
+    async def append_async(self, form_id: str, data: dict[str, Any]) -> Submission:
+        return await asyncio.wrap_future(self.append_nowait(form_id, data))
+
+    def page(
+        self, form_id: str, cursor: str | None = None, limit: int = DEFAULT_PAGE_SIZE
+    ) -> SubmissionPage:
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+        after = int(cursor) if cursor else 0
+        with self.pool.connection() as conn:
+            rows = conn.execute(
+                """
+                SELECT seq, id, data, created_at FROM submissions
+                WHERE form_id = ? AND seq > ?
+                ORDER BY seq
+                LIMIT ?
+                """,
+                (form_id, after, limit),
+            ).fetchall()
+        items = [
+            Submission(
+                id=submission_id,
+                form_id=form_id,
+                data=json.loads(data),
+                created_at=created_at,
+                seq=seq,
+            )
+            for seq, submission_id, data, created_at in rows
+        ]
+        next_cursor = self.cursor_after(items[-1]) if len(items) == limit else None
+        return SubmissionPage(items=items, next_cursor=next_cursor)
+
+    def count(self, form_id: str) -> int:
+        return self.counts([form_id])[form_id]
+
+    def counts(self, form_ids: list[str]) -> dict[str, int]:
+        counts = dict.fromkeys(form_ids, 0)
+        with self.pool.connection() as conn:
+            for start in range(0, len(form_ids), 500):
+                chunk = form_ids[start : start + 500]
+                placeholders = ", ".join("?" * len(chunk))
+                counts.update(
+                    conn.execute(
+                        "SELECT form_id, count FROM submission_counts"
+                        f" WHERE form_id IN ({placeholders})",
+                        chunk,
+                    ).fetchall()
+                )
+        return counts
+
+    def close(self):
+        """Commit anything still queued and stop the writer thread."""
+        if self._writer is not None and self._writer.is_alive():
+            self._pending.put(None)
+            self._writer.join()
+        self.pool.close()
+
+
+_store: SubmissionStore | None = None
+_store_lock = threading.Lock()
+
+
+def get_submission_store() -> SubmissionStore:
+    """Return the process-wide submission store, creating it on first use."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = SQLiteSubmissionStore()
+    return _store
+
+
+def set_submission_store(store: SubmissionStore) -> None:
+    """Swap in a different submission store backend."""
+    global _store
+    with _store_lock:
+        _store = store
@@ -0,0 +1,131 @@
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Iterable
+
+from app.models import Form
+
+EMAIL_PATTERN = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+TEL_PATTERN = re.compile(r"\+?[0-9][0-9 ().\-]{4,23}")
+DEFAULT_CACHE_SIZE = 1024
+# Longest answer accepted for a single field, in characters.
+MAX_VALUE_LENGTH = int(os.environ.get("FORMS_SUBMIT_MAX_VALUE_LENGTH", "10000"))
+
+# Check kinds, kept as small ints so the per-field loop stays cheap.
+_PRESENT, _EMAIL, _TEL, _CHOICE, _CHECKBOX = range(5)
+
+
+class CompiledValidator:
+    """Server-side submission checks for one version of a form.
+
+    Built once per (form id, version): patterns are precompiled and option
+    values frozen into sets, so validating a submission is a single pass
+    over the form's fields.
+    """
+
+    __slots__ = ("form_id", "version", "_checks")
+
+    def __init__(self, form: Form):
+        self.form_id = form.id
+        self.version = form.version
+        checks = []
+        for field in form.fields:
+            if field.type == "email":
+                kind, allowed = _EMAIL, None
+            elif field.type == "tel":
+                kind, allowed = _TEL, None
+            elif field.type in ("select", "radio"):
+                kind = _CHOICE
+                allowed = frozenset(option.value for option in field.options)
+            elif field.type == "checkbox":
+                kind, allowed = _CHECKBOX, None
+            else:
+                kind, allowed = _PRESENT, None
+            checks.append((field.id, field.label, field.required, kind, allowed))
+        self._checks = tuple(checks)
+
+    def clean(self, data: dict[str, Any]) -> dict[str, str]:
+        """Keep only this form's fields, as stripped strings, dropping empty ones.
+
+        Anything else a client sends is discarded, never stored.
+        """
+        cleaned = {}
+        for field_id, *_ in self._checks:
+            value = data.get(field_id)
+            if value is not None:
+                value = str(value).strip()
+                if value:
+                    cleaned[field_id] = value
+        return cleaned
+
+    def validate(self, data: dict[str, Any]) -> dict[str, str]:
+        """Return a field id -> message map of problems; empty if the data is valid."""
+        errors = {}
+        email_match = EMAIL_PATTERN.fullmatch
+        tel_match = TEL_PATTERN.fullmatch
+        for field_id, label, required, kind, allowed in self._checks:
+            value = data.get(field_id)
+            value = "" if value is None else str(value).strip()
+            if kind == _CHECKBOX:
+                if required and value in ("", "False", "false", "off"):
+                    errors[field_id] = f"{label} must be checked."
+                continue
+            if not value:
+                if required:
+                    errors[field_id] = f"{label} is required."
+                continue
+            if len(value) > MAX_VALUE_LENGTH:
+                errors[field_id] = (
+                    f"{label} must be at most {MAX_VALUE_LENGTH} characters."
+                )
+            elif kind == _EMAIL:
+                if not email_match(value):
+                    errors[field_id] = f"{label} must be a valid email address."
+            elif kind == _TEL:
+                if not tel_match(value):
+                    errors[field_id] = f"{label} must be a valid phone number."
+            elif kind == _CHOICE:
+                if value not in allowed:
+                    errors[field_id] = f"{label} has an invalid choice."
+        return errors
+
+    def validate_many(self, rows: Iterable[dict[str, Any]]) -> list[dict[str, str]]:
+        """Validate a batch of submissions, e.g. an import, in one call."""
+        validate = self.validate
+        return [validate(row) for row in rows]
+
+
+class ValidatorCache:
+    """LRU of compiled validators keyed by form id and version."""
+
+    def __init__(self, max_entries: int = DEFAULT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, int], CompiledValidator] = OrderedDict()
+        self._lock = threading.Lock()
+        self.compiles = 0
+        self.hits = 0
+
+    def get(self, form: Form) -> CompiledValidator:
+        key = (form.id, form.version)
+        with self._lock:
+            validator = self._entries.get(key)
+            if validator is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return validator
+        validator = CompiledValidator(form)
+        with self._lock:
+            self.compiles += 1
+            self._entries[key] = validator
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return validator
+
+
+validator_cache = ValidatorCache()
+
+
+def get_validator(form: Form) -> CompiledValidator:
+    """Return the compiled validator for this version of `form`."""
+    return validator_cache.get(form)
@@ -1,39 +1,84 @@
 import reflex as rx
 
+from app.models import User
+from app.services.auth import (
+    SESSION_COOKIE,
+    SESSION_TTL_SECONDS,
+    AuthError,
+    get_auth_service,
+)
+from app.states.state import AppState
+
 
 class AuthState(rx.State):
     """Manages user authentication and session."""
 
+    session_token: str = rx.Cookie(
+        "", name=SESSION_COOKIE, max_age=SESSION_TTL_SECONDS, same_site="strict"
+    )
     is_authenticated: bool = False
+    user_email: str = ""
+
+    async def _start_session(self, user: User):
+        self.session_token = get_auth_service().create_session(user)
+        self.is_authenticated = True
+        self.user_email = user.email
+        await self._set_owner(user.id)
+        return rx.redirect("/dashboard")
+
+    async def _set_owner(self, owner_id: str):
+        # Forms are only ever reached through the user of a validated session.
+        app_state = await self.get_state(AppState)
+        if app_state._owner_id != owner_id:
+            app_state._owner_id = owner_id
 
     @rx.event
-    def register(self, form_data: dict):
-        """Register a new user (dummy implementation)."""
+    async def register(self, form_data: dict):
+        """Create an account and sign in."""
         email = form_data.get("email")
         password = form_data.get("password")
         if not email or not password:
             return rx.toast.error("Email and password are required.")
-        self.is_authenticated = True
-        return rx.redirect("/dashboard")
+        try:
+            user = await get_auth_service().register(email, password)
+        except AuthError as error:
+            return rx.toast.error(str(error))
+        return await self._start_session(user)
 
     @rx.event
-    def login(self, form_data: dict):
-        """Log in a user (dummy implementation)."""
+    async def login(self, form_data: dict):
+        """Check the password off the event loop and start a session."""
         email = form_data.get("email")
         password = form_data.get("password")
         if not email or not password:
             return rx.toast.error("Email and password are required.")
-        self.is_authenticated = True
-        return rx.redirect("/dashboard")
+        try:
+            user = await get_auth_service().authenticate(email, password)
+        except AuthError as error:
+            return rx.toast.error(str(error))
+        return await self._start_session(user)
 
     @rx.event
-    def logout(self):
+    async def logout(self):
         """Log out the user."""
+        if self.session_token:
+            get_auth_service().revoke_session(self.session_token)
+        self.session_token = ""
         self.is_authenticated = False
+        self.user_email = ""
+        await self._set_owner("")
         return rx.redirect("/")
 
     @rx.event
-    def check_auth(self):
-        """Check if the user is authenticated, redirect to login if not."""
-        if not self.is_authenticated:
-            return rx.redirect("/login")
\ No newline at end of file
+    async def check_auth(self):
+        """Check the session cookie, redirect to login if it is not valid.
+
+        Page loaders that reach the user's forms must run after this, since it
+        is what sets their owner.
+        """
+        user = get_auth_service().validate_session(self.session_token)
+        self.is_authenticated = user is not None
+        await self._set_owner(user.id if user else "")
+        if user is None:
+            return rx.redirect("/login")
+        self.user_email = user.email
@@ -0,0 +1,36 @@
+import reflex as rx
+import asyncio
+from app.services.analytics import (
+    ChoiceDistribution,
+    FieldCompletion,
+    get_projection,
+)
+from app.states.state import AppState
+
+
+class ResultsState(rx.State):
+    """Answer distributions and completion rates for one form."""
+
+    form_title: str = ""
+    total_responses: int = 0
+    distributions: list[ChoiceDistribution] = []
+    completion: list[FieldCompletion] = []
+
+    @rx.var
+    def url_form_id(self) -> str:
+        return self.router.page.params.get("form_id", "")
+
+    @rx.event
+    async def on_load(self):
+        """Bring the form's projection up to date and publish its figures."""
+        app_state = await self.get_state(AppState)
+        if not app_state._owner():
+            return
+        form = app_state.get_form(self.url_form_id)
+        if form is None:
+            return rx.redirect("/dashboard")
+        projection = await asyncio.to_thread(get_projection(form).refresh)
+        self.form_title = form.title
+        self.total_responses = projection.total
+        self.distributions = projection.distributions()
+        self.completion = projection.completion_rates()
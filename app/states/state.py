@@ -1,10 +1,18 @@
 import reflex as rx
+import asyncio
 import json
 import logging
+import os
+import time
 from typing import Any
+from pydantic import ValidationError
 from app.models import (
+    generate_uuid_str,
     Form,
     FormField,
+    FormSummary,
+    PublishedForm,
+    SubmissionLimits,
     FieldType,
     TextField,
     EmailField,
@@ -15,6 +23,37 @@ from app.models import (
     RadioField,
     Option,
 )
+from app.services.airtable_export import AirtableExportSink
+from app.services.dedup import submission_dedup
+from app.services.form_bundle import BundleError, load_bundle, validate_bundle
+from app.services.form_history import FormHistory
+from app.services.form_repository import (
+    DEFAULT_SUMMARY_PAGE_SIZE,
+    SUMMARY_SORTS,
+    get_form_repository,
+)
+from app.services.rate_limit import client_address, submission_limiter
+from app.services.submission_pipeline import enqueue_submission
+from app.services.submission_store import get_submission_store
+from app.services.validation import get_validator
+
+# Editor changes are written back once edits pause for the debounce window,
+# and at least every max-latency seconds while the user keeps typing.
+AUTOSAVE_DEBOUNCE_SECONDS = float(os.environ.get("FORMS_AUTOSAVE_DEBOUNCE", "0.75"))
+AUTOSAVE_MAX_LATENCY_SECONDS = float(
+    os.environ.get("FORMS_AUTOSAVE_MAX_LATENCY", "5.0")
+)
+# Crowded field order keys are respaced once drags pause for this long.
+ORDER_REBALANCE_DELAY_SECONDS = 2.0
+# Moved fields' keys are sent on their own until this many have moved, after
+# which the full key map is re-sent once.
+MAX_MOVED_FIELD_KEYS = 16
+
+# Hidden input carrying the idempotency token of each rendered form.
+SUBMISSION_TOKEN_FIELD = "_submission_token"
+BUSY_MESSAGE = (
+    "We're receiving a lot of responses right now. Please try again shortly."
+)
 
 AVAILABLE_FIELDS = {
     "text": {"icon": "text", "name": "Text"},
@@ -46,86 +85,445 @@ def create_field_from_type(field_type: FieldType) -> FormField:
 class AppState(rx.State):
     """Manages a collection of forms."""
 
+    # The signed-in user's id, set by `AuthState` from the validated session
+    # cookie. As a backend var it never reaches, nor comes from, the client.
+    _owner_id: str = ""
+    # Legacy browser-side store, migrated into the repository on first load.
     forms_json: str = rx.LocalStorage("[]", name="forms-data")
+    # The dashboard holds one page of summaries, never whole forms.
+    summaries: list[FormSummary] = []
+    sort_by: str = "updated"
+    search_query: str = ""
+    page_number: int = 1
+    has_next_page: bool = False
+    # Cursor of every page visited so far, so "Previous" needs no offset scan.
+    _page_cursors: list[str | None] = [None]
+    _next_cursor: str | None = None
+    # Forms ticked on the dashboard for bulk actions, across pages.
+    selected_form_ids: list[str] = []
+    import_progress: int = 0
+    import_total: int = 0
+
+    def _owner(self) -> str:
+        """Return the id that owns the signed-in user's forms; "" when signed out."""
+        return self._owner_id
+
+    async def _load_summaries(self):
+        if self.search_query.strip():
+            # Search results are ranked, so they come back as a single page.
+            # The first search also builds the owner's index from storage, so
+            # it runs off the event loop.
+            items = await asyncio.to_thread(
+                get_form_repository().search_summaries,
+                self._owner(),
+                self.search_query,
+            )
+            self._set_summaries(items, None)
+            return
+        page = get_form_repository().list_summaries(
+            self._owner(),
+            self.sort_by,
+            self._page_cursors[-1],
+            DEFAULT_SUMMARY_PAGE_SIZE,
+        )
+        self._set_summaries(page.items, page.next_cursor)
 
-    @rx.var
-    def forms(self) -> list[Form]:
+    def _set_summaries(self, items: list[FormSummary], next_cursor: str | None):
+        counts = get_submission_store().counts([summary.id for summary in items])
+        for summary in items:
+            summary.submission_count = counts[summary.id]
+        self.summaries = items
+        self._next_cursor = next_cursor
+        self.has_next_page = next_cursor is not None
+        self.page_number = len(self._page_cursors)
+
+    def _save_forms(self, *forms: Form):
+        if self._owner():
+            get_form_repository().save_many(list(forms), self._owner())
+
+    @rx.event
+    async def on_load(self):
+        """Move any forms left in browser storage and load page one."""
+        if not self._owner():
+            # `AuthState.check_auth` runs first and has redirected to login.
+            return
+        if self.forms_json and self.forms_json != "[]":
+            self._migrate_legacy_forms()
+        self._page_cursors = [None]
+        await self._load_summaries()
+
+    def _migrate_legacy_forms(self):
         try:
-            forms_data = json.loads(self.forms_json)
-            return [Form.model_validate(form_dict) for form_dict in forms_data]
-        except (json.JSONDecodeError, TypeError):
+            legacy_forms = [
+                Form.model_validate(form_dict)
+                for form_dict in json.loads(self.forms_json)
+            ]
+        except (json.JSONDecodeError, TypeError, ValidationError):
             logging.exception("Error decoding forms JSON")
-            return []
+            return
+        self._save_forms(*legacy_forms)
+        self.forms_json = "[]"
 
-    def _save_forms(self):
-        self.forms_json = json.dumps([form.model_dump() for form in self.forms])
+    @rx.event
+    async def set_sort(self, sort_by: str):
+        if sort_by not in SUMMARY_SORTS:
+            return
+        self.sort_by = sort_by
+        self._page_cursors = [None]
+        await self._load_summaries()
+
+    @rx.event
+    async def search(self, query: str):
+        self.search_query = query
+        self._page_cursors = [None]
+        await self._load_summaries()
+
+    @rx.event
+    async def next_page(self):
+        if self._next_cursor is not None:
+            self._page_cursors.append(self._next_cursor)
+            await self._load_summaries()
+
+    @rx.event
+    async def previous_page(self):
+        if len(self._page_cursors) > 1:
+            self._page_cursors.pop()
+            await self._load_summaries()
 
     @rx.event
     def create_new_form(self):
         new_form = Form(title="Untitled Form")
-        self.forms.append(new_form)
-        self._save_forms()
+        self._save_forms(new_form)
         return rx.redirect(f"/editor/{new_form.id}")
 
     @rx.event
-    def delete_form(self, form_id: str):
-        self.forms = [form for form in self.forms if form.id != form_id]
-        self._save_forms()
+    def toggle_form_selection(self, form_id: str):
+        if form_id in self.selected_form_ids:
+            self.selected_form_ids.remove(form_id)
+        else:
+            self.selected_form_ids.append(form_id)
+
+    @rx.event
+    def clear_selection(self):
+        self.selected_form_ids = []
+
+    @rx.event
+    async def delete_form(self, form_id: str):
+        await self._delete_forms([form_id])
+
+    @rx.event
+    async def delete_forms(self, form_ids: list[str]):
+        """Delete a selection of forms in a single write."""
+        await self._delete_forms(form_ids)
+
+    async def _delete_forms(self, form_ids: list[str]):
+        deleted = get_form_repository().delete_many(form_ids, self._owner())
+        if not deleted:
+            return
+        self.selected_form_ids = [
+            form_id for form_id in self.selected_form_ids if form_id not in deleted
+        ]
+        await self._load_summaries()
+        if not self.summaries and len(self._page_cursors) > 1:
+            self._page_cursors.pop()
+            await self._load_summaries()
+
+    @rx.event
+    async def duplicate_forms(self, form_ids: list[str]):
+        """Copy forms under fresh form and field ids in a single write."""
+        copies = [
+            form.with_fresh_ids(title=f"Copy of {form.title}")
+            for form in get_form_repository().get_many(form_ids, self._owner())
+        ]
+        if not copies:
+            return
+        self._save_forms(*copies)
+        self.selected_form_ids = []
+        self._page_cursors = [None]
+        await self._load_summaries()
+
+    @rx.event
+    async def import_forms(self, files: list[rx.UploadFile]):
+        """Import a JSON bundle of forms: validate it all, then save it in one write.
+
+        Nothing is saved if any form in the bundle is invalid. Progress is
+        streamed to the dashboard as each chunk of forms is validated. Decoding,
+        validation and the save run on worker threads, so a large bundle does
+        not stall the event loop for every other client.
+        """
+        owner = self._owner()
+        if not files or not owner:
+            return
+        data = await files[0].read()
+        forms = []
+        try:
+            items = await asyncio.to_thread(load_bundle, data)
+            self.import_total = len(items)
+            self.import_progress = 0
+            yield
+            chunks = validate_bundle(items)
+            while (chunk := await asyncio.to_thread(next, chunks, None)) is not None:
+                forms.extend(chunk)
+                self.import_progress = len(forms)
+                yield
+        except BundleError as error:
+            self.import_total = 0
+            yield rx.toast.error(str(error))
+            return
+        await asyncio.to_thread(get_form_repository().save_many, forms, owner)
+        self.import_total = 0
+        self._page_cursors = [None]
+        await self._load_summaries()
+        yield rx.toast.success(f"Imported {len(forms)} forms.")
 
     @rx.event
     def get_form(self, form_id: str) -> Form | None:
-        for form in self.forms:
-            if form.id == form_id:
-                return form
-        return None
+        return get_form_repository().get(form_id, self._owner())
 
     @rx.event
     def update_form(self, updated_form: Form):
-        for i, form in enumerate(self.forms):
-            if form.id == updated_form.id:
-                self.forms[i] = updated_form
-                self._save_forms()
-                return
+        get_form_repository().update(updated_form, self._owner())
+
+    def _publish_form(self, form_id: str) -> int | None:
+        return get_form_repository().publish(form_id, self._owner())
+
+    @rx.event(background=True)
+    async def export_to_airtable(self, form_id: str):
+        """Push a form's new submissions to the Airtable table in the environment."""
+        async with self:
+            form = self.get_form(form_id)
+        if form is None:
+            return
+        sink = AirtableExportSink.from_env(form)
+        if sink is None:
+            yield rx.toast.error("Airtable export is not configured.")
+            return
+        try:
+            exported = await sink.run()
+        except Exception:
+            logging.exception("Airtable export failed for form %s", form_id)
+            yield rx.toast.error(
+                "Airtable export failed. It will resume where it stopped."
+            )
+            return
+        yield rx.toast.success(f"Exported {exported} submissions to Airtable.")
 
 
 class FormEditorState(rx.State):
-    """Manages the state of the form editor for a single form."""
-
-    form: Form | None = None
+    """Manages the state of the form editor for a single form.
+
+    The whole form lives in the backend-only `_form`. The client sees it split
+    into title, description, field list and the selected field, so an edit
+    only sends the var it touched instead of the entire form.
+
+    Every change is recorded in `_history`, whose versions share unchanged
+    field objects. A field held by a version is copied before it is edited,
+    so recording a change never copies the rest of the form.
+    """
+
+    loaded_form_id: str = ""
+    title: str = ""
+    description: str = ""
+    fields: list[FormField] = []
+    # Order key of each field, applied as its CSS `order` on the canvas. A
+    # move only sets the moved field's key in `moved_field_order`, which
+    # takes precedence, so neither `fields` nor this map is re-sent.
+    field_order: dict[str, int] = {}
+    moved_field_order: dict[str, int] = {}
+    dragging_field_id: str | None = None
     selected_field_id: str | None = None
+    # The same object as the matching entry in `fields`. Property edits go
+    # through this var; `fields` is only re-sent when the selection changes.
+    selected_field: FormField | None = None
+    limits: SubmissionLimits = SubmissionLimits()
+    pending_saves: int = 0
+    can_undo: bool = False
+    can_redo: bool = False
+    # Bumped on undo and redo so uncontrolled inputs re-read their values.
+    history_revision: int = 0
+    _form: Form | None = None
+    _history: FormHistory | None = None
+    _selection_edited: bool = False
+    _first_unsaved_at: float = 0.0
+    _last_change_at: float = 0.0
+    _autosave_scheduled: bool = False
+    _rebalance_scheduled: bool = False
 
     @rx.var
     def url_form_id(self) -> str:
         return self.router.page.params.get("form_id", "")
 
+    def _set_form(self, form: Form | None):
+        self._form = form
+        self.loaded_form_id = form.id if form else ""
+        self.title = form.title if form else ""
+        self.description = form.description if form else ""
+        self.limits = form.limits if form else SubmissionLimits()
+        if form and not form.order_keys_valid():
+            # Forms saved before fields had order keys.
+            form.rebalance_order_keys()
+        self.fields = form.fields if form else []
+        self._sync_field_order()
+        self.dragging_field_id = None
+        self.selected_field_id = None
+        self.selected_field = None
+        self._selection_edited = False
+        self._history = FormHistory(form) if form else None
+        self._sync_history()
+
+    def _unproxied_form(self) -> Form | None:
+        # History versions compare fields by identity, which the change
+        # tracking proxy around `self._form` would hide.
+        return self._backend_vars.get("_form")
+
+    def _sync_history(self):
+        history = self._history
+        can_undo = bool(history and history.can_undo)
+        can_redo = bool(history and history.can_redo)
+        # Assigning marks a var dirty even when unchanged; skip it per keystroke.
+        if self.can_undo != can_undo:
+            self.can_undo = can_undo
+        if self.can_redo != can_redo:
+            self.can_redo = can_redo
+
     @rx.event
     async def on_load(self):
         """Load the form to be edited based on the URL."""
+        await self._flush_form_save()
         app_state = await self.get_state(AppState)
-        self.form = app_state.get_form(self.url_form_id)
-        if self.form is None:
+        if not app_state._owner():
+            # `AuthState.check_auth` runs first and has redirected to login.
+            return
+        self._set_form(app_state.get_form(self.url_form_id))
+        if self._form is None:
             return rx.redirect("/")
 
-    async def _save_form_changes(self):
-        """Save the current state of the form back to the main AppState."""
-        if self.form:
+    def _sync_fields(self):
+        """Re-send the field list after its structure or a field in it changed."""
+        self.fields = self._form.fields
+        self._sync_field_order()
+        self._selection_edited = False
+
+    def _sync_field_order(self):
+        fields = self._form.fields if self._form else []
+        self.field_order = {field.id: field.order for field in fields}
+        if self.moved_field_order:
+            self.moved_field_order = {}
+
+    def _sync_moved_field_order(self):
+        """Send the order keys that differ from `field_order`, or all of them."""
+        sent = self.field_order
+        moved = {
+            field.id: field.order
+            for field in self._form.fields
+            if field.order != sent.get(field.id)
+        }
+        # A move that had to respace every key is sent as a new map.
+        if len(moved) > MAX_MOVED_FIELD_KEYS:
+            self._sync_field_order()
+        elif moved != self.moved_field_order:
+            self.moved_field_order = moved
+
+    async def _save_form_changes(self, coalesce_key: str | None = None):
+        """Record a change in the history and schedule a coalesced save."""
+        if not self._form:
+            return None
+        self._history.record(self._unproxied_form(), coalesce_key)
+        self._sync_history()
+        return await self._schedule_save()
+
+    async def _schedule_save(self):
+        """Count an unsaved change and schedule a coalesced save."""
+        now = time.monotonic()
+        if not self.pending_saves:
+            self._first_unsaved_at = now
+        self._last_change_at = now
+        self.pending_saves += 1
+        if now - self._first_unsaved_at >= AUTOSAVE_MAX_LATENCY_SECONDS:
+            await self._flush_form_save()
+        elif not self._autosave_scheduled:
+            self._autosave_scheduled = True
+            return FormEditorState.autosave
+        return None
+
+    async def _flush_form_save(self):
+        """Save pending changes to the form back to the main AppState."""
+        if self._form and self.pending_saves:
             app_state = await self.get_state(AppState)
-            app_state.update_form(self.form)
+            app_state.update_form(self._form)
+        self.pending_saves = 0
+
+    @rx.event(background=True)
+    async def autosave(self):
+        """Flush pending changes once edits pause or the max latency is reached."""
+        while True:
+            async with self:
+                if not self.pending_saves:
+                    self._autosave_scheduled = False
+                    return
+                delay = min(
+                    self._last_change_at + AUTOSAVE_DEBOUNCE_SECONDS,
+                    self._first_unsaved_at + AUTOSAVE_MAX_LATENCY_SECONDS,
+                ) - time.monotonic()
+                if delay <= 0:
+                    await self._flush_form_save()
+                    self._autosave_scheduled = False
+                    return
+            await asyncio.sleep(delay)
+
+    async def _restored_version(self):
+        if not self._form.order_keys_valid():
+            # Keys are rewritten in place, so an older version's may be stale.
+            self._form.rebalance_order_keys()
+        self.title = self._form.title
+        self.description = self._form.description
+        self.limits = self._form.limits
+        self._sync_fields()
+        if self.selected_field_id:
+            self.selected_field = self._form.get_field(self.selected_field_id)
+            if self.selected_field is None:
+                self.selected_field_id = None
+        self.history_revision += 1
+        self._sync_history()
+        return await self._schedule_save()
 
-    @rx.var
-    def selected_field(self) -> FormField | None:
-        if self.form and self.selected_field_id:
-            for field in self.form.fields:
-                if field.id == self.selected_field_id:
-                    return field
-        return None
+    @rx.event
+    async def undo(self):
+        """Go back to the form's previous version."""
+        if self._history and self._history.undo(self._unproxied_form()):
+            return await self._restored_version()
+
+    @rx.event
+    async def redo(self):
+        """Re-apply the last undone version."""
+        if self._history and self._history.redo(self._unproxied_form()):
+            return await self._restored_version()
+
+    @rx.event
+    async def publish(self):
+        """Publish the saved form; the public page serves it until the next publish."""
+        if not self._form:
+            return
+        await self._flush_form_save()
+        app_state = await self.get_state(AppState)
+        version = app_state._publish_form(self._form.id)
+        if version is None:
+            return rx.toast.error("This form could not be published.")
+        self._history.pin()
+        return rx.toast.success(f"Published version {version}.")
+
+    @rx.event
+    async def leave_editor(self, path: str):
+        """Save pending changes before navigating away from the editor."""
+        await self._flush_form_save()
+        return rx.redirect(path)
 
     @rx.var
     def selected_field_display_name(self) -> str:
         """Get the display name for the selected field type."""
-        if self.selected_field:
-            field_type = self.selected_field.type
-            return AVAILABLE_FIELDS.get(field_type, {"name": field_type})["name"]
+        field = self.selected_field
+        if field:
+            return AVAILABLE_FIELDS.get(field.type, {"name": field.type})["name"]
         return ""
 
     @rx.var
@@ -137,94 +535,174 @@ class FormEditorState(rx.State):
 
     @rx.event
     async def add_field(self, field_type: str):
-        if self.form:
+        if self._form:
             new_field = create_field_from_type(field_type)
-            self.form.fields.append(new_field)
+            self._form.add_field(new_field)
+            self._sync_fields()
             self.selected_field_id = new_field.id
-            await self._save_form_changes()
+            self.selected_field = new_field
+            return await self._save_form_changes()
 
     @rx.event
     def select_field(self, field_id: str):
-        self.selected_field_id = (
-            None if self.selected_field_id == field_id else field_id
-        )
+        if self._selection_edited:
+            self._sync_fields()
+        if self.selected_field_id == field_id or not self._form:
+            self.selected_field_id = None
+            self.selected_field = None
+        else:
+            self.selected_field_id = field_id
+            self.selected_field = self._form.get_field(field_id)
+
+    @rx.event
+    def start_drag(self, field_id: str):
+        self.dragging_field_id = field_id
+
+    @rx.event
+    def cancel_drag(self):
+        self.dragging_field_id = None
+
+    @rx.event
+    async def drop_field(self, target_id: str):
+        """Move the dragged field into the target's place.
+
+        Only the moved field gets a new order key, and only the keys moved
+        since `field_order` was last sent go to the client. Crowded keys are
+        respaced later in the background.
+        """
+        field_id, self.dragging_field_id = self.dragging_field_id, None
+        if not self._form or not field_id or field_id == target_id:
+            return None
+        position = self._form.field_position(target_id)
+        if position is None or not self._form.move_field(field_id, position):
+            return None
+        self._sync_moved_field_order()
+        events = [await self._save_form_changes()]
+        if not self._rebalance_scheduled and self._form.order_keys_crowded():
+            self._rebalance_scheduled = True
+            events.append(FormEditorState.rebalance_field_order)
+        return [event for event in events if event is not None]
+
+    @rx.event(background=True)
+    async def rebalance_field_order(self):
+        """Respace crowded order keys once drags pause, without a history entry."""
+        await asyncio.sleep(ORDER_REBALANCE_DELAY_SECONDS)
+        async with self:
+            self._rebalance_scheduled = False
+            if not self._form or not self._form.order_keys_crowded():
+                return
+            self._form.rebalance_order_keys()
+            self._sync_field_order()
+            save = await self._schedule_save()
+        if save is not None:
+            yield save
 
     @rx.event
     async def delete_selected_field(self):
-        if self.form and self.selected_field_id:
-            self.form.fields = [
-                f for f in self.form.fields if f.id != self.selected_field_id
-            ]
+        if self._form and self.selected_field_id:
+            self._form.remove_field(self.selected_field_id)
+            self._sync_fields()
             self.selected_field_id = None
-            await self._save_form_changes()
+            self.selected_field = None
+            return await self._save_form_changes()
+
+    def _own_selected_field(
+        self, coalesce_key: str | None = None
+    ) -> FormField | None:
+        """Return the selected field, first copying it if the history holds it."""
+        if not self._form or not self.selected_field_id:
+            return None
+        field = self._form.get_field(self.selected_field_id)
+        if field is not None and self._history.is_shared(field, coalesce_key):
+            field = field.model_copy(deep=True)
+            self._form.fields[self._form.field_position(field.id)] = field
+            self.selected_field = field
+        return self.selected_field
+
+    async def _selected_field_changed(self, coalesce_key: str | None = None):
+        self._selection_edited = True
+        return await self._save_form_changes(coalesce_key)
 
     @rx.event
     async def update_field_property(self, key: str, value: Any):
-        if self.form and self.selected_field_id:
-            for i, field in enumerate(self.form.fields):
-                if field.id == self.selected_field_id:
-                    if isinstance(getattr(field, key), bool):
-                        value = (
-                            value.lower() == "true"
-                            if isinstance(value, str)
-                            else bool(value)
-                        )
-                    setattr(self.form.fields[i], key, value)
-                    break
-            await self._save_form_changes()
+        coalesce_key = f"{self.selected_field_id}:{key}"
+        field = self._own_selected_field(coalesce_key)
+        if field is not None:
+            if isinstance(getattr(field, key), bool):
+                value = (
+                    value.lower() == "true" if isinstance(value, str) else bool(value)
+                )
+            setattr(field, key, value)
+            return await self._selected_field_changed(coalesce_key)
 
     @rx.event
     async def add_option(self):
-        if (
-            self.form
-            and self.selected_field
-            and hasattr(self.selected_field, "options")
-        ):
-            num_options = len(self.selected_field.options)
+        field = self._own_selected_field()
+        if field is not None and hasattr(field, "options"):
+            num_options = len(field.options)
             new_option = Option(
                 value=f"option{num_options + 1}", label=f"Option {num_options + 1}"
             )
-            self.selected_field.options.append(new_option)
-            await self.update_field_property("options", self.selected_field.options)
+            field.options.append(new_option)
+            return await self._selected_field_changed()
 
     @rx.event
     async def remove_option(self, index: int):
-        if (
-            self.form
-            and self.selected_field
-            and hasattr(self.selected_field, "options")
-        ):
-            if 0 <= index < len(self.selected_field.options):
-                self.selected_field.options.pop(index)
-                await self.update_field_property("options", self.selected_field.options)
+        field = self._own_selected_field()
+        if field is not None and hasattr(field, "options"):
+            if 0 <= index < len(field.options):
+                field.options.pop(index)
+                return await self._selected_field_changed()
 
     @rx.event
     async def update_option_property(self, index: int, key: str, value: str):
-        if (
-            self.form
-            and self.selected_field
-            and hasattr(self.selected_field, "options")
-        ):
-            if 0 <= index < len(self.selected_field.options):
-                setattr(self.selected_field.options[index], key, value)
+        coalesce_key = f"{self.selected_field_id}:options:{index}:{key}"
+        field = self._own_selected_field(coalesce_key)
+        if field is not None and hasattr(field, "options"):
+            if 0 <= index < len(field.options):
+                option = field.options[index]
+                setattr(option, key, value)
                 if key == "label":
-                    self.selected_field.options[index].value = value.lower().replace(
-                        " ", "_"
-                    )
-                await self.update_field_property("options", self.selected_field.options)
+                    option.value = value.lower().replace(" ", "_")
+                return await self._selected_field_changed(coalesce_key)
 
     @rx.event
     async def update_form_property(self, key: str, value: str):
-        if self.form:
-            setattr(self.form, key, value)
-            await self._save_form_changes()
+        if self._form and key in ("title", "description"):
+            setattr(self._form, key, value)
+            setattr(self, key, value)
+            return await self._save_form_changes(key)
+
+    @rx.event
+    async def update_submission_limit(self, key: str, value: str):
+        """Set a per-minute submission limit; an empty value restores the default."""
+        if not self._form or key not in SubmissionLimits.model_fields:
+            return None
+        value = value.strip()
+        if value and not value.isdigit():
+            return None
+        # A new object, so history versions holding the old one are unchanged.
+        self._form.limits = self._form.limits.model_copy(
+            update={key: max(1, int(value)) if value else None}
+        )
+        self.limits = self._form.limits
+        return await self._save_form_changes(f"limits:{key}")
 
 
 class FormViewState(rx.State):
-    """Manages the public view of a form for submission."""
+    """Manages the public view of a form for submission.
 
-    form: Form | None = None
+    Visitors share one cached snapshot per published version: `form` is its
+    rendering and `_form` the parsed form submissions are validated against.
+    A form that has never been published is not found.
+    """
+
+    form: PublishedForm | None = None
+    _form: Form | None = None
+    # Sent with the form; a second submit with the same token is dropped.
+    submission_token: str = ""
     submission_data: dict = {}
+    errors: dict[str, str] = {}
     is_submitted: bool = False
 
     @rx.var
@@ -233,15 +711,75 @@ class FormViewState(rx.State):
 
     @rx.event
     async def on_load(self):
-        """Load the form to be viewed."""
-        app_state = await self.get_state(AppState)
-        self.form = app_state.get_form(self.url_form_id)
-        if self.form is None:
+        """Load the form's published version; drafts are never served publicly."""
+        snapshot = get_form_repository().get_snapshot(self.url_form_id)
+        if snapshot is None:
+            self.form = None
+            self._form = None
             return rx.redirect("/404")
+        self._form = snapshot.form
+        self.form = snapshot.view
+        self.submission_token = generate_uuid_str()
 
     @rx.event
-    def handle_submit(self, form_data: dict):
-        self.submission_data = form_data
-        self.is_submitted = True
-        print("Form Submitted:", form_data)
-        yield rx.toast.success("Form submitted successfully!")
\ No newline at end of file
+    async def handle_submit(self, form_data: dict):
+        """Validate and queue a submission, shedding load instead of queueing it.
+
+        The concurrency slot is held until the submission has been stored, so
+        slow deliveries during a burst count against the cap. Only valid
+        submissions spend rate limit tokens, so correcting a mistake is never
+        throttled.
+        """
+        if self._form is None:
+            return
+        form_data = dict(form_data)
+        dedup_key = (self._form.id, form_data.pop(SUBMISSION_TOKEN_FIELD, ""))
+        concurrency = submission_limiter.concurrency
+        if not concurrency.acquire():
+            yield rx.toast.error(BUSY_MESSAGE)
+            return
+        queued = False
+        try:
+            validator = get_validator(self._form)
+            # Only the form's own fields are validated and stored.
+            form_data = validator.clean(form_data)
+            self.errors = validator.validate(form_data)
+            if self.errors:
+                yield rx.toast.error(next(iter(self.errors.values())))
+                return
+            if dedup_key[1] and submission_dedup.seen(dedup_key):
+                # A double click or retry of a stored submission: answer as
+                # the first attempt was answered, without storing it again.
+                yield rx.toast.success("Form submitted successfully!")
+                return
+            headers = self.router.headers.raw_headers
+            # Reflex puts the socket peer address under this name.
+            peer = headers.get("asgi-scope-client", "")
+            limits = self._form.limits
+            if not submission_limiter.allow(
+                self._form.id,
+                client_address(peer, headers.get("x-forwarded-for", ""))
+                or self.router.session.client_token,
+                limits.form_per_minute,
+                limits.client_per_minute,
+            ):
+                yield rx.toast.error(
+                    "You're sending responses too quickly. Please wait a moment."
+                )
+                return
+            queued = enqueue_submission(
+                self._form.model_copy(), form_data, on_stored=concurrency.release
+            )
+            if not queued:
+                yield rx.toast.error(BUSY_MESSAGE)
+                return
+            if dedup_key[1]:
+                submission_dedup.add(dedup_key)
+            # A fresh token, so filling the form in again counts as a new response.
+            self.submission_token = generate_uuid_str()
+            self.submission_data = form_data
+            self.is_submitted = True
+            yield rx.toast.success("Form submitted successfully!")
+        finally:
+            if not queued:
+                concurrency.release()
@@ -0,0 +1,55 @@
+"""Measure the websocket delta size of common editor events.
+
+Run from the repository root with `python -m benchmarks.bench_editor_deltas`.
+"""
+
+import argparse
+import asyncio
+import json
+
+from app.models import SelectField, TextField
+from benchmarks.harness import build_form, new_root, substate
+
+
+async def measure(num_fields: int) -> dict[str, int]:
+    from app.states.state import AppState, FormEditorState
+
+    root = new_root()
+    app_state = substate(root, AppState)
+    app_state._owner_id = "bench"
+    await app_state.on_load()
+    form = build_form(num_fields, (SelectField, TextField))
+    app_state._save_forms(form)
+    root._clean()
+    editor = substate(root, FormEditorState)
+    editor._set_form(app_state.get_form(form.id))
+
+    def delta_bytes() -> int:
+        size = len(json.dumps(root.get_delta(), default=str))
+        root._clean()
+        return size
+
+    sizes = {"load": delta_bytes()}
+    editor.select_field(form.fields[10].id)
+    sizes["select_field"] = delta_bytes()
+    await editor.update_field_property("label", "Hello")
+    sizes["update_field_property"] = delta_bytes()
+    await editor.update_option_property(0, "label", "Yes")
+    sizes["update_option_property"] = delta_bytes()
+    await editor.update_form_property("title", "Title")
+    sizes["update_form_property"] = delta_bytes()
+    editor.select_field(form.fields[11].id)
+    sizes["select_field_after_edit"] = delta_bytes()
+    return sizes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--fields", type=int, default=300)
+    args = parser.parse_args()
+    for event, size in asyncio.run(measure(args.fields)).items():
+        print(f"{event:28} {size:>10,} bytes")
+
+
+if __name__ == "__main__":
+    main()
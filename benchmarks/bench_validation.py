@@ -0,0 +1,68 @@
+"""Measure compiled submission validation throughput.
+
+Run from the repository root with `python -m benchmarks.bench_validation`.
+"""
+
+import argparse
+import random
+import time
+
+from app.models import Form
+from app.services.validation import CompiledValidator, get_validator
+from benchmarks.harness import ALL_FIELD_TYPES, build_form
+
+
+def build_validation_form(num_fields: int) -> Form:
+    return build_form(
+        num_fields, ALL_FIELD_TYPES, required_every=3, title="Benchmark", version=1
+    )
+
+
+def build_submission(form: Form, rng: random.Random) -> dict[str, str]:
+    data = {}
+    for field in form.fields:
+        if field.type == "email":
+            data[field.id] = f"user{rng.randint(0, 9999)}@example.com"
+        elif field.type == "tel":
+            data[field.id] = f"+1 555 {rng.randint(1000000, 9999999)}"
+        elif field.type in ("select", "radio"):
+            data[field.id] = rng.choice(field.options).value
+        elif field.type == "checkbox":
+            data[field.id] = "on"
+        else:
+            data[field.id] = "some text"
+    return data
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--fields", type=int, default=20)
+    parser.add_argument("--submissions", type=int, default=50_000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    form = build_validation_form(args.fields)
+    rows = [build_submission(form, rng) for _ in range(args.submissions)]
+
+    start = time.perf_counter()
+    for _ in range(1000):
+        CompiledValidator(form)
+    compile_time = (time.perf_counter() - start) / 1000
+
+    start = time.perf_counter()
+    for row in rows:
+        get_validator(form).validate(row)
+    single = args.submissions / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    get_validator(form).validate_many(rows)
+    batch = args.submissions / (time.perf_counter() - start)
+
+    print(f"fields per form:          {args.fields}")
+    print(f"compile:                  {compile_time * 1e6:,.1f} us")
+    print(f"request path (cached):    {single:,.0f} validations/s")
+    print(f"batch import:             {batch:,.0f} validations/s")
+
+
+if __name__ == "__main__":
+    main()
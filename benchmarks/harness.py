@@ -0,0 +1,65 @@
+"""Helpers for driving Reflex states directly, without a browser or server."""
+
+import os
+import tempfile
+
+# Keep benchmark data out of the working tree's databases.
+_scratch = tempfile.mkdtemp(prefix="forms-bench-")
+os.environ.setdefault("FORMS_DB_PATH", os.path.join(_scratch, "forms.db"))
+os.environ.setdefault("SUBMISSIONS_DB_PATH", os.path.join(_scratch, "submissions.db"))
+
+import reflex as rx  # noqa: E402
+from reflex.state import State  # noqa: E402
+
+from app.models import (  # noqa: E402
+    CheckboxField,
+    EmailField,
+    Form,
+    RadioField,
+    SelectField,
+    TelField,
+    TextField,
+)
+
+ALL_FIELD_TYPES = (
+    TextField,
+    EmailField,
+    TelField,
+    SelectField,
+    RadioField,
+    CheckboxField,
+)
+
+
+def new_root() -> State:
+    """Create a fresh root state, as the state manager would for a new client."""
+    import app.app  # noqa: F401  (registers every page and state)
+
+    return State(_reflex_internal_init=True)
+
+
+def substate(root: State, state_cls: type[rx.State]) -> rx.State:
+    """Return the instance of `state_cls` beneath `root`."""
+    return root.get_substate(state_cls.get_full_name().split(".")[1:])
+
+
+def build_form(
+    num_fields: int,
+    field_types: tuple[type, ...] = (TextField, SelectField),
+    required_every: int = 0,
+    **form_kwargs,
+) -> Form:
+    """Build a synthetic form whose fields cycle through `field_types`.
+
+    Every `required_every`-th field, starting with the first, is required.
+    """
+    return Form(
+        **{"title": "Benchmark form", **form_kwargs},
+        fields=[
+            field_types[i % len(field_types)](
+                label=f"Field {i}",
+                required=bool(required_every) and i % required_every == 0,
+            )
+            for i in range(num_fields)
+        ],
+    )
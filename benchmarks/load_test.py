@@ -0,0 +1,395 @@
+"""Drive a running backend with simulated browser clients over its websocket.
+
+Each client speaks the same Socket.IO protocol as the browser: it hydrates,
+runs page on_load chains, follows redirects and sends one event at a time,
+timing each from send to its final state update. Editors log in, open the
+dashboard, create a form and make a burst of edits; visitors open a
+published form and submit it, each from its own forwarded address. Nothing
+leaves the machine.
+
+Start the backend first, trusting this machine as a reverse proxy so each
+visitor's X-Forwarded-For address gets its own submission rate limit:
+
+    FORMS_TRUSTED_PROXIES=127.0.0.1 reflex run --backend-only --env prod
+
+then run from the repository root:
+
+    python -m benchmarks.load_test --editors 20 --visitors 500
+
+Reports p50/p95/p99 latency per event, overall throughput, and the backend's
+resident memory read from its /metrics endpoint.
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import time
+import urllib.request
+import uuid
+from collections import defaultdict
+from typing import Any
+
+import simple_websocket
+
+from app.states.auth_state import AuthState
+from app.states.state import (
+    SUBMISSION_TOKEN_FIELD,
+    AppState,
+    FormEditorState,
+    FormViewState,
+)
+
+NAMESPACE = "/_event"
+ROOT_STATE = "reflex___state____state"
+ON_LOAD = "reflex___state____on_load_internal_state.on_load_internal"
+PASSWORD = "load-test-password"
+MEMORY_GAUGES = {
+    "process_resident_memory_bytes": "backend RSS",
+    "process_max_resident_memory_bytes": "backend peak RSS",
+}
+SAMPLE_VALUES = {
+    "text": "Load test",
+    "textarea": "A longer answer from the load test.",
+    "email": "visitor@example.com",
+    "tel": "+1 555 0100",
+    "checkbox": "true",
+}
+
+
+def handler(state_cls, name: str) -> str:
+    return f"{state_cls.get_full_name()}.{name}"
+
+
+def event_label(name: str) -> str:
+    """Shorten a full event name to `state.handler`, e.g. `app_state.on_load`."""
+    state, _, method = name.rpartition(".")
+    return f"{state.rpartition('____')[2]}.{method}"
+
+
+def route_of(path: str) -> tuple[str, dict[str, str]]:
+    """Map a URL path to its page route and route params."""
+    for prefix, route in (
+        ("/editor/", "/editor/[form_id]"),
+        ("/view/", "/view/[form_id]"),
+        ("/results/", "/results/[form_id]"),
+    ):
+        if path.startswith(prefix):
+            return route, {"form_id": path[len(prefix) :]}
+    return path, {}
+
+
+class Stats:
+    def __init__(self):
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.errors: dict[str, int] = defaultdict(int)
+
+    def record(self, event: str, seconds: float):
+        self.latencies[event].append(seconds)
+
+    def error(self, event: str):
+        self.errors[event] += 1
+
+    @property
+    def count(self) -> int:
+        return sum(len(samples) for samples in self.latencies.values())
+
+
+def percentile(ordered: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class SimulatedClient:
+    """One browser tab: a websocket, a client token and the state it was sent."""
+
+    def __init__(self, base_url: str, stats: Stats, forwarded_for: str, timeout: float):
+        self.base_url = base_url
+        self.stats = stats
+        self.forwarded_for = forwarded_for
+        self.timeout = timeout
+        self.token = str(uuid.uuid4())
+        self.state: dict[str, dict[str, Any]] = defaultdict(dict)
+        self.path = "/"
+        self._updates: asyncio.Queue = asyncio.Queue()
+        self._ws = None
+        self._reader = None
+
+    async def connect(self):
+        ws_url = self.base_url.replace("http", "ws", 1)
+        self._ws = await simple_websocket.AioClient.connect(
+            f"{ws_url}{NAMESPACE}/?EIO=4&transport=websocket&token={self.token}",
+            headers={"X-Forwarded-For": self.forwarded_for},
+        )
+        await self._ws.receive()  # Engine.IO open packet
+        await self._ws.send(f"40{NAMESPACE},")
+        # The backend pushes the router data before acknowledging the
+        # namespace; consume it here so replies line up with their events.
+        while not (message := await self._ws.receive()).startswith(f"40{NAMESPACE}"):
+            self._merge(message)
+        self._reader = asyncio.create_task(self._read())
+
+    async def close(self):
+        if self._reader:
+            self._reader.cancel()
+        if self._ws:
+            await self._ws.close()
+
+    def _merge(self, message: str) -> dict | None:
+        """Apply a state update message to the local state and return it."""
+        prefix = f"42{NAMESPACE},"
+        if not message.startswith(prefix):
+            return None
+        name, update = json.loads(message[len(prefix) :])[:2]
+        if name != "event":
+            return None
+        for state_name, delta in update.get("delta", {}).items():
+            self.state[state_name].update(delta)
+        return update
+
+    async def _read(self):
+        try:
+            while True:
+                message = await self._ws.receive()
+                if message == "2":
+                    await self._ws.send("3")
+                elif (update := self._merge(message)) is not None:
+                    await self._updates.put(update)
+        except simple_websocket.ConnectionClosed:
+            pass
+
+    def var(self, state_cls, name: str) -> Any:
+        return self.state[state_cls.get_full_name()].get(f"{name}_rx_state_")
+
+    async def send(
+        self, name: str, payload: dict | None = None, label: str | None = None
+    ):
+        """Send one event, then every backend event it chains, like the browser."""
+        route, query = route_of(self.path)
+        queue = [(name, payload or {}, label)]
+        while queue:
+            name, payload, label = queue.pop(0)
+            label = label or event_label(name)
+            event = {
+                "token": self.token,
+                "name": name,
+                "router_data": {"pathname": route, "query": query, "asPath": self.path},
+                "payload": payload,
+            }
+            started = time.perf_counter()
+            await self._ws.send(f"42{NAMESPACE}," + json.dumps(["event", event]))
+            chained = []
+            try:
+                while True:
+                    update = await asyncio.wait_for(
+                        self._updates.get(), self.timeout
+                    )
+                    chained.extend(update.get("events", []))
+                    if update.get("final"):
+                        break
+            except asyncio.TimeoutError:
+                self.stats.error(label)
+                return
+            self.stats.record(label, time.perf_counter() - started)
+            for follow in chained:
+                if follow["name"] == "_redirect":
+                    await self.navigate(follow["payload"]["path"])
+                elif not follow["name"].startswith("_"):
+                    queue.append((follow["name"], follow.get("payload", {}), None))
+
+    async def navigate(self, path: str):
+        """Open a page: run its on_load handlers as a client-side navigation would."""
+        self.path = path
+        await self.send(ON_LOAD, label=f"on_load {route_of(path)[0]}")
+
+    async def open(self, path: str):
+        """Load a page from scratch: hydrate the state, then navigate to it."""
+        self.path = path
+        await self.send(f"{ROOT_STATE}.hydrate")
+        await self.navigate(path)
+
+
+async def editor_flow(
+    client: SimulatedClient, email: str, edits: int, publish: bool = False
+) -> str | None:
+    """Log in, open the dashboard, create a form and edit it; return its id."""
+    await client.open("/login")
+    await client.send(
+        handler(AuthState, "login"),
+        {"form_data": {"email": email, "password": PASSWORD}},
+    )
+    if client.path != "/dashboard":
+        await client.navigate("/dashboard")
+    await client.send(handler(AppState, "create_new_form"))
+    if not client.path.startswith("/editor/"):
+        return None
+    form_id = client.path.rpartition("/")[2]
+    field_types = itertools.cycle(["text", "email", "select", "radio", "checkbox"])
+    for i in range(edits):
+        if i % 5 == 0:
+            await client.send(
+                handler(FormEditorState, "add_field"), {"field_type": next(field_types)}
+            )
+        await client.send(
+            handler(FormEditorState, "update_field_property"),
+            {"key": "label", "value": f"Question {i // 5 + 1}"[: 5 + i % 8]},
+        )
+    if publish:
+        # Visitors share one form; lift its per-form limit for the run.
+        await client.send(
+            handler(FormEditorState, "update_submission_limit"),
+            {"key": "form_per_minute", "value": "1000000"},
+        )
+        await client.send(handler(FormEditorState, "publish"))
+    await client.send(handler(FormEditorState, "leave_editor"), {"path": "/dashboard"})
+    return form_id
+
+
+async def visitor_flow(client: SimulatedClient, form_id: str, submissions: int):
+    """Open a published form and submit answers for every field."""
+    await client.open(f"/view/{form_id}")
+    form = client.var(FormViewState, "form")
+    if not form:
+        client.stats.error("view")
+        return
+    for _ in range(submissions):
+        form_data = {
+            SUBMISSION_TOKEN_FIELD: client.var(FormViewState, "submission_token")
+        }
+        for field in form["fields"]:
+            if field["options"]:
+                form_data[field["id"]] = random.choice(field["options"])["value"]
+            else:
+                form_data[field["id"]] = SAMPLE_VALUES.get(field["type"], "x")
+        await client.send(
+            handler(FormViewState, "handle_submit"), {"form_data": form_data}
+        )
+
+
+async def register(base_url: str, email: str, stats: Stats, timeout: float):
+    client = SimulatedClient(base_url, stats, "10.255.0.1", timeout)
+    await client.connect()
+    try:
+        await client.open("/register")
+        await client.send(
+            handler(AuthState, "register"),
+            {"form_data": {"email": email, "password": PASSWORD}},
+        )
+    finally:
+        await client.close()
+
+
+def backend_memory(base_url: str) -> dict[str, float]:
+    """Read the backend's memory gauges from /metrics, in bytes."""
+    with urllib.request.urlopen(f"{base_url}/metrics", timeout=10) as response:
+        text = response.read().decode()
+    gauges = {}
+    for line in text.splitlines():
+        name, _, value = line.partition(" ")
+        if name in MEMORY_GAUGES:
+            gauges[name] = float(value)
+    return gauges
+
+
+async def run(args) -> tuple[Stats, float]:
+    """Run every flow; return their stats and how long they took."""
+    stats = Stats()
+    run_id = uuid.uuid4().hex[:8]
+    emails = [f"load-{run_id}-{i}@example.com" for i in range(args.editors + 1)]
+    # Accounts are set up first and reported separately from the flows.
+    setup = Stats()
+    await asyncio.gather(
+        *(register(args.url, email, setup, args.timeout) for email in emails)
+    )
+
+    owner = SimulatedClient(args.url, setup, "10.255.0.2", args.timeout)
+    await owner.connect()
+    form_id = await editor_flow(owner, emails[0], 10, publish=True)
+    await owner.close()
+    if form_id is None:
+        raise SystemExit("Could not create the form for visitors; is the app running?")
+
+    async def start(delay: float, flow, client: SimulatedClient, *flow_args):
+        await asyncio.sleep(delay)
+        await client.connect()
+        try:
+            await flow(client, *flow_args)
+        finally:
+            await client.close()
+
+    started = time.perf_counter()
+    tasks = []
+    total = args.editors + args.visitors
+    for i in range(total):
+        delay = args.ramp_up * i / max(1, total)
+        if i < args.editors:
+            client = SimulatedClient(
+                args.url, stats, f"10.254.{i // 250}.{i % 250}", args.timeout
+            )
+            tasks.append(start(delay, editor_flow, client, emails[i + 1], args.edits))
+        else:
+            n = i - args.editors
+            client = SimulatedClient(
+                args.url, stats, f"10.{n // 65025 % 250}.{n // 255 % 255}.{n % 255}",
+                args.timeout,
+            )
+            tasks.append(start(delay, visitor_flow, client, form_id, args.submissions))
+    await asyncio.gather(*tasks)
+    return stats, time.perf_counter() - started
+
+
+def report(stats: Stats, elapsed: float, memory_before: dict, memory_after: dict):
+    print(
+        f"{'event':42} {'count':>7} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} "
+        f"{'errors':>7}"
+    )
+    for event in sorted(stats.latencies, key=lambda e: -len(stats.latencies[e])):
+        ordered = sorted(stats.latencies[event])
+        print(
+            f"{event:42} {len(ordered):>7} "
+            f"{percentile(ordered, 0.50) * 1e3:>9.1f} "
+            f"{percentile(ordered, 0.95) * 1e3:>9.1f} "
+            f"{percentile(ordered, 0.99) * 1e3:>9.1f} "
+            f"{stats.errors.get(event, 0):>7}"
+        )
+    everything = sorted(itertools.chain.from_iterable(stats.latencies.values()))
+    if everything:
+        print(
+            f"{'all events':42} {len(everything):>7} "
+            f"{percentile(everything, 0.50) * 1e3:>9.1f} "
+            f"{percentile(everything, 0.95) * 1e3:>9.1f} "
+            f"{percentile(everything, 0.99) * 1e3:>9.1f} "
+            f"{sum(stats.errors.values()):>7}"
+        )
+    print(f"\nthroughput: {stats.count / elapsed:,.1f} events/s over {elapsed:.1f}s")
+    for name, label in MEMORY_GAUGES.items():
+        if name in memory_after:
+            before = memory_before.get(name, 0) / 2**20
+            after = memory_after[name] / 2**20
+            print(f"{label}: {before:,.1f} MiB -> {after:,.1f} MiB")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--url", default="http://localhost:8000", help="backend URL")
+    parser.add_argument("--editors", type=int, default=10)
+    parser.add_argument("--visitors", type=int, default=100)
+    parser.add_argument("--edits", type=int, default=25, help="edits per editor")
+    parser.add_argument("--submissions", type=int, default=1, help="per visitor")
+    parser.add_argument(
+        "--ramp-up", type=float, default=5.0, help="seconds over which clients start"
+    )
+    parser.add_argument("--timeout", type=float, default=30.0, help="per event")
+    args = parser.parse_args()
+    args.url = args.url.rstrip("/")
+
+    memory_before = backend_memory(args.url)
+    stats, elapsed = asyncio.run(run(args))
+    report(stats, elapsed, memory_before, backend_memory(args.url))
+
+
+if __name__ == "__main__":
+    main()
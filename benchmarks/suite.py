@@ -0,0 +1,293 @@
+"""Micro-benchmarks for state handlers and form models, checked against a baseline.
+
+Handlers run directly on state instances, without a browser or server, over
+synthetic corpora. Results are written as JSON and compared with a stored
+baseline; any case slower than the baseline by more than the tolerance fails
+the run.
+
+A fixed pure-Python calibration workload is timed after every case, and
+current timings are scaled by the ratio of the two runs' median calibration
+before being compared. This absorbs a machine being uniformly faster or
+slower than the one that wrote the baseline. It cannot absorb differences in
+how machines weigh individual workloads, so regenerate the baseline on the
+machine you compare on before relying on small changes.
+
+Run from the repository root with `python -m benchmarks.suite`, or
+`python -m benchmarks.suite --update-baseline` after an intended change.
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from typing import Any, Callable
+
+from app.models import Form
+from benchmarks.harness import build_form, new_root, substate
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+# Wide enough for the run-to-run noise of shared and virtual machines; pass
+# a tighter --tolerance on a quiet machine to catch smaller changes.
+DEFAULT_TOLERANCE = 0.5
+FORM_COUNTS = (10, 100, 1_000, 10_000)
+FIELD_COUNTS = (10, 100, 1_000)
+QUICK_FORM_COUNTS = (10, 100, 1_000)
+QUICK_FIELD_COUNTS = (10, 100)
+# Each timed sample runs the case enough times to take at least this long.
+MIN_SAMPLE_SECONDS = 0.05
+# Runs are compared on their fastest sample, which is the least noisy.
+COMPARE_KEY = "min_us"
+# Each result also records the calibration workload timed right after it.
+CALIBRATION_KEY = "calibration_us"
+CALIBRATION_SAMPLES = 3
+
+
+def calibration_workload() -> int:
+    """Fixed interpreter-bound work that no change to the app can affect.
+
+    It allocates nothing, so its speed does not depend on the heap left
+    behind by earlier cases.
+    """
+    total = 0
+    for i in range(20_000):
+        total += i * i % 7
+    return total
+
+
+def _time_calls(
+    run: Callable[[], Any], reset: Callable[[], Any] | None, number: int
+) -> float:
+    if reset is None:
+        start = time.perf_counter()
+        for _ in range(number):
+            run()
+        return time.perf_counter() - start
+    # Reset, untimed, before every call, so each call starts from the same
+    # state instead of one left behind by the calls before it.
+    elapsed = 0.0
+    for _ in range(number):
+        reset()
+        start = time.perf_counter()
+        run()
+        elapsed += time.perf_counter() - start
+    return elapsed
+
+
+def time_case(
+    run: Callable[[], Any], reset: Callable[[], Any] | None, samples: int
+) -> dict[str, float]:
+    """Return per-call timings in microseconds over several samples.
+
+    The garbage collector is paused while timing, as `timeit` does, so a
+    collection triggered by earlier cases does not land in a sample.
+    """
+    start = time.perf_counter()
+    _time_calls(run, reset, 1)
+    # Sized by wall time, so untimed resets count towards a sample's length.
+    once = max(time.perf_counter() - start, 1e-7)
+    number = max(1, min(10_000, int(MIN_SAMPLE_SECONDS / once)))
+    timings = []
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(samples):
+            timings.append(_time_calls(run, reset, number) / number)
+    finally:
+        gc.enable()
+    return {
+        "median_us": statistics.median(timings) * 1e6,
+        "min_us": min(timings) * 1e6,
+        "calls_per_sample": number,
+    }
+
+
+def run_suite(
+    form_counts: tuple[int, ...], field_counts: tuple[int, ...], samples: int
+) -> dict[str, dict[str, float]]:
+    from app.services.form_repository import get_form_repository
+    from app.states.state import AppState, FormEditorState, create_field_from_type
+
+    loop = asyncio.new_event_loop()
+    results: dict[str, dict[str, float]] = {}
+
+    def record(
+        name: str, run: Callable[[], Any], reset: Callable[[], Any] | None = None
+    ):
+        results[name] = time_case(run, reset, samples)
+        results[name][CALIBRATION_KEY] = time_case(
+            calibration_workload, None, CALIBRATION_SAMPLES
+        )[COMPARE_KEY]
+        print(f"{name:45} {results[name][COMPARE_KEY]:>12,.1f} us", file=sys.stderr)
+
+    root = new_root()
+    app_state = substate(root, AppState)
+    # Every run starts from an empty corpus of its own.
+    app_state._owner_id = f"bench-{time.monotonic_ns()}"
+    editor = substate(root, FormEditorState)
+    repository = get_form_repository()
+
+    # Dashboard: the first page of summaries, and the full form listing the
+    # dashboard used to load, for owners with growing numbers of forms.
+    created = 0
+    for num_forms in form_counts:
+        app_state._save_forms(*(build_form(10) for _ in range(num_forms - created)))
+        created = num_forms
+        record(
+            f"dashboard_page[forms={num_forms}]",
+            lambda: loop.run_until_complete(app_state._load_summaries()),
+        )
+        record(
+            f"list_forms[forms={num_forms}]",
+            lambda: repository.list_forms(app_state._owner_id),
+        )
+
+    for num_fields in field_counts:
+        form = build_form(num_fields)
+        record(f"save_forms[fields={num_fields}]", lambda: app_state._save_forms(form))
+        record(f"model_dump[fields={num_fields}]", form.model_dump)
+        dumped = form.model_dump()
+        record(
+            f"model_validate[fields={num_fields}]",
+            lambda: Form.model_validate(dumped),
+        )
+
+        def reset_editor():
+            editor._set_form(build_form(num_fields))
+            editor.select_field(editor._form.fields[-1].id)
+            editor.pending_saves = 0
+            root._clean()
+
+        record(
+            f"add_field[fields={num_fields}]",
+            lambda: loop.run_until_complete(editor.add_field("text")),
+            reset_editor,
+        )
+        record(
+            f"update_field_property[fields={num_fields}]",
+            lambda: loop.run_until_complete(
+                editor.update_field_property("label", "Renamed")
+            ),
+            reset_editor,
+        )
+        record(
+            f"add_option[fields={num_fields}]",
+            lambda: loop.run_until_complete(editor.add_option()),
+            reset_editor,
+        )
+
+    for field_type in ("text", "select", "radio"):
+        record(
+            f"create_field_from_type[{field_type}]",
+            lambda: create_field_from_type(field_type),
+        )
+    loop.close()
+    return results
+
+
+def _median_calibration(results: dict[str, dict[str, float]]) -> float | None:
+    timings = [
+        result[CALIBRATION_KEY]
+        for result in results.values()
+        if CALIBRATION_KEY in result
+    ]
+    return statistics.median(timings) if timings else None
+
+
+def compare(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    tolerance: float,
+) -> list[str]:
+    """Print a comparison table and return the names of regressed cases.
+
+    Current timings are scaled onto the baseline machine's speed by the
+    median calibration of each run, when both runs have one.
+    """
+    regressions = []
+    scale = 1.0
+    current_calibration = _median_calibration(results)
+    baseline_calibration = _median_calibration(baseline)
+    if current_calibration and baseline_calibration:
+        scale = baseline_calibration / current_calibration
+        print(f"Scaling current timings by {scale:.2f} to the baseline machine")
+    print(f"{'case':45} {'baseline':>12} {'current':>12} {'change':>8}")
+    for name, result in results.items():
+        current = result[COMPARE_KEY] * scale
+        previous = baseline.get(name)
+        if previous is None:
+            print(f"{name:45} {'-':>12} {current:>12,.1f}      new")
+            continue
+        ratio = current / previous[COMPARE_KEY]
+        flag = ""
+        if ratio > 1 + tolerance:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(
+            f"{name:45} {previous[COMPARE_KEY]:>12,.1f} "
+            f"{current:>12,.1f} {ratio - 1:>+8.0%}{flag}"
+        )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--quick", action="store_true", help="skip the largest corpora")
+    parser.add_argument("--samples", type=int, default=7)
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=3,
+        help="run the whole suite this many times and keep each case's best",
+    )
+    parser.add_argument("--output", help="also write the results JSON to this file")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args()
+
+    results: dict[str, dict[str, float]] = {}
+    for _ in range(args.runs):
+        for name, result in run_suite(
+            QUICK_FORM_COUNTS if args.quick else FORM_COUNTS,
+            QUICK_FIELD_COUNTS if args.quick else FIELD_COUNTS,
+            args.samples,
+        ).items():
+            if name not in results or result[COMPARE_KEY] < results[name][COMPARE_KEY]:
+                results[name] = result
+    report = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "created_at": time.time(),
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.update_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+        print(f"Baseline written to {args.baseline}")
+        return
+
+    try:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+    except FileNotFoundError:
+        print(f"No baseline at {args.baseline}; run with --update-baseline first.")
+        return
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f"{len(regressions)} case(s) regressed by more than {args.tolerance:.0%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
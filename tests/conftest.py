@@ -0,0 +1,16 @@
+import pytest
+from reflex.state import State
+
+from app.services.form_repository import SQLiteFormRepository, set_form_repository
+
+
+@pytest.fixture
+def repository(tmp_path):
+    repository = SQLiteFormRepository(str(tmp_path / "forms.db"))
+    set_form_repository(repository)
+    yield repository
+    repository.pool.close()
+
+
+def substate(root: State, state_cls):
+    return root.get_substate(state_cls.get_full_name().split(".")[1:])
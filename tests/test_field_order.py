@@ -0,0 +1,41 @@
+import asyncio
+
+from conftest import substate
+from reflex.state import State
+
+from app.models import Form, TextField
+from app.states.state import MAX_MOVED_FIELD_KEYS, AppState, FormEditorState
+
+
+def client_order(editor: FormEditorState) -> list[str]:
+    keys = {**editor.field_order, **editor.moved_field_order}
+    return sorted(keys, key=keys.__getitem__)
+
+
+def test_a_move_sends_only_the_moved_keys(repository):
+    root = State(_reflex_internal_init=True)
+    app_state = substate(root, AppState)
+    editor = substate(root, FormEditorState)
+    app_state._owner_id = "owner"
+    form = Form(fields=[TextField(label=f"Q{i}") for i in range(50)])
+    app_state._save_forms(form)
+    editor._set_form(app_state.get_form(form.id))
+    ids = [field.id for field in form.fields]
+
+    async def move(field_id: str, target_id: str):
+        editor.start_drag(field_id)
+        editor.dirty_vars.clear()
+        await editor.drop_field(target_id)
+
+    asyncio.run(move(ids[49], ids[0]))
+    assert "field_order" not in editor.dirty_vars
+    assert list(editor.moved_field_order) == [ids[49]]
+    assert client_order(editor) == [field.id for field in editor._form.fields]
+
+    # Past the cap, the whole map is re-sent once and the overrides cleared.
+    for position in range(1, MAX_MOVED_FIELD_KEYS + 1):
+        fields = editor._form.fields
+        asyncio.run(move(fields[-1].id, fields[position].id))
+    assert "field_order" in editor.dirty_vars
+    assert editor.moved_field_order == {}
+    assert client_order(editor) == [field.id for field in editor._form.fields]
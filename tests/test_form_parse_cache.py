@@ -0,0 +1,35 @@
+import asyncio
+
+from conftest import substate
+from reflex.state import State
+
+from app.models import Form, TextField
+from app.states.state import AppState, FormEditorState
+
+
+def test_editor_keystrokes_do_not_reparse_the_form(repository):
+    root = State(_reflex_internal_init=True)
+    app_state = substate(root, AppState)
+    editor = substate(root, FormEditorState)
+    app_state._owner_id = "owner"
+    form = Form(title="Survey", fields=[TextField(label="Name")])
+    app_state._save_forms(form)
+
+    async def edit():
+        editor._set_form(app_state.get_form(form.id))
+        editor.select_field(form.fields[0].id)
+        for label in ("N", "Na", "Nam", "Name?"):
+            await editor.update_field_property("label", label)
+            await editor._flush_form_save()
+            app_state.get_form(form.id)
+        await editor.update_form_property("title", "Survey 2")
+        await editor._flush_form_save()
+
+    hits = repository.parse_cache.hits
+    asyncio.run(edit())
+
+    assert repository.parse_cache.parses == 0
+    assert repository.parse_cache.hits > hits
+    saved = app_state.get_form(form.id)
+    assert (saved.title, saved.fields[0].label) == ("Survey 2", "Name?")
+    assert repository.parse_cache.parses == 0
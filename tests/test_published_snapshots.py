@@ -0,0 +1,49 @@
+import sqlite3
+import time
+
+from app.models import Form, TextField
+from app.services.form_repository import SQLiteFormRepository
+
+
+def test_drafts_are_not_served_until_published(tmp_path):
+    repository = SQLiteFormRepository(str(tmp_path / "forms.db"))
+    form = Form(title="Survey", fields=[TextField(label="Name")])
+    repository.save(form, "owner")
+    assert repository.get_snapshot(form.id) is None
+
+    assert repository.publish(form.id, "owner") == 1
+    snapshot = repository.get_snapshot(form.id)
+    assert snapshot.view.title == "Survey"
+    # Later visitors share the snapshot built for the first.
+    assert repository.get_snapshot(form.id) is snapshot
+    assert repository.snapshots.stats()["builds"] == 1
+    repository.pool.close()
+
+
+def test_forms_saved_before_publishing_existed_stay_public(tmp_path):
+    path = str(tmp_path / "forms.db")
+    form = Form(title="Old survey", fields=[TextField(label="Name")])
+    with sqlite3.connect(path) as conn:
+        conn.execute(
+            """
+            CREATE TABLE forms (
+                id TEXT PRIMARY KEY,
+                owner_id TEXT NOT NULL,
+                data TEXT NOT NULL,
+                revision INTEGER NOT NULL DEFAULT 1,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        conn.execute(
+            "INSERT INTO forms VALUES (?, 'owner', ?, 3, ?, ?)",
+            (form.id, form.model_dump_json(), time.time(), time.time()),
+        )
+    conn.close()
+
+    repository = SQLiteFormRepository(path)
+    snapshot = repository.get_snapshot(form.id)
+    assert snapshot.key == (form.id, 3)
+    assert snapshot.view.title == "Old survey"
+    repository.pool.close()
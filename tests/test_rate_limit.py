@@ -0,0 +1,60 @@
+import random
+import tracemalloc
+
+from app.services.rate_limit import (
+    BURST_SECONDS,
+    DEFAULT_CLIENT_PER_MINUTE,
+    DEFAULT_FORM_PER_MINUTE,
+    ConcurrencyLimiter,
+    SubmissionLimiter,
+)
+
+RATE = 10_000
+SECONDS = 3
+FORMS = 5
+MAX_KEYS = 5_000
+
+
+def test_bot_burst_keeps_memory_bounded():
+    """Replay a 10k req/s burst on a simulated clock, mostly from new clients."""
+    rng = random.Random(0)
+    limiter = SubmissionLimiter(max_keys=MAX_KEYS)
+    form_ids = [f"form-{i}" for i in range(FORMS)]
+    heavy_clients = [f"10.0.0.{i}" for i in range(10)]
+    peak_keys = 0
+
+    tracemalloc.start()
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        for i in range(RATE * SECONDS):
+            # Rotating addresses, plus a few clients hammering the same forms.
+            client_id = rng.choice(heavy_clients) if rng.random() < 0.1 else f"bot-{i}"
+            limiter.allow(rng.choice(form_ids), client_id, now=i / RATE)
+            peak_keys = max(peak_keys, len(limiter.clients), len(limiter.forms))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    stats = limiter.stats()
+    assert peak_keys <= MAX_KEYS
+    assert stats["client_evicted"] > 0
+    assert (peak - baseline) / 2**20 < 4
+    form_budget = DEFAULT_FORM_PER_MINUTE / 60 * (SECONDS + BURST_SECONDS)
+    assert stats["form_allowed"] <= FORMS * (form_budget + 1)
+
+
+def test_a_client_cannot_spend_the_forms_budget():
+    limiter = SubmissionLimiter()
+    burst = max(3, DEFAULT_CLIENT_PER_MINUTE / 60 * BURST_SECONDS)
+    allowed = sum(limiter.allow("form", "noisy", now=0.0) for _ in range(100))
+    assert allowed == int(burst)
+    assert limiter.allow("form", "quiet", now=0.0)
+
+
+def test_concurrency_limiter_sheds_past_the_cap():
+    limiter = ConcurrencyLimiter(max_in_flight=2)
+    assert limiter.acquire() and limiter.acquire()
+    assert not limiter.acquire()
+    limiter.release()
+    assert limiter.acquire()
+    assert limiter.stats() == {"in_flight": 2, "shed": 1}
@@ -0,0 +1,54 @@
+import time
+
+from app.models import Form, SelectField, TextField
+from app.services.search_index import FormSearchIndex
+
+
+def test_ranks_by_summed_best_level_per_term():
+    forms = [
+        Form(title="Customer survey", fields=[TextField(label="Feedback")]),
+        Form(title="Feedback", description="customer notes"),
+        Form(title="Event signup", fields=[TextField(label="Customer name")]),
+    ]
+    index = FormSearchIndex()
+
+    results = index.search("owner", "customer", lambda owner: forms)
+    assert results == [forms[0].id, forms[2].id, forms[1].id]
+    # Both terms must match. Title and label (8 + 3) beat description and
+    # title (2 + 8).
+    results = index.search("owner", "custom feed", lambda owner: forms)
+    assert results == [forms[0].id, forms[1].id]
+
+
+def test_many_term_queries_stay_fast():
+    letters = "abcdefghijk"
+    forms = [
+        Form(
+            title=" ".join(letters[(i + j) % len(letters)] for j in range(4)),
+            description=" ".join(letters),
+            fields=[SelectField(label=letters[i % len(letters)])],
+        )
+        for i in range(300)
+    ]
+    index = FormSearchIndex()
+    index.search("owner", "a", lambda owner: forms)
+
+    started_at = time.perf_counter()
+    results = index.search("owner", " ".join(letters), lambda owner: forms)
+    assert time.perf_counter() - started_at < 0.5
+    assert len(results) == 48
+
+
+def test_writes_during_a_build_are_kept():
+    stale = Form(title="Old title")
+    deleted = Form(title="Old form")
+    index = FormSearchIndex()
+
+    def load_forms(owner_id: str) -> list[Form]:
+        # Writes land while the owner's forms are being read from storage.
+        index.index(stale.model_copy(update={"title": "New title"}), owner_id)
+        index.remove(deleted.id)
+        return [stale, deleted]
+
+    assert index.search("owner", "new", load_forms) == [stale.id]
+    assert index.search("owner", "old", load_forms) == []
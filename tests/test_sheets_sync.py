@@ -0,0 +1,107 @@
+import pytest
+
+from app.models import Form, Submission, TextField
+from app.services.export_sinks import (
+    SUBMISSION_ID_COLUMN,
+    SUBMITTED_AT_COLUMN,
+    ExportMetrics,
+)
+from app.services.sheets_sync import SheetsSyncSink
+
+
+class FakeWorksheet:
+    """Records the calls gspread would make, failing `append_rows` on demand."""
+
+    def __init__(self):
+        self.header: list[str] = []
+        self.rows: list[list[str]] = []
+        self.append_calls = 0
+        self.header_reads = 0
+        self.header_writes = 0
+        self.failing = False
+
+    def row_values(self, row: int) -> list[str]:
+        self.header_reads += 1
+        return list(self.header)
+
+    def update(self, values: list[list[str]], range_name: str):
+        self.header_writes += 1
+        self.header = list(values[0])
+
+    def append_rows(self, rows: list[list[str]], value_input_option: str):
+        self.append_calls += 1
+        if self.failing:
+            raise ConnectionError("Sheets is unreachable")
+        self.rows.extend(rows)
+
+
+@pytest.fixture
+def worksheet():
+    return FakeWorksheet()
+
+
+def make_sink(worksheet: FakeWorksheet, **kwargs) -> SheetsSyncSink:
+    return SheetsSyncSink(
+        lambda form: worksheet, flush_interval=3600, metrics=ExportMetrics(), **kwargs
+    )
+
+
+def submit(sink: SheetsSyncSink, form: Form, count: int, start: int = 0):
+    for number in range(start, start + count):
+        sink.add(
+            form,
+            Submission(form_id=form.id, data={form.fields[0].id: f"answer {number}"}),
+        )
+
+
+def test_flush_appends_buffered_rows_in_one_call(worksheet):
+    form = Form(fields=[TextField(label="Name")])
+    sink = make_sink(worksheet)
+    submit(sink, form, 25)
+    sink.flush()
+
+    assert worksheet.append_calls == 1
+    assert len(worksheet.rows) == 25
+    assert worksheet.header == [SUBMISSION_ID_COLUMN, SUBMITTED_AT_COLUMN, "Name"]
+    assert worksheet.rows[-1][2] == "answer 24"
+    assert sink.metrics.batches_sent == 1
+    assert sink.metrics.records_exported == 25
+
+
+def test_headers_are_reconciled_once_per_layout(worksheet):
+    form = Form(fields=[TextField(label="Name")])
+    sink = make_sink(worksheet)
+    for batch in range(3):
+        submit(sink, form, 5, start=batch * 5)
+        sink.flush()
+    assert (worksheet.header_reads, worksheet.header_writes) == (1, 1)
+
+    form.add_field(TextField(label="Email"))
+    submit(sink, form, 5)
+    sink.flush()
+    assert (worksheet.header_reads, worksheet.header_writes) == (2, 2)
+    assert worksheet.header[-1] == "Email"
+    assert worksheet.append_calls == 4
+
+
+def test_failed_flush_requeues_rows_up_to_the_cap(worksheet):
+    form = Form(fields=[TextField(label="Name")])
+    sink = make_sink(worksheet, max_buffered=30)
+    worksheet.failing = True
+    submit(sink, form, 20)
+    sink.flush()
+    submit(sink, form, 20, start=20)
+    sink.flush()
+
+    assert worksheet.append_calls == 2
+    assert sink.metrics.retries == 2
+    assert sink.metrics.records_dropped == 10
+
+    worksheet.failing = False
+    sink.flush()
+    # The oldest rows were dropped; the newest 30 are written in one call.
+    assert worksheet.append_calls == 3
+    assert [row[2] for row in worksheet.rows] == [
+        f"answer {number}" for number in range(10, 40)
+    ]
+    assert sink.metrics.records_exported == 30
@@ -0,0 +1,35 @@
+from app.models import EmailField, Form, TextField
+from app.services.validation import MAX_VALUE_LENGTH, CompiledValidator
+
+
+def make_validator() -> tuple[Form, CompiledValidator]:
+    form = Form(
+        fields=[TextField(label="Name", required=True), EmailField(label="Email")]
+    )
+    return form, CompiledValidator(form)
+
+
+def test_whitespace_does_not_satisfy_a_required_field():
+    form, validator = make_validator()
+    name = form.fields[0].id
+    assert validator.validate({name: "   "}) == {name: "Name is required."}
+    assert validator.validate(validator.clean({name: "   "})) == {
+        name: "Name is required."
+    }
+
+
+def test_clean_keeps_only_the_forms_fields():
+    form, validator = make_validator()
+    name, email = (field.id for field in form.fields)
+    cleaned = validator.clean(
+        {name: "  Ada ", email: "", "is_admin": "yes", "__proto__": {"x": 1}}
+    )
+    assert cleaned == {name: "Ada"}
+
+
+def test_overlong_answers_are_rejected():
+    form, validator = make_validator()
+    name = form.fields[0].id
+    errors = validator.validate({name: "x" * (MAX_VALUE_LENGTH + 1)})
+    assert list(errors) == [name]
+    assert validator.validate({name: "x" * MAX_VALUE_LENGTH}) == {}